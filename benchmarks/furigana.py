@@ -0,0 +1,55 @@
+"""Benchmark of the furigana tokenizer against the regular expressions it replaced
+
+Classifying a note used to run the furigana regular expressions three times over the
+reading (remove and promote for the verb, promote again for the adjective). The
+tokenizer parses the reading once and both texts are then read off the result. Run with
+
+    python -m benchmarks.furigana
+"""
+import random
+import re
+import timeit
+
+from japanese_conjugation.util import FuriganaSegments
+
+CORPUS_SIZE = 100_000
+WORDS = ["食[た]べる", "持[も]って 来[く]る", "勉強[べんきょう]する", "お 久[ひさ]し 振[ぶ]りです",
+         "いる", "差[さ]し 迫[せま]る", "きれい", "発[はつ] 音[おん]する", "引[ひ]き 千切[ちぎ]る"]
+
+def legacy_remove_furigana(reading: str) -> str:
+    """util.remove_furigana as implemented before the tokenizer"""
+    return re.sub(r"(^| )(\S+)(\[[^\]]+\])", r"\2", reading, flags=re.UNICODE)
+
+def legacy_promote_furigana(reading: str) -> str:
+    """util.promote_furigana as implemented before the tokenizer"""
+    return re.sub(r"(^| )(\S+)\[([^\]]+)\]", r"\3", reading, flags=re.UNICODE)
+
+def build_corpus(size: int = CORPUS_SIZE, seed: int = 0):
+    """Build a synthetic corpus of distinct readings"""
+    rng = random.Random(seed)
+    return [f"{rng.choice(WORDS)}{index}" for index in range(size)]
+
+def legacy_classify(corpus):
+    """Derive the texts the classifiers need with the regular expressions"""
+    for reading in corpus:
+        legacy_remove_furigana(reading)
+        legacy_promote_furigana(reading)
+        legacy_promote_furigana(reading)
+
+def tokenized_classify(corpus):
+    """Derive the texts the classifiers need with a single parse per reading"""
+    for reading in corpus:
+        segments = FuriganaSegments(reading)
+        _ = segments.base, segments.kana, segments.kana
+
+def main():
+    """Time both implementations and report the speedup"""
+    corpus = build_corpus()
+    legacy = min(timeit.repeat(lambda: legacy_classify(corpus), number=1, repeat=5))
+    tokenized = min(timeit.repeat(lambda: tokenized_classify(corpus), number=1, repeat=5))
+    print(f"{len(corpus)} readings")
+    print(f"regular expressions: {legacy:.3f}s")
+    print(f"tokenizer:           {tokenized:.3f}s ({legacy / tokenized:.1f}x)")
+
+if __name__ == '__main__':
+    main()
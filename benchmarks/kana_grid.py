@@ -0,0 +1,85 @@
+"""Microbenchmark of the kana grid behind Gyo.identify and Gyo.dan
+
+Compares the table lookups against the if/elif chain and getattr they replaced by
+computing the あ/い/え/お-column stems of a synthetic 100k-verb corpus. Run with
+
+    python -m benchmarks.kana_grid
+"""
+import random
+import timeit
+
+from japanese_conjugation.enums import (
+    AGyo, BaGyo, Dan, DaGyo, GaGyo, Gyo, HaGyo, KaGyo, MaGyo, NaGyo, PaGyo, RaGyo,
+    SaGyo, TaGyo, ZaGyo
+)
+
+CORPUS_SIZE = 100_000
+GODAN_ENDINGS = "うくぐすつぬぶむる"
+STEMS = ["買", "書", "泳", "話", "待", "死", "遊", "読", "帰", "持[も]って 行"]
+
+def legacy_identify(input_str: str): # pylint: disable=R0911,R0912
+    """Gyo.identify as implemented before the kana grid"""
+    if len(input_str) != 1:
+        raise ValueError("Gyo.identify() input must be a single character")
+    if input_str in "あいうえお":
+        return AGyo
+    if input_str in "かきくけこ":
+        return KaGyo
+    if input_str in "がぎぐげご":
+        return GaGyo
+    if input_str in "さしすせそ":
+        return SaGyo
+    if input_str in "ざじずぜぞ":
+        return ZaGyo
+    if input_str in "たちつてと":
+        return TaGyo
+    if input_str in "だぢづでど":
+        return DaGyo
+    if input_str in "なにぬねの":
+        return NaGyo
+    if input_str in "はひふへほ":
+        return HaGyo
+    if input_str in "ばびぶべぼ":
+        return BaGyo
+    if input_str in "ぱぴぷぺぽ":
+        return PaGyo
+    if input_str in "まみむめも":
+        return MaGyo
+    if input_str in "らりるれろ":
+        return RaGyo
+    return None
+
+def legacy_dan(gyo, target: Dan) -> str:
+    """Gyo.dan as implemented before the kana grid"""
+    return getattr(gyo, target.name).value
+
+def build_corpus(size: int = CORPUS_SIZE, seed: int = 0):
+    """Build a synthetic corpus of godan verbs"""
+    rng = random.Random(seed)
+    return [rng.choice(STEMS) + rng.choice(GODAN_ENDINGS) for _ in range(size)]
+
+def legacy_stems(corpus):
+    """Compute the stems of every verb in the corpus with the replaced implementation"""
+    for verb in corpus:
+        gyo = legacy_identify(verb[-1])
+        for target in (Dan.A, Dan.I, Dan.E, Dan.O):
+            legacy_dan(gyo, target)
+
+def grid_stems(corpus):
+    """Compute the stems of every verb in the corpus with the kana grid"""
+    for verb in corpus:
+        gyo = Gyo.identify(verb[-1])
+        for target in (Dan.A, Dan.I, Dan.E, Dan.O):
+            gyo.dan(target)
+
+def main():
+    """Time both implementations and report the speedup"""
+    corpus = build_corpus()
+    legacy = min(timeit.repeat(lambda: legacy_stems(corpus), number=1, repeat=5))
+    grid = min(timeit.repeat(lambda: grid_stems(corpus), number=1, repeat=5))
+    print(f"{len(corpus)} verbs")
+    print(f"if/elif + getattr: {legacy:.3f}s")
+    print(f"kana grid:         {grid:.3f}s ({legacy / grid:.1f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,38 @@
 """Addon for creating notes focused on Japanese conjugation"""
 # pylint: skip-file
+import threading
+import time
+from functools import partial
 from typing import List
 # import the main window object (mw) from aqt
 from aqt import mw # pylint: disable=E0401
 from aqt.forms.taglimit import Ui_Dialog # pylint: disable=E0401
-from aqt.utils import showInfo, Qt, disable_help_button, restoreGeom, saveGeom, showWarning, tr # pylint: disable=E0401
+from aqt.utils import askUser, showInfo, Qt, disable_help_button, restoreGeom, saveGeom, showWarning, tr # pylint: disable=E0401
 from aqt.filtered_deck import FilteredDeckConfigDialog # pylint: disable=E0401
+from aqt.operations import CollectionOp, QueryOp # pylint: disable=E0401
 from aqt.qt import ( # pylint: disable=E0401
     QMenu, QItemSelectionModel, QDialog, QVBoxLayout, QLabel,
     QWidget, QListWidget, QListWidgetItem, QDialogButtonBox,
-    QShortcut, qconnect, QKeySequence
+    QShortcut, qconnect, QKeySequence, QTimer
 )
 
 from anki.decks import DeckManager
 from anki.tags import TagManager
 # from anki.scheduler.base import CustomStudyDefaults
 from anki.buildinfo import version as anki_version
+from anki.collection import OpChanges
 
 from .version import __version__ as anki_jpn_version
 from .models import (
     add_or_update_verb_model, add_or_update_adjective_model
 )
 from .enums import VerbClass, AdjectiveClass
-from .decks import DeckUpdater, DeckSearcher
+from .decks import DeckUpdater, DeckSearcher, VERB_CLASSES, ADJECTIVE_CLASSES
 from .config import ConfigManager
 
 anki_version_info = tuple(int(x) for x in anki_version.split('.'))
+# Number of conjugation notes written to the collection at a time
+WRITE_BATCH_SIZE = 500
 config = ConfigManager(mw.addonManager.getConfig(__name__))
 
 
@@ -129,6 +136,149 @@ def get_relevant_model_fields(model_name):
     return field_names[expression_index], field_names[meaning_index], field_names[reading_index]
 
 
+def reconcile_orphans(deck_updater, deck_searcher, source_deck_id, note_ids):
+    action = config.orphan_action()
+    if action == 'keep':
+        return ""
+    if deck_searcher.incremental:
+        return "\nOrphaned notes are only found when the source deck is not incremental"
+    found = [nid for nid_list in note_ids.values() for nid in nid_list]
+    orphans = deck_updater.reconcile(source_deck_id, found, delete=action == 'delete',
+                                     dry_run=action == 'report')
+    verb = {'report': "Found", 'tag': "Tagged", 'delete': "Deleted"}[action]
+    return f"\n{verb} {len(orphans)} orphaned note(s)"
+
+def save_checkpoint(source_deck_name, model_name, checkpoint):
+    config.set_checkpoint(source_deck_name, model_name, checkpoint)
+    mw.addonManager.writeConfig(__name__, config.dump())
+
+def resume_update(deck_updater, source_deck_name, model_name):
+    checkpoint = config.get_checkpoint(source_deck_name, model_name)
+    if checkpoint is not None and askUser(
+            f"The last update from {source_deck_name} did not finish. "
+            "Would you like to pick up where it left off?"):
+        deck_updater.resume(checkpoint)
+
+class UpdateCancelled(Exception):
+    """The user asked for an update to stop"""
+
+class UpdateResult:
+    """Outcome of an update, with the changes for Anki to refresh its windows with"""
+
+    def __init__(self, message, finished=False):
+        self.message = message
+        self.finished = finished
+        self.changes = OpChanges(card=True, note=True, tag=True, browser_table=True,
+                                 note_text=True, study_queues=True)
+
+def progress_label(done, total, started, start_done):
+    label = f"Updated {done} of {total} note(s)"
+    elapsed = time.monotonic() - started
+    if done > start_done and elapsed > 0:
+        remaining = elapsed / (done - start_done) * (total - done)
+        if remaining >= 60:
+            label += f"\nAbout {round(remaining / 60)} minute(s) left"
+        else:
+            label += f"\nAbout {round(remaining)} second(s) left"
+    return label
+
+def search_notes(target_deck_id, source_deck_id, source_deck_name, dest_model, word_types):
+    """Search the source deck in the background, then start updating the target deck"""
+    deck_searcher = DeckSearcher(mw.col, source_deck_id, config, target_deck_id=target_deck_id)
+
+    def on_found(result):
+        note_ids, relevant_models = result
+        start_update(target_deck_id, source_deck_id, source_deck_name, dest_model,
+                     deck_searcher, note_ids, relevant_models)
+
+    QueryOp(parent=mw,
+            op=lambda col: deck_searcher.find_words(word_types, dest_model['name']),
+            success=on_found).with_progress("Searching for notes...").run_in_background()
+
+def start_update(target_deck_id, source_deck_id, source_deck_name, dest_model,
+                 deck_searcher, note_ids, relevant_models):
+    """Ask about anything still needed, then conjugate and write the notes in the
+    background"""
+    for model_name in relevant_models:
+        if config.model_fields_empty(model_name):
+            relevant_fields = get_relevant_model_fields(model_name)
+            if any(not f for f in relevant_fields):
+                showInfo("Expression, meaning, and reading fields " \
+                         + "must be specified for all relevant note types")
+            config.add_model_fields(model_name, *relevant_fields)
+
+    mw.addonManager.writeConfig(__name__, config.dump())
+
+    def on_checkpoint(checkpoint):
+        # Called from the background thread, while the config belongs to the main thread
+        mw.taskman.run_on_main(
+            partial(save_checkpoint, source_deck_name, dest_model['name'], checkpoint))
+
+    deck_updater = DeckUpdater(mw.col, target_deck_id, dest_model, config,
+                               batch_size=WRITE_BATCH_SIZE, on_checkpoint=on_checkpoint)
+    resume_update(deck_updater, source_deck_name, dest_model['name'])
+
+    total = sum(len(nids) for nids in note_ids.values())
+    started = time.monotonic()
+    start_done = sum(deck_updater.summary())
+
+    # The progress dialog may only be asked about on the main thread
+    cancelled = threading.Event()
+
+    def check_cancel():
+        if mw.progress.want_cancel():
+            cancelled.set()
+
+    # Anki's own timers hold off while the progress dialog is shown
+    cancel_timer = QTimer(mw)
+    qconnect(cancel_timer.timeout, check_cancel)
+    cancel_timer.start(100)
+
+    def on_progress():
+        # Called between chunks of notes, from the background thread
+        done = sum(deck_updater.summary())
+        label = progress_label(done, total, started, start_done)
+        mw.taskman.run_on_main(
+            lambda: mw.progress.update(label=label, value=done, max=total))
+        if cancelled.is_set():
+            raise UpdateCancelled()
+
+    def update(col):
+        try:
+            return write_notes()
+        finally:
+            mw.taskman.run_on_main(cancel_timer.deleteLater)
+
+    def write_notes():
+        try:
+            deck_updater.add_words(note_ids, on_progress=on_progress)
+        except UpdateCancelled:
+            # Keep what was done so far, so that the update can be picked up later
+            deck_updater.flush()
+            new_notes, modified_notes, _, _ = deck_updater.summary()
+            return UpdateResult(f"Update cancelled after adding {new_notes} new note(s) "
+                                f"and modifying {modified_notes} note(s).\n"
+                                "The next update can pick up where it left off.")
+        deck_updater.flush()
+        orphan_message = reconcile_orphans(deck_updater, deck_searcher, source_deck_id,
+                                           note_ids)
+
+        new_notes, modified_notes, failed_notes, unchanged_notes = deck_updater.summary()
+        return UpdateResult(f"Added {new_notes} new note(s)\nModified {modified_notes} "
+                            + f"note(s)\nLeft {unchanged_notes} note(s) unchanged"
+                            + f"\nFailed to conjugate {failed_notes} note(s)" + orphan_message,
+                            finished=True)
+
+    def on_success(result):
+        if result.finished:
+            # Nothing is left to resume, and the next search can start from here
+            config.set_checkpoint(source_deck_name, dest_model['name'], None)
+            deck_searcher.record_watermark(dest_model['name'])
+            mw.addonManager.writeConfig(__name__, config.dump())
+        showInfo(result.message)
+
+    CollectionOp(parent=mw, op=update).success(on_success).run_in_background()
+
 def update_adjectives():
     target_deck_id, _ = select_deck("Which deck would you like to update?")
     if target_deck_id is None:
@@ -157,29 +307,8 @@ def update_adjectives():
     add_or_update_adjective_model(mw.col.models, adj_model_name, config.get_colors())
     mw.col.fix_integrity()
     dest_model = mw.col.models.by_name(adj_model_name)
-    deck_updater = DeckUpdater(mw.col, target_deck_id, dest_model, config)
-
-    deck_searcher = DeckSearcher(mw.col, source_deck_id, config)
-    note_ids, relevant_models = deck_searcher.find_adjectives(dest_model['name'])
-
-    for model_name in relevant_models:
-        if config.model_fields_empty(model_name):
-            relevant_fields = get_relevant_model_fields(model_name)
-            if any(not f for f in relevant_fields):
-                showInfo("Expression, meaning, and reading fields " \
-                         + "must be specified for all relevant note types")
-            config.add_model_fields(model_name, *relevant_fields)
-
-    mw.addonManager.writeConfig(__name__, config.dump())
-
-    for adj_type, note_id_list in note_ids.items():
-        for note_id in note_id_list:
-            note = mw.col.get_note(note_id)
-            deck_updater.add_note_to_deck(note, adj_type)
-
-    new_notes, modified_notes, failed_notes = deck_updater.summary()
-    showInfo(f"Added {new_notes} new note(s)\nModified {modified_notes} "
-             + f"note(s)\nFailed to conjugate {failed_notes} note(s)")
+    search_notes(target_deck_id, source_deck_id, source_deck_name, dest_model,
+                 ADJECTIVE_CLASSES)
 
 def update_verbs():
     target_deck_id, _ = select_deck("Which deck would you like to update?")
@@ -211,29 +340,7 @@ def update_verbs():
     add_or_update_verb_model(mw.col.models, verb_model_name, config.get_colors())
     mw.col.fix_integrity()
     dest_model = mw.col.models.by_name(verb_model_name)
-    deck_updater = DeckUpdater(mw.col, target_deck_id, dest_model, config)
-
-    deck_searcher = DeckSearcher(mw.col, source_deck_id, config)
-    note_ids, relevant_models = deck_searcher.find_verbs(dest_model['name'])
-
-    for model_name in relevant_models:
-        if config.model_fields_empty(model_name):
-            relevant_fields = get_relevant_model_fields(model_name)
-            if any(not f for f in relevant_fields):
-                showInfo("Expression, meaning, and reading fields must " \
-                         + "be specified for all relevant note types")
-            config.add_model_fields(model_name, *relevant_fields)
-
-    mw.addonManager.writeConfig(__name__, config.dump())
-
-    for verb_type, note_id_list in note_ids.items():
-        for note_id in note_id_list:
-            note = mw.col.get_note(note_id)
-            deck_updater.add_note_to_deck(note, verb_type)
-
-    new_notes, modified_notes, failed_notes = deck_updater.summary()
-    showInfo(f"Added {new_notes} new note(s)\nModified {modified_notes} " \
-             + f"note(s)\nFailed to conjugate {failed_notes} note(s)")
+    search_notes(target_deck_id, source_deck_id, source_deck_name, dest_model, VERB_CLASSES)
 
 def create_filtered_deck():
 
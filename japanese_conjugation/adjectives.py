@@ -1,9 +1,12 @@
 """Methods pertaining to the conjugation of adjectives
 """
-from typing import List, Tuple, Optional
+from typing import List, Sequence, Tuple, Optional
 from .enums import AdjectiveClass, Form, Formality
 from .util import (
-    promote_furigana
+    ConjugationError,
+    parse_furigana,
+    batch_map,
+    digest
 )
 
 def generate_adjective_forms(dictionary_form: str, adjective_class: AdjectiveClass)\
@@ -22,6 +25,11 @@ def generate_adjective_forms(dictionary_form: str, adjective_class: AdjectiveCla
     List of tuples
         Each tuple is the conjugation (string), Form, and Formality. Note that for the Te form,
         the formality will be provided as None
+
+    Raises
+    ------
+    ConjugationError
+        If a form which applies to the adjective could not be produced
     """
 
     if adjective_class == AdjectiveClass.GENERAL:
@@ -30,32 +38,60 @@ def generate_adjective_forms(dictionary_form: str, adjective_class: AdjectiveCla
     if adjective_class == AdjectiveClass.NA and not dictionary_form.endswith("な"):
         dictionary_form = dictionary_form + "な"
 
-    # pylint: disable=R0801
     results = []
-    all_forms = [
-        [polite_nonpast_positive, Form.NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative, Form.NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive, Form.PAST, Formality.POLITE],
-        [polite_past_negative, Form.PAST_NEG, Formality.POLITE],
-
-        # Plain forms
-        [plain_nonpast_positive, Form.NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative, Form.NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive, Form.PAST, Formality.PLAIN],
-        [plain_past_negative, Form.PAST_NEG, Formality.PLAIN],
-
-        # formality-constant
-        [te, Form.TE, None]
-    ]
-
-    for conjugate, form, formality in all_forms:
+    for conjugate, form, formality in ADJECTIVE_FORM_MASKS[adjective_class]:
         try:
-            results.append([conjugate(dictionary_form, adjective_class), form, formality])
-        except: # pylint: disable=W0702
-            pass
+            conjugation = conjugate(dictionary_form, adjective_class)
+        except Exception as err:
+            raise ConjugationError(dictionary_form, form, formality) from err
+        results.append([conjugation, form, formality])
 
     return results
 
+def adjective_rules_version(dictionary_form: str, adjective_class: AdjectiveClass) -> str:
+    """Identify the version of the rules used to conjugate an adjective
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the adjective to be conjugated
+    adjective_class : AdjectiveClass
+        Class of adjective to guide how conjugation should be performed
+
+    Returns
+    -------
+    str
+        Version which changes whenever the output of `generate_adjective_forms` for the
+        adjective would change, including when a general adjective would be classified
+        differently
+    """
+    if adjective_class == AdjectiveClass.GENERAL:
+        adjective_class = classify_adjective(dictionary_form)
+    return f'{adjective_class.value}-{ADJECTIVE_RULES_VERSIONS[adjective_class]}'
+
+def generate_adjective_forms_batch(
+        readings_with_classes: Sequence[Tuple[str, AdjectiveClass]],
+        workers: Optional[int] = 1, chunk_size: Optional[int] = None)\
+              -> List[List[Tuple[str, Form, Optional[Formality]]]]:
+    """Generate the known conjugations for many adjectives, optionally across worker processes
+
+    Parameters
+    ----------
+    readings_with_classes : Sequence[Tuple[str, AdjectiveClass]]
+        Dictionary form and adjective class of each adjective to be conjugated
+    workers : Optional[int]
+        Number of worker processes to use. None uses every available CPU.
+    chunk_size : Optional[int]
+        Number of adjectives to send to a worker process at a time. By default this is
+        sized to amortize the cost of pickling.
+
+    Returns
+    -------
+    List[List[Tuple[str, Form, Optional[Formality]]]]
+        The output of `generate_adjective_forms` for each adjective, in input order
+    """
+    return batch_map(generate_adjective_forms, readings_with_classes, workers, chunk_size)
+
 def classify_adjective(dictionary_form: str) -> AdjectiveClass:
     """Classify an adjective as either an i-adjective or na-adjective
 
@@ -69,7 +105,7 @@ def classify_adjective(dictionary_form: str) -> AdjectiveClass:
     AdjectiveClass
         Returns the adjective classification"""
 
-    kana_only = promote_furigana(dictionary_form)
+    kana_only = parse_furigana(dictionary_form).kana
     if dictionary_form.endswith('い') and kana_only not in ['きれい', 'きらい', 'さいわい']:
         return AdjectiveClass.I
 
@@ -301,3 +337,35 @@ def plain_past_negative(dictionary_form: str, adj_class: AdjectiveClass) -> str:
         ending = 'くなかった'
     completion = stem + ending
     return completion
+
+# pylint: disable=R0801
+ADJECTIVE_FORMS = [
+    [polite_nonpast_positive, Form.NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative, Form.NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive, Form.PAST, Formality.POLITE],
+    [polite_past_negative, Form.PAST_NEG, Formality.POLITE],
+
+    # Plain forms
+    [plain_nonpast_positive, Form.NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative, Form.NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive, Form.PAST, Formality.PLAIN],
+    [plain_past_negative, Form.PAST_NEG, Formality.PLAIN],
+
+    # formality-constant
+    [te, Form.TE, None]
+]
+
+# Forms which apply to each (resolved) class of adjective. Every form applies to both
+# i-adjectives and na-adjectives.
+ADJECTIVE_FORM_MASKS = {
+    AdjectiveClass.I: ADJECTIVE_FORMS,
+    AdjectiveClass.NA: ADJECTIVE_FORMS,
+}
+
+# Version of the rules for each (resolved) class of adjective, taken from the conjugations
+# of placeholder adjectives covering each stem which `get_stem` distinguishes
+ADJECTIVE_RULES_VERSIONS = {
+    AdjectiveClass.I: digest(generate_adjective_forms('〇い', AdjectiveClass.I),
+                             generate_adjective_forms('〇いい', AdjectiveClass.I)),
+    AdjectiveClass.NA: digest(generate_adjective_forms('〇な', AdjectiveClass.NA)),
+}
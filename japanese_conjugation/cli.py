@@ -5,31 +5,238 @@ import shutil
 import tempfile
 import zipfile
 import argparse
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import anki.collection
 import anki.exporting
 
 from .config import ConfigManager
-from .decks import DeckSearcher, DeckUpdater
+from .decks import (
+    DeckSearcher, DeckUpdater, VERB_CLASSES, ADJECTIVE_CLASSES, save_collection
+)
+from .conjugator import Conjugator
+from .util import peak_memory
 from .models import (
     add_or_update_verb_model, add_or_update_adjective_model
 )
 
+# Default number of conjugation notes written to the collection at a time
+WRITE_BATCH_SIZE = 1000
+
+# Default number of source notes searched, conjugated, and written at a time when streaming
+STREAM_CHUNK_SIZE = 10000
+
+def save_config(config: ConfigManager, config_path: str) -> None:
+    """Write the settings back to the config file
+
+    Parameters
+    ----------
+    config : ConfigManager
+        Settings, including any watermarks and checkpoints
+    config_path : str
+        Path of the config file
+    """
+    with open(config_path, 'w') as handle: # pylint: disable=W1514
+        json.dump(config.dump(), handle, indent=4, ensure_ascii=False)
+
+def save_checkpoint(config: ConfigManager, config_path: str, deck_name: str, # pylint: disable=R0913,R0917
+                    model_name: str, checkpoint: Optional[Dict[str, Any]]) -> None:
+    """Record the progress of an update in the config file
+
+    Parameters
+    ----------
+    config : ConfigManager
+        Settings, to which the checkpoint is added
+    config_path : str
+        Path of the config file
+    deck_name : str
+        Name of the source deck
+    model_name : str
+        Name of the conjugation model of the target deck
+    checkpoint : Optional[Dict[str, Any]]
+        Progress of the update (see `DeckUpdater.checkpoint`), or None once it finished
+    """
+    config.set_checkpoint(deck_name, model_name, checkpoint)
+    save_config(config, config_path)
+
+def open_collection(args) -> Tuple[anki.collection.Collection, str, bool]:
+    """Unpack the input package and open its collection
+
+    Parameters
+    ----------
+    args
+        Command line arguments
+
+    Returns
+    -------
+    Tuple[anki.collection.Collection, str, bool]
+        The collection, the directory it was unpacked into, and whether it was unpacked
+        by an earlier run which is being resumed
+    """
+    work_dir = args.work_dir or tempfile.mkdtemp()
+    collection_file = os.path.join(work_dir, "collection.anki21")
+    resumed = args.resume and os.path.exists(collection_file)
+    if not resumed:
+        with zipfile.ZipFile(args.input, 'r') as zip_ref:
+            zip_ref.extractall(work_dir)
+    if not os.path.exists(os.path.join(work_dir, 'collection.media')):
+        os.makedirs(os.path.join(work_dir, 'collection.media'))
+
+    col = anki.collection.Collection(collection_file) # pylint: disable=E1101
+    col.media._dir = os.path.join(work_dir, 'collection.media') # pylint: disable=W0212
+    return col, work_dir, resumed
+
+def make_updater(col: anki.collection.Collection, deck_id: int, model: Dict[str, Any], # pylint: disable=R0913,R0917
+                 config: ConfigManager, conjugator: Conjugator, args, resumed: bool) \
+    -> DeckUpdater:
+    """Create the updater for a target deck, resuming an interrupted update if asked to
+
+    Parameters
+    ----------
+    col : anki.collection.Collection
+        Collection being updated
+    deck_id : int
+        ID of the target deck
+    model : Dict[str, Any]
+        Conjugation model of the target deck
+    config : ConfigManager
+        Settings, including the checkpoint of any interrupted update
+    conjugator : Conjugator
+        Conjugator shared between the updaters
+    args
+        Command line arguments
+    resumed : bool
+        Whether the collection was updated by an earlier run which is being resumed
+
+    Returns
+    -------
+    DeckUpdater
+        Updater for the target deck
+    """
+    on_checkpoint = None
+    if args.work_dir:
+        # The progress is only worth keeping if the collection is kept as well
+        on_checkpoint = partial(save_checkpoint, config, args.config, args.source_deck_name,
+                                model['name'])
+    updater = DeckUpdater(col, deck_id, model, config, conjugator, args.batch_size,
+                          undoable=not args.stream, on_checkpoint=on_checkpoint)
+    checkpoint = config.get_checkpoint(args.source_deck_name, model['name'])
+    if resumed and checkpoint is not None and updater.resume(checkpoint):
+        print(f"Resuming the update of the {model['name']} notes")
+    return updater
+
+def check_models(config: ConfigManager, model_names: List[str]) -> None:
+    """Make sure that the relevant fields are known for each of the source models
+
+    Parameters
+    ----------
+    config : ConfigManager
+        Settings, including the relevant fields of each source model
+    model_names : List[str]
+        Names of the source models
+
+    Raises
+    ------
+    ValueError
+        If the relevant fields are not specified for one of the models
+    """
+    for model_name in model_names:
+        if config.model_fields_empty(model_name):
+            raise ValueError(f"Please specify the relevant fields for the '{model_name}' "
+                             "note type")
+
+def update_words(col: anki.collection.Collection, # pylint: disable=R0913,R0917
+                 deck_searcher: DeckSearcher, updater: DeckUpdater, word_types: List[Any],
+                 conjugation_model_name: str, config: ConfigManager,
+                 args) -> Dict[Any, List[int]]:
+    """Search for, conjugate, and write the notes for some kinds of word
+
+    With --stream, the source notes are handled a chunk at a time, and each chunk is
+    written to the collection before the next one is read, so the memory used is
+    bounded by the chunk size rather than the size of the deck.
+
+    Parameters
+    ----------
+    col : anki.collection.Collection
+        Collection holding the source and target decks
+    deck_searcher : DeckSearcher
+        Searcher for the source deck
+    updater : DeckUpdater
+        Updater for the target deck
+    word_types : List[Any]
+        Kinds of word to be found
+    conjugation_model_name : str
+        Name of the model of the target deck
+    config : ConfigManager
+        Settings, including the relevant fields of each source model
+    args
+        Command line arguments
+
+    Returns
+    -------
+    Dict[Any, List[int]]
+        IDs of the source notes found for each kind of word. When streaming, these are
+        only kept if they are needed for reconciling orphaned notes.
+    """
+    if not args.stream:
+        note_ids, relevant_models = deck_searcher.find_words(word_types,
+                                                             conjugation_model_name)
+        check_models(config, relevant_models)
+        updater.add_words(note_ids, args.workers)
+        updater.flush()
+        return note_ids
+
+    found = {}
+    for note_ids, relevant_models in deck_searcher.iter_words(
+            word_types, conjugation_model_name, args.chunk_size):
+        check_models(config, relevant_models)
+        updater.add_words(note_ids, args.workers)
+        updater.flush()
+        save_collection(col)
+        if args.orphans != 'keep':
+            for word_type, nids in note_ids.items():
+                found.setdefault(word_type, []).extend(nids)
+    return found
+
+def reconcile_orphans(deck_searcher: DeckSearcher, source_deck_id: int,
+                      updates: List[Tuple[str, DeckUpdater, Dict[Any, List[int]]]],
+                      action: str) -> None:
+    """Report, tag, or delete the conjugation notes whose source note is no longer found
+
+    Parameters
+    ----------
+    deck_searcher : DeckSearcher
+        Searcher which found the source notes
+    source_deck_id : int
+        ID of the source deck
+    updates : List[Tuple[str, DeckUpdater, Dict[Any, List[int]]]]
+        Name of each target deck, its updater, and the source notes found for it by kind
+        of word
+    action : str
+        One of 'report', 'tag', or 'delete'
+    """
+    if deck_searcher.incremental:
+        print("Skipping orphaned notes since only edited source notes were searched. "
+              "Use --full-rescan to find them.")
+        return
+
+    for deck_name, updater, note_ids in updates:
+        found = [nid for nid_list in note_ids.values() for nid in nid_list]
+        orphans = updater.reconcile(source_deck_id, found, delete=action == 'delete',
+                                    dry_run=action == 'report')
+        verb = {'report': "Found", 'tag': "Tagged", 'delete': "Deleted"}[action]
+        print(f"{verb} {len(orphans)} orphaned note(s) in {deck_name}")
+
 def main(args): # pylint: disable=R0914
     """Main function for generating verb and adjective conjugation decks"""
 
     with open(args.config, 'r') as handle: # pylint: disable=W1514
         config = ConfigManager(json.load(handle))
 
-    temp_dir_name = tempfile.mkdtemp()
-    with zipfile.ZipFile(args.input, 'r') as zip_ref:
-        zip_ref.extractall(temp_dir_name)
-    if not os.path.exists(os.path.join(temp_dir_name, 'collection.media')):
-        os.makedirs(os.path.join(temp_dir_name, 'collection.media'))
-    collection_file = os.path.join(temp_dir_name, "collection.anki21")
-
-    col = anki.collection.Collection(collection_file) # pylint: disable=E1101
-    col.media._dir = os.path.join(temp_dir_name, 'collection.media') # pylint: disable=W0212
+    if args.resume and not args.work_dir:
+        raise ValueError("--resume requires --work-dir")
+    col, work_dir, resumed = open_collection(args)
     adj_model_name = config.adjective_model_name()
     verb_model_name = config.verb_model_name()
     add_or_update_verb_model(col.models, verb_model_name)
@@ -39,33 +246,47 @@ def main(args): # pylint: disable=R0914
     verb_deck_id = col.decks.id(args.verb_deck_name, create=True)
     adj_deck_id = col.decks.id(args.adj_deck_name, create=True)
 
-    verb_updater = DeckUpdater(col, verb_deck_id, verb_model, config)
-    adj_updater = DeckUpdater(col, adj_deck_id, adj_model, config)
+    conjugator = Conjugator()
+    adj_updater = make_updater(col, adj_deck_id, adj_model, config, conjugator, args,
+                               resumed)
+    verb_updater = make_updater(col, verb_deck_id, verb_model, config, conjugator, args,
+                                resumed)
 
     source_deck_id = col.decks.id(args.source_deck_name)
-    deck_searcher = DeckSearcher(col, source_deck_id, config)
-
-    # get the adjectives
-    adj_note_ids, relevant_models = deck_searcher.find_adjectives(adj_model['name'])
+    # The watermarks are kept per target deck, so each target gets its own searcher
+    adj_searcher = DeckSearcher(col, source_deck_id, config, args.full_rescan, adj_deck_id)
+    verb_searcher = DeckSearcher(col, source_deck_id, config, args.full_rescan, verb_deck_id)
 
-    for model_name in relevant_models:
-        if config.model_fields_empty(model_name):
-            raise ValueError("Please specify the relevant fields for the '{model_name}' note type")
+    adj_note_ids = update_words(col, adj_searcher, adj_updater, ADJECTIVE_CLASSES,
+                                adj_model['name'], config, args)
+    verb_note_ids = update_words(col, verb_searcher, verb_updater, VERB_CLASSES,
+                                 verb_model['name'], config, args)
 
-    verb_note_ids, relevant_models = deck_searcher.find_verbs(verb_model['name'])
-    for model_name in relevant_models:
-        if config.model_fields_empty(model_name):
-            raise ValueError("Please specify the relevant fields for the '{model_name}' note type")
+    if args.orphans != 'keep':
+        reconcile_orphans(adj_searcher, source_deck_id,
+                          [(args.adj_deck_name, adj_updater, adj_note_ids),
+                           (args.verb_deck_name, verb_updater, verb_note_ids)],
+                          args.orphans)
 
-    for adj_type, note_id_list in adj_note_ids.items():
-        for note_id in note_id_list:
-            note = col.get_note(note_id)
-            adj_updater.add_note_to_deck(note, adj_type)
+    if args.work_dir:
+        # Both updates finished, so there is nothing left to resume
+        config.set_checkpoint(args.source_deck_name, adj_model['name'], None)
+        config.set_checkpoint(args.source_deck_name, verb_model['name'], None)
+    if config.incremental(args.source_deck_name):
+        # Keep the watermarks for the next run
+        adj_searcher.record_watermark(adj_model['name'])
+        verb_searcher.record_watermark(verb_model['name'])
+    if args.work_dir or config.incremental(args.source_deck_name):
+        save_config(config, args.config)
 
-    for verb_type, note_id_list in verb_note_ids.items():
-        for note_id in note_id_list:
-            note = col.get_note(note_id)
-            verb_updater.add_note_to_deck(note, verb_type)
+    if args.stream:
+        peak = peak_memory()
+        if peak is not None:
+            message = f"Peak memory: {peak / 2**20:.1f} MiB in the main process"
+            if args.workers != 1:
+                # The workers have all finished, and each kept its own memory
+                message += f", {peak_memory(children=True) / 2**20:.1f} MiB in the largest worker"
+            print(message)
 
     outdir = os.path.dirname(os.path.abspath(args.output))
     if not os.path.isdir(outdir):
@@ -75,7 +296,8 @@ def main(args): # pylint: disable=R0914
     exporter = anki.exporting.AnkiPackageExporter(col)
     exporter.exportInto(args.output)
     col.close()
-    shutil.rmtree(temp_dir_name)
+    if not args.work_dir:
+        shutil.rmtree(work_dir)
 
 def inspect_main(args):
     """Load the specified collection and start a debugger"""
@@ -105,6 +327,32 @@ def main_cli():
                         default="Japanese Adjective Conjugations")
 
     gen_parser.add_argument('--config')
+    gen_parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes used for conjugation")
+    gen_parser.add_argument('--batch-size', dest='batch_size', type=int,
+                        default=WRITE_BATCH_SIZE,
+                        help="Number of conjugation notes written to the collection at a time")
+    gen_parser.add_argument('--full-rescan', dest='full_rescan', action='store_true',
+                        help="Search every source note, even if the source deck is configured "
+                        "to only search notes edited since the last run")
+    gen_parser.add_argument('--orphans', choices=['keep', 'report', 'tag', 'delete'],
+                        default='keep',
+                        help="What to do with conjugation notes whose source note is no "
+                        "longer found")
+    gen_parser.add_argument('--stream', action='store_true',
+                        help="Process the source notes a chunk at a time, writing each chunk "
+                        "before reading the next, to bound the memory used")
+    gen_parser.add_argument('--chunk-size', dest='chunk_size', type=int,
+                        default=STREAM_CHUNK_SIZE,
+                        help="Number of source notes processed at a time with --stream")
+    gen_parser.add_argument('--work-dir', dest='work_dir',
+                        help="Directory to unpack and update the input collection in, which is "
+                        "kept afterwards. The progress of the update is saved to the config "
+                        "file as notes are written, so that an interrupted run can be "
+                        "picked up with --resume.")
+    gen_parser.add_argument('--resume', action='store_true',
+                        help="Carry on with the collection in --work-dir from where an "
+                        "interrupted run left off, rather than unpacking the input again")
     gen_parser.set_defaults(func=main)
 
     inspect_parser = subparsers.add_parser("inspect", help="Load a collection for inspection")
@@ -1,5 +1,5 @@
 """classes and functions focused on managing the Addon configuration"""
-from typing import Dict, Any, Union, List, Tuple
+from typing import Dict, Any, Optional, Union, List, Tuple
 
 from .enums import VerbClass, AdjectiveClass
 
@@ -152,6 +152,10 @@ class ConfigManager:
             self._cfg['decks'][deck_name][word_type.value] = []
         if tag is not None and tag not in self._cfg['decks'][deck_name][word_type.value]:
             self._cfg['decks'][deck_name][word_type.value].append(tag)
+            # Notes with the new tag may not have been edited since the last update, and
+            # may have been passed over by an interrupted update
+            self._cfg['decks'][deck_name].pop('watermarks', None)
+            self._cfg['decks'][deck_name].pop('checkpoints', None)
 
     def add_model_fields(self, model_name: str,
                          expression: str, meaning: str, reading: str) -> None:
@@ -176,6 +180,11 @@ class ConfigManager:
         self._cfg['note_types'][model_name]['meaning'] = meaning
         self._cfg['note_types'][model_name]['reading'] = reading
 
+        # Notes of the model may now be used for the first time in any of the decks
+        for deck_cfg in self._cfg['decks'].values():
+            deck_cfg.pop('watermarks', None)
+            deck_cfg.pop('checkpoints', None)
+
     def get_tags(self, deck_name: str, word_type: Union[VerbClass, AdjectiveClass]) -> List[str]:
         """Retrieve the tags that label a particular word type for a given deck
 
@@ -245,3 +254,126 @@ class ConfigManager:
             False if at least one repetition for at least one card is required."""
 
         return self._cfg.get('decks', {}).get(deck_name, {}).get('allow_unseen', False)
+
+    def incremental(self, deck_name: str) -> bool:
+        """Retrieve the setting for only searching notes changed since the last update
+
+        Parameters
+        ----------
+        deck_name : str
+            Name of the deck for which the setting is being requested
+
+        Returns
+        -------
+        bool
+            True if only the notes edited since the deck's watermark (see
+            `get_watermark`) should be searched. False if every note is searched.
+        """
+
+        return self._cfg.get('decks', {}).get(deck_name, {}).get('incremental', False)
+
+    def get_watermark(self, deck_name: str, model_name: str,
+                      target_deck_id: Optional[int]) -> Optional[Tuple[int, int]]:
+        """Retrieve the state of the collection when a deck was last processed
+
+        Parameters
+        ----------
+        deck_name : str
+            Name of the source deck
+        model_name : str
+            Name of the conjugation model the source deck was processed for
+        target_deck_id : Optional[int]
+            ID of the deck the conjugation notes are written to
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            The modification time of the collection and the latest modification time of
+            any note, or None if the deck has not been processed for the model into the
+            target deck since its configuration last changed
+        """
+
+        watermark = self._cfg['decks'].get(deck_name, {}).get('watermarks', {}).get(model_name)
+        if watermark is None or watermark.get('target_deck_id') != target_deck_id:
+            # The notes found so far were written to another deck, if anywhere
+            return None
+        return watermark['collection_mod'], watermark['note_mod']
+
+    def set_watermark(self, deck_name: str, model_name: str, target_deck_id: Optional[int],
+                      collection_mod: int, note_mod: int) -> None:
+        """Record the state of the collection once a deck has been processed
+
+        Parameters
+        ----------
+        deck_name : str
+            Name of the source deck
+        model_name : str
+            Name of the conjugation model the source deck was processed for
+        target_deck_id : Optional[int]
+            ID of the deck the conjugation notes were written to
+        collection_mod : int
+            Modification time of the collection
+        note_mod : int
+            Latest modification time of any note in the collection
+        """
+
+        if deck_name not in self._cfg['decks']:
+            self._cfg['decks'][deck_name] = {}
+        watermarks = self._cfg['decks'][deck_name].setdefault('watermarks', {})
+        watermarks[model_name] = {'target_deck_id': target_deck_id,
+                                  'collection_mod': collection_mod, 'note_mod': note_mod}
+
+    def get_checkpoint(self, deck_name: str, model_name: str) -> Optional[Dict[str, Any]]:
+        """Retrieve the progress of an update of a deck which did not finish
+
+        Parameters
+        ----------
+        deck_name : str
+            Name of the source deck
+        model_name : str
+            Name of the conjugation model the source deck was being processed for
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The checkpoint last saved by the update (see `DeckUpdater.checkpoint`), or
+            None if there is no unfinished update
+        """
+
+        return self._cfg['decks'].get(deck_name, {}).get('checkpoints', {}).get(model_name)
+
+    def set_checkpoint(self, deck_name: str, model_name: str,
+                       checkpoint: Optional[Dict[str, Any]]) -> None:
+        """Record the progress of an update of a deck, so that it can be resumed
+
+        Parameters
+        ----------
+        deck_name : str
+            Name of the source deck
+        model_name : str
+            Name of the conjugation model the source deck is being processed for
+        checkpoint : Optional[Dict[str, Any]]
+            Progress of the update (see `DeckUpdater.checkpoint`), or None once the update
+            has finished
+        """
+
+        if deck_name not in self._cfg['decks']:
+            self._cfg['decks'][deck_name] = {}
+        checkpoints = self._cfg['decks'][deck_name].setdefault('checkpoints', {})
+        if checkpoint is None:
+            checkpoints.pop(model_name, None)
+            if not checkpoints:
+                del self._cfg['decks'][deck_name]['checkpoints']
+        else:
+            checkpoints[model_name] = checkpoint
+
+    def orphan_action(self) -> str:
+        """Retrieve what should be done with conjugation notes whose source note is gone
+
+        Returns
+        -------
+        str
+            One of 'keep' (the default), 'report', 'tag', or 'delete'
+        """
+
+        return self._cfg.get('orphaned_notes', 'keep')
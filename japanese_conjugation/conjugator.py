@@ -0,0 +1,273 @@
+"""Memoizing facade over the verb and adjective conjugation functions"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .enums import AdjectiveClass, Form, Formality, VerbClass
+from .verbs import generate_verb_forms, classify_verb, verb_rules_version
+from .adjectives import generate_adjective_forms, classify_adjective, adjective_rules_version
+from .util import ConjugationError
+
+class Conjugator:
+    """Conjugate and classify words, remembering the most recently used results
+
+    Source decks commonly contain the same reading several times (homographs, duplicate
+    cards from several sources, the same word tagged in several decks), so results are
+    memoized by reading and word class. The cache is bounded and evicts the least
+    recently used entry once full. Cached results are shared between callers and should
+    be treated as read-only.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of results to retain. A size of 0 disables caching.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative. Found {max_size}.")
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of results retained by the cache"""
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups which had to be computed"""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results dropped from the cache to make room for newer ones"""
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the statistics"""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def generate_verb_forms(self, dictionary_form: str, verb_class: VerbClass,
+                            forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None) \
+        -> List[Tuple[str, Form, Optional[Formality]]]:
+        """Memoized `japanese_conjugation.verbs.generate_verb_forms`
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the verb to be conjugated
+        verb_class : VerbClass
+            Class of verb to guide how conjugation should be performed
+        forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+            Formality+Form combinations to be generated. All known conjugations are
+            generated if not provided.
+
+        Returns
+        -------
+        List of tuples
+            Each tuple is the conjugation (string), Form, and Formality
+        """
+        if forms is None:
+            return self._lookup((dictionary_form, verb_class), generate_verb_forms,
+                                dictionary_form, verb_class)
+        combos = frozenset(forms)
+        return self._lookup((dictionary_form, verb_class, combos), generate_verb_forms,
+                            dictionary_form, verb_class, combos)
+
+    def generate_adjective_forms(self, dictionary_form: str, adjective_class: AdjectiveClass) \
+        -> List[Tuple[str, Form, Optional[Formality]]]:
+        """Memoized `japanese_conjugation.adjectives.generate_adjective_forms`
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the adjective to be conjugated
+        adjective_class : AdjectiveClass
+            Class of adjective to guide how conjugation should be performed
+
+        Returns
+        -------
+        List of tuples
+            Each tuple is the conjugation (string), Form, and Formality
+        """
+        return self._lookup((dictionary_form, adjective_class), generate_adjective_forms,
+                            dictionary_form, adjective_class)
+
+    def generate_forms(self, dictionary_form: str,
+                       word_type: Union[VerbClass, AdjectiveClass],
+                       forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None) \
+        -> List[Tuple[str, Form, Optional[Formality]]]:
+        """Conjugate a verb or adjective, depending on the type of word
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the word to be conjugated
+        word_type : Union[VerbClass, AdjectiveClass]
+            Class of the word to guide how conjugation should be performed
+        forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+            Formality+Form combinations to be generated for verbs. Adjectives only have
+            a handful of forms, so all of them are always generated.
+
+        Returns
+        -------
+        List of tuples
+            Each tuple is the conjugation (string), Form, and Formality
+        """
+        if word_type in AdjectiveClass:
+            return self.generate_adjective_forms(dictionary_form, word_type)
+        return self.generate_verb_forms(dictionary_form, word_type, forms)
+
+    def generate_forms_many(self, words: Sequence[Tuple[str, Union[VerbClass, AdjectiveClass]]],
+                            forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None) \
+        -> List[List[Tuple[str, Form, Optional[Formality]]]]:
+        """Conjugate many verbs and adjectives
+
+        Parameters
+        ----------
+        words : Sequence[Tuple[str, Union[VerbClass, AdjectiveClass]]]
+            Dictionary form and class of each word to be conjugated
+        forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+            Formality+Form combinations to be generated for verbs
+
+        Returns
+        -------
+        List[List[Tuple[str, Form, Optional[Formality]]]]
+            The output of `generate_forms` for each word, in input order. A word which
+            cannot be conjugated (see `ConjugationError`) is given no conjugations, so
+            that it does not stop the others from being conjugated.
+        """
+        if forms is not None:
+            forms = frozenset(forms)
+        results = []
+        for dictionary_form, word_type in words:
+            try:
+                results.append(self.generate_forms(dictionary_form, word_type, forms))
+            except ConjugationError:
+                results.append([])
+        return results
+
+    def rules_version(self, dictionary_form: str,
+                      word_type: Union[VerbClass, AdjectiveClass]) -> str:
+        """Identify the version of the rules used to conjugate a verb or adjective
+
+        This only classifies the word (if needed), so it is far cheaper than conjugating
+        the word. It is not memoized.
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the word to be conjugated
+        word_type : Union[VerbClass, AdjectiveClass]
+            Class of the word to guide how conjugation should be performed
+
+        Returns
+        -------
+        str
+            Version which changes whenever the conjugations of the word would change
+        """
+        if word_type in AdjectiveClass:
+            return adjective_rules_version(dictionary_form, word_type)
+        return verb_rules_version(dictionary_form, word_type)
+
+    def classify_verb(self, dictionary_form: str) -> VerbClass:
+        """Memoized `japanese_conjugation.verbs.classify_verb`
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the verb to be classified
+
+        Returns
+        -------
+        VerbClass
+            Returns the verb classification
+        """
+        return self._lookup((dictionary_form, VerbClass), classify_verb, dictionary_form)
+
+    def classify_adjective(self, dictionary_form: str) -> AdjectiveClass:
+        """Memoized `japanese_conjugation.adjectives.classify_adjective`
+
+        Parameters
+        ----------
+        dictionary_form : str
+            Dictionary form of the adjective to be classified
+
+        Returns
+        -------
+        AdjectiveClass
+            Returns the adjective classification
+        """
+        return self._lookup((dictionary_form, AdjectiveClass), classify_adjective,
+                            dictionary_form)
+
+    def _lookup(self, key: Hashable, compute: Callable[..., Any], *args) -> Any:
+        """Retrieve a result from the cache, computing and storing it if absent
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key identifying the reading and word class (or classification)
+        compute : Callable
+            Function which produces the result on a cache miss
+        args
+            Arguments to be passed to `compute`
+
+        Returns
+        -------
+        Any
+            The cached or freshly computed result
+        """
+        try:
+            result = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return result
+
+        self._misses += 1
+        result = compute(*args)
+        if self._max_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return result
+
+def conjugate_words(words: Sequence[Tuple[str, Union[VerbClass, AdjectiveClass]]],
+                    forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None) \
+    -> List[List[Tuple[str, Form, Optional[Formality]]]]:
+    """Conjugate many verbs and adjectives with a fresh Conjugator
+
+    Being module-level, this can be sent to a worker process along with a chunk of words.
+    Repeated words within the chunk are only conjugated once.
+
+    Parameters
+    ----------
+    words : Sequence[Tuple[str, Union[VerbClass, AdjectiveClass]]]
+        Dictionary form and class of each word to be conjugated
+    forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations to be generated for verbs
+
+    Returns
+    -------
+    List[List[Tuple[str, Form, Optional[Formality]]]]
+        The output of `Conjugator.generate_forms` for each word, in input order
+    """
+    return Conjugator().generate_forms_many(words, forms)
@@ -1,19 +1,132 @@
 """Functions/classes for adding notes to target decks with conjugations"""
-from typing import List, Dict, Tuple, Optional, Union
-from copy import deepcopy
+# pylint: disable=C0302
+import re
+import string
+from typing import Any, Callable, List, Dict, Iterator, Tuple, Optional, Sequence, Union
 
 import anki.notes
 import anki.collection
+from anki.buildinfo import version as anki_version
 from anki.models import NotetypeDict
+from anki.utils import ids2str
+try:
+    from anki.utils import split_fields
+except ImportError: # Anki 2.1.49 and earlier
+    from anki.utils import splitFields as split_fields # pylint: disable=E0611
 
 from .enums import Form, Formality, VerbClass, AdjectiveClass
-from .models import combo_to_field_name
-from .verbs import generate_verb_forms
-from .adjectives import generate_adjective_forms
-from .util import escape_query
+from .models import combo_to_field_name, VERB_COMBOS
+from .util import ConjugationError, digest, escape_query, pipeline_map
 from .config import ConfigManager
+from .conjugator import Conjugator, conjugate_words
 
-class DeckUpdater: # pylint: disable=R0903
+# Tag given to conjugation notes whose source note is no longer found (see
+# `DeckUpdater.reconcile`)
+ORPHAN_TAG = 'orphaned-conjugation'
+
+# Number of source notes read and conjugated together by `DeckUpdater.add_words`
+WORD_CHUNK_SIZE = 1000
+
+# Kinds of word searched for by `DeckSearcher.find_verbs` and `DeckSearcher.find_adjectives`
+VERB_CLASSES = [VerbClass.ICHIDAN, VerbClass.GODAN, VerbClass.IRREGULAR, VerbClass.GENERAL]
+ADJECTIVE_CLASSES = [AdjectiveClass.I, AdjectiveClass.NA, AdjectiveClass.GENERAL]
+
+# Anki 23.10 and later commit every change as it is made, keeping `save` only to print
+# that it is deprecated
+_SAVING_IS_AUTOMATIC = tuple(int(part) for part in re.findall(r'\d+', anki_version)[:3]) \
+    >= (23, 10)
+
+# Field searches ignore the case of ASCII letters only
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def _note_key(expression: str, meaning: str, reading: str) -> Tuple[str, str, str]:
+    """Key identifying a conjugation note by its expression, meaning, and reading
+
+    Parameters
+    ----------
+    expression : str
+        Expression of the word
+    meaning : str
+        Meaning of the word
+    reading : str
+        Reading of the word
+
+    Returns
+    -------
+    Tuple[str, str, str]
+        The three values with ASCII letters lower-cased, matching how a field search
+        compares them
+    """
+    return (expression.translate(_ASCII_LOWER), meaning.translate(_ASCII_LOWER),
+            reading.translate(_ASCII_LOWER))
+
+def save_collection(col: anki.collection.Collection) -> None:
+    """Commit the changes written so far to the collection file
+
+    Before Anki 23.10, changes are only committed when the collection is saved or
+    closed, so anything written since would be lost if the process were stopped.
+
+    Parameters
+    ----------
+    col : anki.collection.Collection
+        Collection to be saved
+    """
+    if not _SAVING_IS_AUTOMATIC:
+        col.save()
+
+class SourceNote: # pylint: disable=R0903
+    """The parts of a source note needed to generate its conjugation note
+
+    This is far lighter than an `anki.notes.Note`, and has the same attributes for
+    these parts, so either can be given to a `DeckUpdater`.
+
+    Parameters
+    ----------
+    note_id : int
+        ID of the note
+    mid : int
+        ID of the note's model
+    fields : List[str]
+        Values of the note's fields, in the order of the model's fields
+    tags : List[str]
+        Tags of the note
+    """
+    __slots__ = ('id', 'mid', 'fields', 'tags')
+
+    def __init__(self, note_id: int, mid: int, fields: List[str], tags: List[str]):
+        self.id = note_id
+        self.mid = mid
+        self.fields = fields
+        self.tags = tags
+
+def read_source_notes(col: anki.collection.Collection, note_ids: Sequence[int]) \
+    -> List[SourceNote]:
+    """Read many source notes with a single query
+
+    Parameters
+    ----------
+    col : anki.collection.Collection
+        Collection containing the notes
+    note_ids : Sequence[int]
+        IDs of the notes to be read
+
+    Returns
+    -------
+    List[SourceNote]
+        The notes, in the order of `note_ids`. Notes which no longer exist are left out.
+    """
+    if not note_ids:
+        return []
+    rows = {nid: (mid, flds, tags) for nid, mid, flds, tags in col.db.all(
+        f"select id, mid, flds, tags from notes where id in {ids2str(note_ids)}")}
+    notes = []
+    for nid in note_ids:
+        if nid in rows:
+            mid, flds, tags = rows[nid]
+            notes.append(SourceNote(nid, mid, split_fields(flds), tags.split()))
+    return notes
+
+class DeckUpdater: # pylint: disable=R0902,R0903
     """Class object for updating a target deck with content from source notes
 
     Parameters
@@ -26,84 +139,643 @@ class DeckUpdater: # pylint: disable=R0903
         Model (a.k.a. Note Type) to be used for any new cards
     config : ConfigManager
         Addon configurations, including which fields are relevant for source models
+    conjugator : Conjugator
+        Conjugator used to produce the conjugations. Providing one allows its cache to be
+        shared across several updaters. A new Conjugator is created if not provided.
+    batch_size : int
+        Number of new or modified notes to hold before writing them to the collection
+        together. Once done adding notes, `flush` must be called to write any notes still
+        being held.
+    undoable : bool
+        Whether the writes made by the updater are gathered into a single undo step. The
+        undo step holds on to everything written, so a long run which does not need to
+        be undone (e.g. a streaming run of the CLI) can leave it out to keep memory use
+        from growing with the number of notes written.
+    on_checkpoint : Optional[Callable[[Dict[str, Any]], None]]
+        Called with the updater's `checkpoint` each time notes are written to the
+        collection and the collection is saved, so that it can be saved for resuming (see
+        `resume`) should the update be interrupted
     """
 
-    def __init__(self, col: anki.collection.Collection, deck_id: int, model: NotetypeDict,
-                 config: ConfigManager):
+    def __init__(self, col: anki.collection.Collection, deck_id: int, model: NotetypeDict, # pylint: disable=R0913,R0917
+                 config: ConfigManager, conjugator: Optional[Conjugator] = None,
+                 batch_size: int = 1, undoable: bool = True,
+                 on_checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive. Found {batch_size}.")
         self._col = col
         self._deck = self._col.decks.get(did=deck_id)
         self._model_id = model['id']
-        self._model_field_map = self._col.models.field_map(model)
+        model_field_map = self._col.models.field_map(model)
+        # Indexes of the expression, meaning, and reading fields of the target model
+        self._key_field_indexes = tuple(model_field_map[name][0]
+                                        for name in ('Expression', 'Meaning', 'Reading'))
+        # Index of the target field for each conjugation the target model has a field for.
+        # VERB_COMBOS covers every combination of ADJECTIVE_COMBOS as well.
+        self._combo_field_indexes = {
+            (formality, form): model_field_map[combo_to_field_name(form, formality)][0]
+            for formality, form in VERB_COMBOS
+            if combo_to_field_name(form, formality) in model_field_map}
+        # Only conjugations with a field in the target model need to be generated
+        self._combos = frozenset(self._combo_field_indexes)
+        # Indexes of the hidden fields holding the ID of the source note each note was
+        # generated from, and what the source note looked like at the time. Notes of
+        # models created before these were introduced are only matched by their text.
+        self._link_index = model_field_map.get('SourceNoteId', (None,))[0]
+        self._fingerprint_index = None
+        if self._link_index is not None:
+            self._fingerprint_index = model_field_map.get('Fingerprint', (None,))[0]
+        # Adding conjugation fields to the target model changes every fingerprint
+        self._layout = digest(sorted(combo_to_field_name(form, formality)
+                                     for formality, form in self._combos))
+        # Indexes of the configured expression, meaning, and reading fields of each
+        # source model, by model ID
+        self._source_field_indexes = {}
         self._cfg = config
+        self._conjugator = conjugator if conjugator is not None else Conjugator()
+        # Built on first use, so that it reflects the deck when updating begins
+        self._note_index = None
+        # ID of the note linked to each source note, by source note ID
+        self._linked_notes = {}
+        # Fingerprint of each indexed note, by ID
+        self._fingerprints = {}
+        # IDs of the notes reached from any of the source notes added so far
+        self._reached = set()
+        # Notes waiting to be written, by key. New notes have an ID of 0.
+        self._pending_notes = {}
+        # Key of each existing note waiting to be written, by ID
+        self._pending_keys = {}
+        self._batch_size = batch_size
+        self._undoable = undoable
+        self._undo_entry = None
+        self._on_checkpoint = on_checkpoint
+        # ID of the last source note added by `add_words` for each kind of word
+        self._last_note_ids = {}
 
-        self._changes = [0, 0, 0]
+        self._changes = [0, 0, 0, 0]
 
-    def summary(self) -> Tuple[int, int]:
-        """Return the number of new and modified notes handled by this updater
+    def _index_notes(self) -> Dict[Tuple[str, str, str], int]:
+        """Index the conjugation notes already in the target deck
 
         Returns
         -------
-        Tuple[int, int]
-            Two integers. The first integer is the number of new notes created
+        Dict[Tuple[str, str, str], int]
+            Mapping from the (case-folded) expression, meaning, and reading of each
+            conjugation note to its ID. Where several notes share the same key, the
+            first one found is kept. The links to source notes and the fingerprints of
+            the notes are recorded as well.
+        """
+        note_ids = self._col.find_notes(
+            f'"deck:{escape_query(self._deck["name"])}" "mid:{self._model_id}"')
+        if not note_ids:
+            return {}
+        rows = dict(self._col.db.all(
+            f"select id, flds from notes where id in {ids2str(note_ids)}"))
+        index = {}
+        for nid in note_ids:
+            fields = split_fields(rows[nid])
+            index.setdefault(_note_key(*(fields[i] for i in self._key_field_indexes)), nid)
+            if self._link_index is not None and fields[self._link_index].isdigit():
+                self._linked_notes.setdefault(int(fields[self._link_index]), nid)
+            if self._fingerprint_index is not None:
+                self._fingerprints[nid] = fields[self._fingerprint_index]
+        return index
+
+    def summary(self) -> Tuple[int, int, int, int]:
+        """Return the number of new, modified, failed, and unchanged notes handled by this
+        updater
+
+        Returns
+        -------
+        Tuple[int, int, int, int]
+            Four integers. The first integer is the number of new notes created
             by this object. The second is the number of existing notes with
-            any changes to the fields.
+            any changes to the fields or tags. The third is the number of source notes
+            which could not be conjugated. The fourth is the number of existing notes
+            which were already up to date, and so were not written.
         """
         return self._changes
 
-    def add_note_to_deck(self, source_note: anki.notes.Note,
-                         word_type: Union[VerbClass, AdjectiveClass]) -> None:
+    def checkpoint(self) -> Dict[str, Any]:
+        """Describe the progress made by `add_words`, for resuming an interrupted update
+
+        Source notes are added in order of ID for each kind of word, so the progress is
+        the ID of the last source note added of each kind, along with the counts of
+        `summary`. It should only be saved once the notes being held have been written
+        (see `flush`).
+
+        Returns
+        -------
+        Dict[str, Any]
+            JSON-serializable progress, to be handed to `resume`
+        """
+        return {'deck_id': self._deck['id'],
+                'last_note_ids': {word_type.value: note_id
+                                  for word_type, note_id in self._last_note_ids.items()},
+                'changes': list(self._changes)}
+
+    def resume(self, checkpoint: Dict[str, Any]) -> bool:
+        """Pick up from where an interrupted update left off
+
+        Later calls to `add_words` pass over the source notes which were added before the
+        checkpoint was taken, and the counts of `summary` carry on from the checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : Dict[str, Any]
+            Progress of the interrupted update (see `checkpoint`)
+
+        Returns
+        -------
+        bool
+            True if the update is resumed. False if the checkpoint is for another deck,
+            in which case it is ignored.
+        """
+        if checkpoint.get('deck_id') != self._deck['id']:
+            return False
+        self._last_note_ids = {_word_type(value): note_id
+                               for value, note_id in checkpoint['last_note_ids'].items()}
+        self._changes = list(checkpoint['changes'])
+        return True
+
+    def source_fields(self, source_note: SourceNote) -> Tuple[str, str, str]:
+        """Extract the configured expression, meaning, and reading from a source note
+
+        Parameters
+        ----------
+        source_note: SourceNote
+            Source note which is being used to generate the conjugation note
+
+        Returns
+        -------
+        Tuple[str, str, str]
+            Expression, meaning, and reading (with any trailing markup removed)
+        """
+
+        field_indexes = self._source_field_indexes.get(source_note.mid)
+        if field_indexes is None:
+            source_model = self._col.models.get(source_note.mid)
+            source_fields = self._col.models.field_map(source_model)
+            relevant_fields = self._cfg.get_model_fields(source_model['name'])
+            field_indexes = tuple(source_fields[name][0] for name in relevant_fields)
+            self._source_field_indexes[source_note.mid] = field_indexes
+
+        expression_index, meaning_index, reading_index = field_indexes
+        fields = source_note.fields
+        return (fields[expression_index], fields[meaning_index],
+                fields[reading_index].split('<')[0].strip())
+
+    def fingerprint(self, source_note: SourceNote,
+                    word_type: Union[VerbClass, AdjectiveClass]) -> Optional[str]:
+        """Summarize everything a conjugation note generated from a source note depends on
+
+        Parameters
+        ----------
+        source_note: SourceNote
+            Source note which is being used to generate the conjugation note
+        word_type : Union[VerbClass, AdjectiveClass]
+            Indicates what kind of word the source_note is.
+
+        Returns
+        -------
+        Optional[str]
+            The ID of the source note, a hash of its expression, meaning, reading, and
+            tags (along with the kind of word and the conjugation fields of the target
+            model), and the version of the conjugation rules for the word, separated by
+            colons. None if the target model has no field for the fingerprint.
+        """
+        if self._fingerprint_index is None:
+            return None
+        expression, meaning, reading = self.source_fields(source_note)
+        inputs = digest(expression, meaning, reading, sorted(source_note.tags),
+                        word_type.value, self._layout)
+        rules = self._conjugator.rules_version(reading, word_type)
+        return f"{source_note.id}:{inputs}:{rules}"
+
+    def is_current(self, source_note: SourceNote,
+                   word_type: Union[VerbClass, AdjectiveClass]) -> bool:
+        """Determine whether the conjugation note for a source note is already up to date
+
+        Parameters
+        ----------
+        source_note: SourceNote
+            Source note which is being used to generate the conjugation note
+        word_type : Union[VerbClass, AdjectiveClass]
+            Indicates what kind of word the source_note is.
+
+        Returns
+        -------
+        bool
+            True if `add_note_to_deck` would leave the note alone without conjugating the
+            word (see `fingerprint`)
+        """
+        key = _note_key(*self.source_fields(source_note))
+        return self._up_to_date(source_note.id, key, self.fingerprint(source_note, word_type))
+
+    def add_words(self, note_ids_by_type: Dict[Union[VerbClass, AdjectiveClass], List[int]],
+                  workers: Optional[int] = 1, chunk_size: int = WORD_CHUNK_SIZE,
+                  on_progress: Optional[Callable[[], None]] = None) -> None:
+        """Add the notes for many source notes to the deck, conjugating in worker processes
+
+        Source notes are read in chunks (see `read_source_notes`), and the notes which
+        need conjugating are sent to the worker processes. The conjugations are added to
+        the deck as they come back, while the workers carry on with later chunks. Only the
+        calling thread accesses the collection. As with `add_note_to_deck`, `flush` must
+        be called once done adding notes.
+
+        The source notes of each kind of word are added in order of ID, passing over
+        those added before the update was resumed (see `resume`). A source note listed
+        under several kinds of word is only added as the last of them, so that its
+        fingerprint (see `fingerprint`) stays the same from one update to the next.
+
+        Parameters
+        ----------
+        note_ids_by_type : Dict[Union[VerbClass, AdjectiveClass], List[int]]
+            IDs of the source notes for each kind of word (e.g. as found by
+            `DeckSearcher.find_verbs`)
+        workers : Optional[int]
+            Number of worker processes to conjugate with. None uses every available CPU.
+            With a single worker, conjugation is done in the current process using the
+            updater's conjugator.
+        chunk_size : int
+            Number of source notes read and conjugated together
+        on_progress : Optional[Callable[[], None]]
+            Called once each chunk of source notes has been added, e.g. to report the
+            progress made so far (see `summary`). Raising an exception stops adding notes,
+            leaving the notes being held to be written by `flush`.
+        """
+        if workers == 1:
+            conjugate = self._conjugator.generate_forms_many
+        else:
+            conjugate = conjugate_words
+
+        # The kind of word each source note is added as. The last one listed wins, as it
+        # would if the note were added under each of them in turn.
+        word_types = {nid: word_type for word_type, note_ids in note_ids_by_type.items()
+                      for nid in note_ids}
+
+        def read_chunks():
+            for word_type, note_ids in note_ids_by_type.items():
+                last_note_id = self._last_note_ids.get(word_type, 0)
+                note_ids = sorted(nid for nid in note_ids
+                                  if nid > last_note_id and word_types[nid] == word_type)
+                for start in range(0, len(note_ids), chunk_size):
+                    chunk = [(note, self.is_current(note, word_type)) for note in
+                             read_source_notes(self._col, note_ids[start:start + chunk_size])]
+                    words = [(self.source_fields(note)[2], word_type)
+                             for note, current in chunk if not current]
+                    if chunk:
+                        yield (chunk, word_type), (words, self._combos)
+
+        for (chunk, word_type), conjugations in pipeline_map(conjugate, read_chunks(),
+                                                             workers):
+            conjugations = iter(conjugations)
+            for note, current in chunk:
+                # Set first, since adding the note may write it along with the others held
+                self._last_note_ids[word_type] = note.id
+                # A current note is only counted, since it needs neither conjugating nor
+                # writing
+                self.add_note_to_deck(note, word_type, None if current else next(conjugations))
+            if on_progress is not None:
+                on_progress()
+
+    def add_note_to_deck(self, source_note: SourceNote,
+                         word_type: Union[VerbClass, AdjectiveClass],
+                         conjugations: Optional[List[Tuple[str, Form, Optional[Formality]]]] \
+                            = None) -> None:
         """Add a note to a deck, updating an existing note if a match is found
 
+        The note linked to the source note is updated, taking on any changes to the
+        expression, meaning, or reading. Failing that, a note with the same expression,
+        meaning, and reading is updated, and linked to the source note if it isn't linked
+        already. A note whose fingerprint shows that it was generated from the source note
+        as it is now (see `fingerprint`) is left alone without conjugating the word again.
+
         Parameters
         ----------
-        source_note: anki.notes.Note
+        source_note: SourceNote
             Source note which is being used to generate the conjugation note
         word_type : Union[VerbClass, AdjectiveClass]
             Indicates what kind of word the source_note is.
+        conjugations : Optional[List[Tuple[str, Form, Optional[Formality]]]]
+            Conjugations of the source note's reading, if they have already been generated
+            (e.g. by one of the batch conjugation functions)
         """
 
-        source_model = self._col.models.get(source_note.mid)
-        source_fields = self._col.models.field_map(source_model)
-        relevant_fields = self._cfg.get_model_fields(source_model['name'])
+        expression, meaning, reading = self.source_fields(source_note)
+        key = _note_key(expression, meaning, reading)
 
-        expression = source_note.fields[source_fields[relevant_fields[0]][0]]
-        meaning = source_note.fields[source_fields[relevant_fields[1]][0]]
-        reading = source_note.fields[source_fields[relevant_fields[2]][0]].split('<')[0].strip()
+        fingerprint = self.fingerprint(source_note, word_type)
+        if self._up_to_date(source_note.id, key, fingerprint):
+            self._changes[3] += 1
+            return
 
-        if word_type in AdjectiveClass:
-            conjugations = generate_adjective_forms(reading, word_type)
-        else: # VerbClass
-            conjugations = generate_verb_forms(reading, word_type)
+        if conjugations is None:
+            conjugations = self._conjugate(reading, word_type)
 
         if len(conjugations) == 0:
             self._changes[2] += 1
             return
 
-        query = f'"Expression:{escape_query(expression)}" "Meaning:{escape_query(meaning)}"' + \
-            f' "Reading:{escape_query(reading)}" ' + \
-            f' "deck:{escape_query(self._deck["name"])}" "mid:{self._model_id}"'
-        existing_notes = self._col.find_notes(query)
-        if existing_notes:
-            note = self._col.get_note(existing_notes[0])
-            existing_fields = deepcopy(note.fields)
+        note = self._existing_note(source_note.id, key)
+        if note is not None:
+            existing_fields = list(note.fields)
+            existing_tags = list(note.tags)
         else:
+            existing_fields = existing_tags = None
             note = anki.notes.Note(self._col, self._col.models.get(self._model_id))
-            note.fields[self._model_field_map['Expression'][0]] = expression
-            note.fields[self._model_field_map['Meaning'][0]] = meaning
-            note.fields[self._model_field_map['Reading'][0]] = reading
+            for field_index, value in zip(self._key_field_indexes, (expression, meaning, reading)):
+                note.fields[field_index] = value
 
+        note.remove_tag(ORPHAN_TAG)
         for t in source_note.tags:
-            note.add_tag(t)
+            if not note.has_tag(t):
+                note.add_tag(t)
 
         self._expand_note(note, conjugations)
 
-        if existing_notes:
-            if existing_fields != note.fields:
-                self._changes[1] += 1
-            self._col.update_note(note)
-        else:
+        self._link(note, source_note.id, (expression, meaning, reading), fingerprint)
+
+        if existing_fields is None:
             self._changes[0] += 1
-            self._col.add_note(note, self._deck["id"])
+        elif existing_fields != note.fields or existing_tags != note.tags:
+            self._changes[1] += 1
+        else:
+            # Writing an unchanged note would still bump its modification time, and so
+            # cause it to be synced again
+            self._changes[3] += 1
+            return
+        self._hold(key, note)
+
+    def _hold(self, key: Tuple[str, str, str], note: anki.notes.Note) -> None:
+        """Hold a new or modified note to be written, writing the notes held once there
+        are enough of them
+
+        Parameters
+        ----------
+        key : Tuple[str, str, str]
+            Key of the note, as produced by `_note_key`
+        note : anki.notes.Note
+            Note to be written
+        """
+        if note.id:
+            previous_key = self._pending_keys.get(note.id)
+            if previous_key is not None and previous_key != key:
+                # The note is held once, under the key it has now
+                del self._pending_notes[previous_key]
+            self._pending_keys[note.id] = key
+        self._pending_notes[key] = note
+        if len(self._pending_notes) >= self._batch_size:
+            self.flush()
+
+    def _conjugate(self, reading: str, word_type: Union[VerbClass, AdjectiveClass]) \
+        -> List[Tuple[str, Form, Optional[Formality]]]:
+        """Conjugate a word, for the target fields only
+
+        Parameters
+        ----------
+        reading : str
+            Dictionary form of the word
+        word_type : Union[VerbClass, AdjectiveClass]
+            Kind of word
+
+        Returns
+        -------
+        List[Tuple[str, Form, Optional[Formality]]]
+            The conjugations, or none if the word cannot be conjugated (e.g. a verb tagged
+            as irregular without an irregular ending)
+        """
+        try:
+            return self._conjugator.generate_forms(reading, word_type, self._combos)
+        except ConjugationError:
+            return []
+
+    def _existing_note(self, source_id: int, key: Tuple[str, str, str]) \
+        -> Optional[anki.notes.Note]:
+        """Find the conjugation note for a word, whether it is being held or already written
+
+        Parameters
+        ----------
+        source_id : int
+            ID of the source note the word comes from
+        key : Tuple[str, str, str]
+            Key of the word, as produced by `_note_key`
+
+        Returns
+        -------
+        Optional[anki.notes.Note]
+            The conjugation note, or None if the word does not have one yet
+        """
+        note = self._pending_notes.get(key)
+        if note is not None:
+            return note
+        note_id = self._find_note_id(source_id, key)
+        if note_id is not None:
+            self._reached.add(note_id)
+            if note_id in self._pending_keys:
+                # Held under another key, e.g. since its expression changed
+                return self._pending_notes[self._pending_keys[note_id]]
+            return self._col.get_note(note_id)
+        return None
+
+    def _up_to_date(self, source_id: int, key: Tuple[str, str, str],
+                    fingerprint: Optional[str]) -> bool:
+        """Determine whether the written conjugation note for a word is up to date
+
+        Parameters
+        ----------
+        source_id : int
+            ID of the source note the word comes from
+        key : Tuple[str, str, str]
+            Key of the word, as produced by `_note_key`
+        fingerprint : Optional[str]
+            Fingerprint of the source note, or None if fingerprints are not recorded
+
+        Returns
+        -------
+        bool
+            True if the note was generated from the source note as it is now
+        """
+        if fingerprint is None or key in self._pending_notes:
+            return False
+        note_id = self._find_note_id(source_id, key)
+        if self._fingerprints.get(note_id) != fingerprint:
+            return False
+        self._reached.add(note_id)
+        return True
+
+    def _find_note_id(self, source_id: int, key: Tuple[str, str, str]) -> Optional[int]:
+        """Find the written conjugation note for a word
+
+        Parameters
+        ----------
+        source_id : int
+            ID of the source note the word comes from
+        key : Tuple[str, str, str]
+            Key of the word, as produced by `_note_key`
+
+        Returns
+        -------
+        Optional[int]
+            ID of the note linked to the source note, else of the note with the same key,
+            or None if the word does not have a conjugation note yet
+        """
+        if self._note_index is None:
+            self._note_index = self._index_notes()
+        note_id = self._linked_notes.get(source_id)
+        if note_id is None:
+            note_id = self._note_index.get(key)
+        return note_id
+
+    def _link(self, note: anki.notes.Note, source_id: int, values: Tuple[str, str, str],
+              fingerprint: Optional[str]) -> None:
+        """Link a conjugation note to the source note it was generated from
+
+        Where several source notes produce the same conjugation note, it stays linked to
+        the first of them, so that they don't keep replacing each other's link and
+        fingerprint. The linked source note also determines the expression, meaning, and
+        reading of the note.
+
+        Parameters
+        ----------
+        note : anki.notes.Note
+            Conjugation note being written
+        source_id : int
+            ID of the source note the conjugation note was generated from
+        values : Tuple[str, str, str]
+            Expression, meaning, and reading of the source note
+        fingerprint : Optional[str]
+            Fingerprint of the source note, or None if fingerprints are not recorded
+        """
+        if self._link_index is None:
+            return
+        if not note.fields[self._link_index]:
+            note.fields[self._link_index] = str(source_id)
+        elif note.fields[self._link_index] != str(source_id):
+            return
+
+        previous_values = tuple(note.fields[i] for i in self._key_field_indexes)
+        if previous_values != values:
+            # The source note was edited, so the note's previous key may no longer apply
+            for field_index, value in zip(self._key_field_indexes, values):
+                note.fields[field_index] = value
+            previous_key = _note_key(*previous_values)
+            if previous_key != _note_key(*values) \
+                    and self._note_index.get(previous_key) == note.id:
+                del self._note_index[previous_key]
+        if fingerprint is not None:
+            note.fields[self._fingerprint_index] = fingerprint
+
+    def flush(self) -> None:
+        """Write the new and modified notes being held to the collection
+
+        New notes are added with a single call (or one at a time on Anki versions without
+        `add_notes`), as are the modified notes, and both are merged into the undo entry
+        shared by everything this updater writes.
+        """
+        if not self._pending_notes:
+            return
+
+        self._start_undo_entry()
+        new_notes = [note for note in self._pending_notes.values() if note.id == 0]
+        modified_notes = [note for note in self._pending_notes.values() if note.id != 0]
+        if new_notes and hasattr(self._col, 'add_notes'):
+            self._col.add_notes([anki.collection.AddNoteRequest(note, self._deck["id"])
+                                 for note in new_notes])
+        else:
+            # Before Anki 23.10, notes can only be added one at a time
+            for note in new_notes:
+                self._col.add_note(note, self._deck["id"])
+        if modified_notes:
+            self._col.update_notes(modified_notes)
+        self._merge_undo_entry()
+
+        for key, note in self._pending_notes.items():
+            self._note_index[key] = note.id
+            if self._link_index is not None and note.fields[self._link_index].isdigit():
+                self._linked_notes.setdefault(int(note.fields[self._link_index]), note.id)
+            if self._fingerprint_index is not None:
+                self._fingerprints[note.id] = note.fields[self._fingerprint_index]
+        self._pending_notes.clear()
+        self._pending_keys.clear()
+        if self._on_checkpoint is not None:
+            # The checkpoint must not get ahead of what is in the collection file
+            save_collection(self._col)
+            self._on_checkpoint(self.checkpoint())
+
+    def reconcile(self, source_deck_id: int, source_note_ids: Sequence[int],
+                  delete: bool = False, dry_run: bool = False) -> List[int]:
+        """Tag or delete the conjugation notes whose source note is no longer found
+
+        A note is an orphan when it is linked to a source note which is not among the
+        notes found in the source deck, and was not reached from any other source note
+        by this updater. Either the source note was deleted or it remains in the source
+        deck without being found (e.g. it was untagged). Notes linked to a source note
+        which has moved to another deck are left alone, since that deck may be the
+        source of another update. The search must not have been incremental.
+
+        Parameters
+        ----------
+        source_deck_id : int
+            ID of the deck which was searched for source notes
+        source_note_ids : Sequence[int]
+            IDs of every source note found in the deck
+        delete : bool
+            Delete the orphans rather than tagging them with `ORPHAN_TAG`. Any notes which
+            were tagged are untagged once they are updated again.
+        dry_run : bool
+            Only report the orphans, leaving them as they are
+
+        Returns
+        -------
+        List[int]
+            IDs of the orphaned conjugation notes
+        """
+        self.flush()
+        if self._note_index is None:
+            self._note_index = self._index_notes()
+        found = set(source_note_ids)
+        candidates = {source_id: note_id for source_id, note_id in self._linked_notes.items()
+                      if source_id not in found and note_id not in self._reached}
+        if not candidates:
+            return []
+
+        candidate_ids = ids2str(candidates)
+        deck_ids = ids2str(self._col.decks.deck_and_child_ids(source_deck_id))
+        remaining = set(self._col.db.list(
+            f"select id from notes where id in {candidate_ids}"))
+        moved = remaining.difference(self._col.db.list(
+            f"select distinct nid from cards where nid in {candidate_ids} "
+            f"and (did in {deck_ids} or odid in {deck_ids})"))
+        orphans = sorted(note_id for source_id, note_id in candidates.items()
+                         if source_id not in moved)
+        if dry_run or not orphans:
+            return orphans
+
+        self._start_undo_entry()
+        if delete:
+            self._col.remove_notes(orphans)
+            orphaned = set(orphans)
+            self._note_index = {key: note_id for key, note_id in self._note_index.items()
+                                if note_id not in orphaned}
+            self._linked_notes = {source_id: note_id
+                                  for source_id, note_id in self._linked_notes.items()
+                                  if note_id not in orphaned}
+        else:
+            self._col.tags.bulk_add(orphans, ORPHAN_TAG)
+        self._merge_undo_entry()
+        return orphans
+
+    def _start_undo_entry(self) -> None:
+        """Create the undo entry that everything written by this updater is merged into"""
+        if self._undoable and self._undo_entry is None:
+            self._undo_entry = self._col.add_custom_undo_entry(
+                f"Update {self._deck['name']}")
+
+    def _merge_undo_entry(self) -> None:
+        """Merge the writes made since the undo entry was created into it"""
+        if self._undoable:
+            self._col.merge_undo_entries(self._undo_entry)
 
     def _expand_note(self, note: anki.notes.Note,
                     forms: List[Tuple[str, Optional[Formality], Form]]) -> None:
@@ -118,11 +790,90 @@ class DeckUpdater: # pylint: disable=R0903
         """
 
         for conjugation, form, formality in forms:
-            field_name = combo_to_field_name(form, formality)
-            if field_name in self._model_field_map:
-                field_index = self._model_field_map[field_name][0]
+            field_index = self._combo_field_indexes.get((formality, form))
+            if field_index is not None:
                 note.fields[field_index] = conjugation
 
+class TagClassMap: # pylint: disable=R0903
+    """Assign notes to kinds of word based on their tags, without searching the collection
+
+    Configured tags are matched the way a `tag:` search matches them: ignoring case,
+    with `*` and `_` as wildcards, and also matching any child tag (e.g. `verb::godan`
+    for `verb`). The kinds of word matched by each distinct note tag are remembered,
+    since a deck only uses a handful of tags across all of its notes.
+
+    Parameters
+    ----------
+    tags_by_type : Dict[Union[VerbClass, AdjectiveClass], List[str]]
+        Configured tags for each kind of word
+    """
+
+    def __init__(self, tags_by_type: Dict[Union[VerbClass, AdjectiveClass], List[str]]):
+        self._patterns = [
+            (word_type, re.compile(
+                '(?:' + '|'.join(_tag_pattern(tag) for tag in tags) + ')(?:::.*)?',
+                re.IGNORECASE | re.DOTALL))
+            for word_type, tags in tags_by_type.items() if tags]
+        self._types_by_tag = {}
+
+    def classes(self, note_tags: List[str]) -> List[Union[VerbClass, AdjectiveClass]]:
+        """Determine which kinds of word a note is tagged as
+
+        Parameters
+        ----------
+        note_tags : List[str]
+            Tags of the note
+
+        Returns
+        -------
+        List[Union[VerbClass, AdjectiveClass]]
+            Every kind of word with a tag matching one of the note's tags, in the
+            order the kinds of word were configured
+        """
+        matched = set()
+        for tag in note_tags:
+            word_types = self._types_by_tag.get(tag)
+            if word_types is None:
+                word_types = frozenset(word_type for word_type, pattern in self._patterns
+                                       if pattern.fullmatch(tag))
+                self._types_by_tag[tag] = word_types
+            matched.update(word_types)
+        return [word_type for word_type, _ in self._patterns if word_type in matched]
+
+def _word_type(value: str) -> Union[VerbClass, AdjectiveClass]:
+    """Identify a kind of word from its value
+
+    Parameters
+    ----------
+    value : str
+        Value of a VerbClass or AdjectiveClass
+
+    Returns
+    -------
+    Union[VerbClass, AdjectiveClass]
+        The kind of word with the value
+    """
+    try:
+        return VerbClass(value)
+    except ValueError:
+        return AdjectiveClass(value)
+
+def _tag_pattern(tag: str) -> str:
+    """Translate a tag, as used in a `tag:` search, into a regular expression
+
+    Parameters
+    ----------
+    tag : str
+        Tag, potentially containing `*` or `_` wildcards
+
+    Returns
+    -------
+    str
+        Regular expression matching the same tags as the search
+    """
+    return ''.join('.*' if char == '*' else '.' if char == '_' else re.escape(char)
+                   for char in tag)
+
 class DeckSearcher:
     """Class for searching a source deck for relevant notes and models
 
@@ -135,13 +886,44 @@ class DeckSearcher:
     config : ConfigManager
         Settings for the Addon, including which tags should be used for identifying
         different kinds of verbs
+    full_rescan : bool
+        Search every note in the deck, even if the deck is configured to only search the
+        notes edited since it was last processed (see `ConfigManager.incremental`)
+    target_deck_id : Optional[int]
+        ID of the deck the conjugation notes are written to. Incremental searches only
+        leave out notes which were processed for this same deck.
     """
 
-    def __init__(self, col: anki.collection.Collection, deck_id: int, config: ConfigManager):
+    def __init__(self, col: anki.collection.Collection, deck_id: int, config: ConfigManager,
+                 full_rescan: bool = False, target_deck_id: Optional[int] = None):
         self._col = col
         self._deck_id = deck_id
+        self._target_deck_id = target_deck_id
         self._deck_name = self._col.decks.get(did=self._deck_id)['name']
         self._cfg = config
+        self._incremental = config.incremental(self._deck_name) and not full_rescan
+
+    @property
+    def incremental(self) -> bool:
+        """Whether searches may leave out notes which were not edited since the watermark"""
+        return self._incremental
+
+    def record_watermark(self, conjugation_model_name: str) -> None:
+        """Record that the notes found so far have been processed
+
+        This should be called once the conjugation notes for everything that was found
+        have been written, so that an incremental search afterwards only finds the notes
+        edited since. The watermark is kept in the config, which must be saved for it to
+        last beyond this session.
+
+        Parameters
+        ----------
+        conjugation_model_name : str
+            Name of the conjugation model the notes were processed for
+        """
+        note_mod = self._col.db.scalar("select max(mod) from notes") or 0
+        self._cfg.set_watermark(self._deck_name, conjugation_model_name, self._target_deck_id,
+                                self._col.mod, note_mod)
 
     def find_verbs(self, conjugation_model_name: str) \
         -> Tuple[Dict[VerbClass, List[int]], List[str]]:
@@ -160,30 +942,7 @@ class DeckSearcher:
             type names that were seen across all of the relevant verb notes.
         """
 
-        results = {}
-        relevant_model_names = set()
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, VerbClass.ICHIDAN), conjugation_model_name)
-        if notes:
-            results[VerbClass.ICHIDAN] = notes
-            relevant_model_names.update(model_names)
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, VerbClass.GODAN), conjugation_model_name)
-        if notes:
-            results[VerbClass.GODAN] = notes
-            relevant_model_names.update(model_names)
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, VerbClass.IRREGULAR), conjugation_model_name)
-        if notes:
-            results[VerbClass.IRREGULAR] = notes
-            relevant_model_names.update(model_names)
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, VerbClass.GENERAL), conjugation_model_name)
-        if notes:
-            results[VerbClass.GENERAL] = notes
-            relevant_model_names.update(model_names)
-
-        return results, list(relevant_model_names)
+        return self.find_words(VERB_CLASSES, conjugation_model_name)
 
     def find_adjectives(self, conjugation_model_name: str) \
         -> Tuple[Dict[AdjectiveClass, List[int]], List[str]]:
@@ -203,25 +962,105 @@ class DeckSearcher:
             adjectives notes.
         """
 
-        results = {}
-        relevant_model_names = set()
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, AdjectiveClass.I), conjugation_model_name)
-        if notes:
-            results[AdjectiveClass.I] = notes
-            relevant_model_names.update(model_names)
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, AdjectiveClass.NA), conjugation_model_name)
-        if notes:
-            results[AdjectiveClass.NA] = notes
-            relevant_model_names.update(model_names)
-        notes, model_names = self.find_notes(
-            self._cfg.get_tags(self._deck_name, AdjectiveClass.GENERAL), conjugation_model_name)
-        if notes:
-            results[AdjectiveClass.GENERAL] = notes
-            relevant_model_names.update(model_names)
-
-        return results, list(relevant_model_names)
+        return self.find_words(ADJECTIVE_CLASSES, conjugation_model_name)
+
+    def find_words(self, word_types: List[Union[VerbClass, AdjectiveClass]],
+                   conjugation_model_name: str) \
+        -> Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]:
+        """Find the notes in the source deck for each kind of word with a single search
+
+        The notes carrying any of the tags configured for the word types are found
+        together, and each note is then assigned to every word type whose tags it
+        carries (so a note tagged as both an ichidan verb and a verb is listed under
+        both).
+
+        Parameters
+        ----------
+        word_types : List[Union[VerbClass, AdjectiveClass]]
+            Kinds of word to be found, in the order they should appear in the results
+        conjugation_model_name : str
+            Name of the conjugation model that should *not* be included in the search results
+
+        Returns
+        -------
+        Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]
+            Two elements. The first element maps each word type with at least one note
+            to the IDs of those notes. The second element is a list of model names that
+            were seen across the identified notes.
+        """
+        tags_by_type = {word_type: self._cfg.get_tags(self._deck_name, word_type)
+                        for word_type in word_types}
+        all_tags = list(dict.fromkeys(tag for tags in tags_by_type.values() for tag in tags))
+        note_ids = self._search(all_tags, conjugation_model_name)
+        if not note_ids:
+            return {}, []
+        return self._classify(note_ids, word_types, TagClassMap(tags_by_type))
+
+    def iter_words(self, word_types: List[Union[VerbClass, AdjectiveClass]],
+                   conjugation_model_name: str, chunk_size: int = WORD_CHUNK_SIZE) \
+        -> Iterator[Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]]:
+        """Find the notes in the source deck for each kind of word, a chunk at a time
+
+        This is the streaming counterpart of `find_words`. The notes are searched for in
+        the same way, but are read and assigned to word types a chunk at a time, in
+        order of note ID, so that only a chunk of notes is held at once besides their IDs.
+
+        Parameters
+        ----------
+        word_types : List[Union[VerbClass, AdjectiveClass]]
+            Kinds of word to be found, in the order they should appear in the results
+        conjugation_model_name : str
+            Name of the conjugation model that should *not* be included in the search results
+        chunk_size : int
+            Number of notes in each chunk
+
+        Yields
+        ------
+        Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]
+            The results of `find_words` for each chunk of notes
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive. Found {chunk_size}.")
+        tags_by_type = {word_type: self._cfg.get_tags(self._deck_name, word_type)
+                        for word_type in word_types}
+        all_tags = list(dict.fromkeys(tag for tags in tags_by_type.values() for tag in tags))
+        note_ids = sorted(self._search(all_tags, conjugation_model_name))
+        tag_map = TagClassMap(tags_by_type)
+        for start in range(0, len(note_ids), chunk_size):
+            yield self._classify(note_ids[start:start + chunk_size], word_types, tag_map)
+
+    def _classify(self, note_ids: Sequence[int],
+                  word_types: List[Union[VerbClass, AdjectiveClass]], tag_map: TagClassMap) \
+        -> Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]:
+        """Assign notes to the kinds of word whose tags they carry
+
+        Parameters
+        ----------
+        note_ids : Sequence[int]
+            IDs of the notes to be assigned
+        word_types : List[Union[VerbClass, AdjectiveClass]]
+            Kinds of word the notes may be assigned to, in the order they should appear in
+            the results
+        tag_map : TagClassMap
+            Tags identifying each kind of word
+
+        Returns
+        -------
+        Tuple[Dict[Union[VerbClass, AdjectiveClass], List[int]], List[str]]
+            The results of `find_words` for the notes
+        """
+        note_rows = {nid: (mid, tags) for nid, mid, tags in self._col.db.all(
+            f"select id, mid, tags from notes where id in {ids2str(note_ids)}")}
+        results = {word_type: [] for word_type in word_types}
+        model_ids = set()
+        for nid in note_ids:
+            mid, tags = note_rows[nid]
+            model_ids.add(mid)
+            for word_type in tag_map.classes(tags.split()):
+                results[word_type].append(nid)
+
+        model_names = [self._col.models.get(mid)['name'] for mid in model_ids]
+        return {word_type: nids for word_type, nids in results.items() if nids}, model_names
 
     def find_notes(self, tags: List[str], conjugation_model_name: str) \
         -> Tuple[List[int], List[str]]:
@@ -241,9 +1080,43 @@ class DeckSearcher:
             of the specified tags. The second element is a list of model names that were
             seen across the identified notes.
         """
+        note_ids = self._search(tags, conjugation_model_name)
+        if not note_ids:
+            return [], []
+
+        model_ids = self._col.db.list(
+            f"select distinct mid from notes where id in {ids2str(note_ids)}")
+        model_names = [self._col.models.get(mid)['name'] for mid in model_ids]
+
+        return list(note_ids), model_names
+
+    def _search(self, tags: List[str], conjugation_model_name: str) -> Sequence[int]:
+        """Search the source deck for notes with at least one of the specified tags
+
+        Parameters
+        ----------
+        tags : List[str]
+            Tags to be used to find relevant notes in the source deck
+        conjugation_model_name : str
+            Name of the conjugation model that should *not* be included in the search results
+
+        Returns
+        -------
+        Sequence[int]
+            IDs of the matching notes, leaving out unseen notes unless the deck allows them.
+            In incremental mode, notes not edited since the watermark are left out too.
+        """
         allow_unseen = self._cfg.allow_unseen(self._deck_name)
         if len(tags) == 0:
-            return [], []
+            return []
+
+        watermark = None
+        if self._incremental:
+            watermark = self._cfg.get_watermark(self._deck_name, conjugation_model_name,
+                                                self._target_deck_id)
+            if watermark is not None and watermark[0] == self._col.mod:
+                # Nothing at all has changed in the collection
+                return []
 
         if len(tags) > 1:
             tag_query = "(" + " OR ".join(f"tag:{escape_query(tag_str)}" for tag_str in tags) + ")"
@@ -251,21 +1124,40 @@ class DeckSearcher:
             tag_query = f"tag:{escape_query(tags[0])}"
         query = f'{tag_query} "deck:{escape_query(self._deck_name)}" ' +\
             f'-"note:{escape_query(conjugation_model_name)}"'
+        if not allow_unseen:
+            # A note has been seen if any one of its cards has been reviewed
+            query += ' prop:reps>0'
         note_ids = self._col.find_notes(query)
+        if watermark is None or not note_ids:
+            return note_ids
+        return self._edited_since(note_ids, watermark[1], not allow_unseen)
 
-        filtered_notes = set()
-        model_ids = set()
-        for nid in note_ids:
-            seen = False
-            for card_id in self._col.find_cards(f"nid:{nid}"):
-                card = self._col.get_card(card_id)
-                if card.reps > 0:
-                    seen = True
-            if allow_unseen or seen:
-                filtered_notes.add(nid)
-                note = self._col.get_note(nid)
-                model_ids.add(note.mid)
+    def _edited_since(self, note_ids: Sequence[int], note_mod: int, reviews: bool) \
+        -> List[int]:
+        """Narrow down notes to those edited since a point in time
 
-        model_names = [self._col.models.get(mid)['name'] for mid in model_ids]
+        Parameters
+        ----------
+        note_ids : Sequence[int]
+            IDs of the notes to be narrowed down
+        note_mod : int
+            Modification time (in seconds) from which notes count as edited. Notes edited
+            during that second are included, since they may have been edited after the
+            time was recorded.
+        reviews : bool
+            Whether a change to any of the cards of a note (e.g. its first review) also
+            counts as an edit, for when unseen notes are left out
 
-        return list(filtered_notes), model_names
+        Returns
+        -------
+        List[int]
+            IDs of the edited notes, in their original order
+        """
+        id_list = ids2str(note_ids)
+        edited = set(self._col.db.list(
+            f"select id from notes where id in {id_list} and mod >= ?", note_mod))
+        if reviews:
+            edited.update(self._col.db.list(
+                f"select distinct nid from cards where nid in {id_list} and mod >= ?",
+                note_mod))
+        return [nid for nid in note_ids if nid in edited]
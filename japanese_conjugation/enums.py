@@ -1,6 +1,6 @@
 """Various enumerated objects for use throughout the rest of the module"""
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple, Type
 
 class Form(Enum):
     """Enumeration of known conjugation forms
@@ -114,6 +114,14 @@ class VerbClass(Enum):
     IRREGULAR = 'irregular'
     GENERAL = 'general-verb'
 
+class IrregularKind(Enum):
+    """Enumeration of the irregular verb endings which need special handling"""
+    SURU = 'suru'
+    KURU = 'kuru'
+    IKU = 'iku'
+    ARU = 'aru'
+    HONORIFIC = 'honorific'
+
 class AdjectiveClass(Enum):
     """Enumeration of known adjective types"""
     NA = 'na-adjective'
@@ -137,40 +145,19 @@ class Gyo(Enum):
     """Base enum class for gyo rows of a gyojuon table"""
 
     @staticmethod
-    def identify(input_str: str): # pylint: disable=R0912
-        """Identify the correct Gyo and return the approprite subclass"""
+    def identify(input_str: str):
+        """Identify the correct Gyo and return the approprite subclass
+
+        Hiragana, katakana, and the small kana (e.g. ぁ, ッ) are all supported. None is
+        returned for any other character.
+        """
         if len(input_str) != 1:
             raise ValueError("Gyo.identify() input must be a single character")
 
-        return_value = None
-        if input_str in ("あいうえお"):
-            return_value = AGyo
-        elif input_str in ("かきくけこ"):
-            return_value = KaGyo
-        elif input_str in ("がぎぐげご"):
-            return_value = GaGyo
-        elif input_str in ("さしすせそ"):
-            return_value = SaGyo
-        elif input_str in ("ざじずぜぞ"):
-            return_value = ZaGyo
-        elif input_str in ("たちつてと"):
-            return_value = TaGyo
-        elif input_str in ("だぢづでど"):
-            return_value = DaGyo
-        elif input_str in ("なにぬねの"):
-            return_value = NaGyo
-        elif input_str in ("はひふへほ"):
-            return_value = HaGyo
-        elif input_str in ("ばびぶべぼ"):
-            return_value = BaGyo
-        elif input_str in ("ぱぴぷぺぽ"):
-            return_value = PaGyo
-        elif input_str in ("まみむめも"):
-            return_value = MaGyo
-        elif input_str in ("らりるれろ"):
-            return_value = RaGyo
-
-        return return_value
+        position = KANA_POSITIONS.get(input_str)
+        if position is None:
+            return None
+        return position[0]
 
     @classmethod
     def dan(cls, target: Dan) -> str:
@@ -186,7 +173,7 @@ class Gyo(Enum):
         str:
             String of the specified dan for this gyo
         """
-        return getattr(cls, target.name).value
+        return KANA_GRID[cls][target]
 
 class AGyo(Gyo):
     """A Gyo enum"""
@@ -291,3 +278,38 @@ class RaGyo(Gyo):
     U = "る"
     E = "れ"
     O = "ろ"
+
+GYO_ROWS = (AGyo, KaGyo, GaGyo, SaGyo, ZaGyo, TaGyo, DaGyo, NaGyo, HaGyo, BaGyo, PaGyo,
+            MaGyo, RaGyo)
+
+# The gyojuon table, indexed by row and then by dan
+KANA_GRID = {gyo: {dan: gyo[dan.name].value for dan in Dan} for gyo in GYO_ROWS}
+
+# Small kana and the kana whose position in the table they share
+SMALL_KANA = {
+    "ぁ": "あ", "ぃ": "い", "ぅ": "う", "ぇ": "え", "ぉ": "お",
+    "ゕ": "か", "ゖ": "け", "っ": "つ",
+}
+
+# Katakana are offset from the matching hiragana by a fixed distance in unicode
+KATAKANA_OFFSET = ord("ア") - ord("あ")
+
+def _kana_positions() -> Dict[str, Tuple[Type[Gyo], Dan]]:
+    """Locate every supported kana in the gyojuon table
+
+    Returns
+    -------
+    Dict[str, Tuple[Type[Gyo], Dan]]
+        Mapping from hiragana, katakana, and small kana to their row and dan
+    """
+    positions = {}
+    for gyo, row in KANA_GRID.items():
+        for dan, kana in row.items():
+            positions[kana] = (gyo, dan)
+    for small, kana in SMALL_KANA.items():
+        positions[small] = positions[kana]
+    for kana in list(positions):
+        positions[chr(ord(kana) + KATAKANA_OFFSET)] = positions[kana]
+    return positions
+
+KANA_POSITIONS = _kana_positions()
@@ -142,6 +142,15 @@ ADJECTIVE_COMBOS = [
     (Formality.PLAIN, Form.PAST_NEG)
 ]
 
+# Bookkeeping fields which follow the conjugation fields. None of the card templates
+# display them.
+HIDDEN_FIELDS = [
+    # Inputs the note was generated from (see DeckUpdater.fingerprint)
+    'Fingerprint',
+    # ID of the source note the note was generated from
+    'SourceNoteId',
+]
+
 def combo_to_field_name(form: Form, formality: Union[Formality, None]) -> str:
     """Using the form and formality, generate a formatted name suitable for labeling a field
 
@@ -482,7 +491,8 @@ def get_fields_and_templates(
     Returns
     -------
     Tuple[List[str], List[Dict[str, str]]]
-        Returns a tuple of the list of field names and a list of templates for cards
+        Returns a tuple of the list of field names and a list of templates for cards.
+        The fields end with the `HIDDEN_FIELDS`.
     """
 
     fields = []
@@ -504,4 +514,5 @@ def get_fields_and_templates(
                 "afmt": _resolve_placeholders(back_template, subs)
             }
         )
+    fields.extend(HIDDEN_FIELDS)
     return fields, templates
@@ -1,5 +1,295 @@
 """Miscellaneous utilities that don't otherwise have a good home"""
-import re
+import hashlib
+import os
+import sys
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .enums import Form, Formality
+
+try:
+    import resource
+except ImportError: # e.g. on Windows
+    resource = None
+
+# Smallest number of items handed to a worker process at once. Conjugating a word takes
+# tens of microseconds, so smaller chunks spend more time pickling than conjugating.
+MIN_BATCH_CHUNK_SIZE = 256
+
+# Number of hexadecimal characters kept from the hashes produced by `digest`
+DIGEST_LENGTH = 12
+
+class ConjugationError(Exception):
+    """A form which applies to a word could not be produced for it
+
+    Parameters
+    ----------
+    reading : str
+        Dictionary form of the word being conjugated
+    form : Form
+        Form which was being produced
+    formality : Optional[Formality]
+        Formality of the form which was being produced
+    """
+
+    def __init__(self, reading: str, form: Form, formality: Optional[Formality]):
+        super().__init__(reading, form, formality)
+        self.reading = reading
+        self.form = form
+        self.formality = formality
+
+    def __str__(self) -> str:
+        label = self.form.label()
+        if self.formality is not None:
+            label = f"{self.formality.value} {label}"
+        return f"Unable to conjugate '{self.reading}' into the {label} form"
+
+class FuriganaSegments: # pylint: disable=R0903
+    """Reading text split once into plain and furigana-annotated segments
+
+    Furigana markup follows the Anki convention of `漢字[かんじ]`, where the annotated
+    text runs back to the previous space (or the start of the text) and that space is
+    only a separator. Each segment is a (base, reading) tuple, with a reading of None for
+    text without furigana.
+
+    Parameters
+    ----------
+    reading : str
+        Input string which potentially contains furigana markup
+
+    Attributes
+    ----------
+    segments : Tuple[Tuple[str, Optional[str]], ...]
+        The segments of the text, in order
+    base : str
+        The text with all furigana markup removed
+    kana : str
+        The text with any annotated text replaced by its furigana
+    """
+    __slots__ = ('segments', 'base', 'kana')
+
+    def __init__(self, reading: str):
+        segments = []
+        plain_start = 0
+        start = 0
+        while start != -1:
+            # An annotation can only begin at the start of the text or at a space
+            base_start = start + 1 if reading[start:start + 1] == ' ' else start
+            annotation = _find_annotation(reading, base_start)
+            if annotation is None:
+                start = reading.find(' ', start + 1)
+                continue
+
+            open_bracket, close_bracket = annotation
+            if start > plain_start:
+                segments.append((reading[plain_start:start], None))
+            segments.append((reading[base_start:open_bracket],
+                             reading[open_bracket + 1:close_bracket]))
+            plain_start = close_bracket + 1
+            start = reading.find(' ', plain_start)
+        if plain_start < len(reading):
+            segments.append((reading[plain_start:], None))
+
+        self.segments = tuple(segments)
+        self.base = ''.join(base for base, _ in segments)
+        self.kana = ''.join(base if kana is None else kana for base, kana in segments)
+
+    def endswith(self, suffix: Union[str, Tuple[str, ...]], kana: bool = False) -> bool:
+        """Check the ending of the text without its furigana markup
+
+        Parameters
+        ----------
+        suffix : Union[str, Tuple[str, ...]]
+            Ending (or endings) to check for
+        kana : bool
+            Check the text with furigana promoted rather than removed
+
+        Returns
+        -------
+        bool
+            True if the text ends with (any of) the suffix
+        """
+        return (self.kana if kana else self.base).endswith(suffix)
+
+def _find_annotation(reading: str, base_start: int) -> Optional[Tuple[int, int]]:
+    """Find the furigana annotating the text beginning at `base_start`
+
+    The annotated text extends as far as possible without crossing whitespace, so the
+    last well-formed `[...]` of the word is the annotation.
+
+    Parameters
+    ----------
+    reading : str
+        Input string which potentially contains furigana markup
+    base_start : int
+        Index at which the annotated text would begin
+
+    Returns
+    -------
+    Optional[Tuple[int, int]]
+        Indices of the opening and closing brackets, or None if there is no annotation
+    """
+    base_end = base_start
+    while base_end < len(reading) and not reading[base_end].isspace():
+        base_end += 1
+
+    open_bracket = reading.rfind('[', base_start + 1, base_end)
+    while open_bracket != -1:
+        close_bracket = reading.find(']', open_bracket + 1)
+        if close_bracket > open_bracket + 1:
+            return open_bracket, close_bracket
+        open_bracket = reading.rfind('[', base_start + 1, open_bracket)
+    return None
+
+@lru_cache(maxsize=4096)
+def parse_furigana(reading: str) -> FuriganaSegments:
+    """Split a reading into furigana segments, reusing recent results
+
+    Parameters
+    ----------
+    reading : str
+        Input string which potentially contains furigana markup
+
+    Returns
+    -------
+    FuriganaSegments
+        The parsed reading
+    """
+    return FuriganaSegments(reading)
+
+@dataclass(frozen=True)
+class FuriganaString:
+    """Immutable text with furigana, edited by segment rather than by markup offsets
+
+    Operations work on the last unit of the text, which is either the last character
+    of plain text or the whole of the last annotated text (e.g. 来[く]). Markup is only
+    produced when the string is converted with `str`, with the separating spaces that
+    Anki requires in front of annotated text.
+
+    Parameters
+    ----------
+    segments : Tuple[Tuple[str, Optional[str]], ...]
+        (base, reading) segments, with a reading of None for text without furigana
+    """
+    segments: Tuple[Tuple[str, Optional[str]], ...] = ()
+
+    @classmethod
+    def from_markup(cls, reading: str) -> 'FuriganaString':
+        """Parse Anki furigana markup
+
+        Parameters
+        ----------
+        reading : str
+            Input string which potentially contains furigana markup
+
+        Returns
+        -------
+        FuriganaString
+            The parsed reading
+        """
+        segments = parse_furigana(reading).segments
+        if reading.startswith(' ') and segments and segments[0][1] is not None:
+            # keep the leading separator so that the markup is reproduced exactly
+            segments = (('', None),) + segments
+        return cls(segments)
+
+    def __str__(self) -> str:
+        parts = []
+        for index, (base, reading) in enumerate(self.segments):
+            if reading is None:
+                parts.append(base)
+            else:
+                parts.append(f"{' ' if index else ''}{base}[{reading}]")
+        return ''.join(parts)
+
+    @property
+    def base(self) -> str:
+        """The text with all furigana removed"""
+        return ''.join(base for base, _ in self.segments)
+
+    @property
+    def kana(self) -> str:
+        """The text with any annotated text replaced by its furigana"""
+        return ''.join(base if kana is None else kana for base, kana in self.segments)
+
+    def drop_last(self, count: int = 1) -> 'FuriganaString':
+        """Remove units from the end of the text
+
+        Parameters
+        ----------
+        count : int
+            Number of units to remove
+
+        Returns
+        -------
+        FuriganaString
+            The shortened text
+        """
+        segments = list(self.segments)
+        while count > 0 and segments:
+            base, reading = segments.pop()
+            if reading is None and len(base) > count:
+                segments.append((base[:-count], None))
+                break
+            count -= 1 if reading is not None else len(base)
+        return FuriganaString(tuple(segments))
+
+    def append(self, kana: str) -> 'FuriganaString':
+        """Add text without furigana to the end of the text
+
+        Parameters
+        ----------
+        kana : str
+            Text to be added
+
+        Returns
+        -------
+        FuriganaString
+            The extended text
+        """
+        if not kana:
+            return self
+        if self.segments and self.segments[-1][1] is None:
+            return FuriganaString(self.segments[:-1] + ((self.segments[-1][0] + kana, None),))
+        return FuriganaString(self.segments + ((kana, None),))
+
+    def replace_last(self, kana: str) -> 'FuriganaString':
+        """Replace the last unit of the text
+
+        Parameters
+        ----------
+        kana : str
+            Text without furigana to take the place of the last unit
+
+        Returns
+        -------
+        FuriganaString
+            The modified text
+        """
+        return self.drop_last().append(kana)
+
+    def annotate_last(self, reading: str) -> 'FuriganaString':
+        """Set the furigana of the last unit of the text
+
+        Parameters
+        ----------
+        reading : str
+            Furigana for the last unit
+
+        Returns
+        -------
+        FuriganaString
+            The modified text, with the last unit annotated by `reading`
+        """
+        if not self.segments:
+            return self
+        base, _ = self.segments[-1]
+        if self.segments[-1][1] is not None:
+            return FuriganaString(self.segments[:-1] + ((base, reading),))
+        return FuriganaString(self.drop_last().segments + ((base[-1], reading),))
 
 def remove_furigana(reading: str) -> str:
     """Remove the furigana markup from a reading text
@@ -14,8 +304,7 @@ def remove_furigana(reading: str) -> str:
     str
         Input string with all furigana markup removed
     """
-    # import pdb; pdb.set_trace()
-    return re.sub(r"(^| )(\S+)(\[[^\]]+\])", r"\2", reading, flags=re.UNICODE)
+    return parse_furigana(reading).base
 
 def promote_furigana(reading: str) -> str:
     """Promote furigana markup such that it replaces the associated text
@@ -31,8 +320,7 @@ def promote_furigana(reading: str) -> str:
         Input string modified such that furigana markup is used to replace
         any corresponding text
     """
-
-    return re.sub(r"(^| )(\S+)\[([^\]]+)\]", r"\3", reading, flags=re.UNICODE)
+    return parse_furigana(reading).kana
 
 def escape_query(raw_input: str) -> str:
     """Escape a raw string input so that it can be included in a query
@@ -48,3 +336,152 @@ def escape_query(raw_input: str) -> str:
         Input string modified such that it can be used safely in a collection search
     """
     return raw_input.replace('\\', r'\\').replace(r'"', r'\"')
+
+def digest(*values: Any) -> str:
+    """Summarize some values as a short string which is the same in every session
+
+    Parameters
+    ----------
+    values
+        Strings, numbers, enums, and (nested) tuples or lists of them. Their `repr` must
+        not vary between sessions, so sets and objects without a custom `repr` are not
+        suitable.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash of the values
+    """
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()[:DIGEST_LENGTH]
+
+def batch_chunk_size(item_count: int, workers: int) -> int:
+    """Determine how many items to send to a worker process at a time
+
+    Parameters
+    ----------
+    item_count : int
+        Total number of items to be processed
+    workers : int
+        Number of worker processes
+
+    Returns
+    -------
+    int
+        Chunk size giving each worker roughly four chunks, so that the work stays
+        balanced, without dropping below `MIN_BATCH_CHUNK_SIZE`
+    """
+    return max(MIN_BATCH_CHUNK_SIZE, -(-item_count // (workers * 4)))
+
+def batch_map(func: Callable[..., Any], args_list: Sequence[Tuple], workers: Optional[int] = 1,
+              chunk_size: Optional[int] = None) -> List[Any]:
+    """Apply a function to each set of arguments, optionally across worker processes
+
+    Parameters
+    ----------
+    func : Callable
+        Module-level (i.e. picklable) function to be applied
+    args_list : Sequence[Tuple]
+        Positional arguments for each call to `func`. These must be hashable, as
+        repeated arguments are only computed once.
+    workers : Optional[int]
+        Number of worker processes. None uses every available CPU. With a single
+        worker, or too few items to fill more than one chunk, the work is done in
+        the current process.
+    chunk_size : Optional[int]
+        Number of items sent to a worker at a time. Determined by `batch_chunk_size`
+        if not provided.
+
+    Returns
+    -------
+    List[Any]
+        Results of `func`, in the same order as `args_list`
+    """
+    unique_args = list(dict.fromkeys(args_list))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = batch_chunk_size(len(unique_args), workers)
+
+    if workers <= 1 or len(unique_args) <= chunk_size:
+        unique_results = [func(*args) for args in unique_args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            unique_results = list(executor.map(func, *zip(*unique_args), chunksize=chunk_size))
+
+    results = dict(zip(unique_args, unique_results))
+    return [results[args] for args in args_list]
+
+def pipeline_map(func: Callable[..., Any], chunks: Iterable[Tuple[Any, Tuple]],
+                 workers: Optional[int] = 1, max_pending: Optional[int] = None) \
+    -> Iterator[Tuple[Any, Any]]:
+    """Apply a function to chunks of work in worker processes while the caller consumes
+    the results
+
+    Chunks are only drawn from `chunks` as there is room for them, and each result is
+    handed back to the caller as soon as it is the oldest one outstanding, so producing
+    the chunks, computing the results, and consuming them all overlap. Producing and
+    consuming both happen in the calling thread.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to be applied. It must be module-level (i.e. picklable) unless the work
+        is done in the current process.
+    chunks : Iterable[Tuple[Any, Tuple]]
+        Pairs of a context, which is handed back with the result without being sent to a
+        worker, and the positional arguments for `func`
+    workers : Optional[int]
+        Number of worker processes. None uses every available CPU. With a single worker,
+        the work is done in the current process.
+    max_pending : Optional[int]
+        Most chunks sent to the workers without their results having been consumed,
+        which bounds the memory used. Defaults to twice the number of workers, so that
+        the workers stay busy while the oldest result is consumed.
+
+    Yields
+    ------
+    Tuple[Any, Any]
+        The context and the result of `func` for each chunk, in the order of `chunks`
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for context, args in chunks:
+            yield context, func(*args)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for context, args in chunks:
+            pending.append((context, executor.submit(func, *args)))
+            if len(pending) >= max_pending:
+                context, future = pending.popleft()
+                yield context, future.result()
+        while pending:
+            context, future = pending.popleft()
+            yield context, future.result()
+
+def peak_memory(children: bool = False) -> Optional[int]:
+    """Determine the most memory the current process has held at once
+
+    Parameters
+    ----------
+    children : bool
+        Report the most memory held by any one of the finished child processes (e.g. the
+        worker processes of `pipeline_map`) instead of the current process
+
+    Returns
+    -------
+    Optional[int]
+        Peak resident set size in bytes, or None if the platform does not report it
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    if sys.platform != 'darwin':
+        # Reported in kilobytes everywhere but macOS
+        peak *= 1024
+    return peak
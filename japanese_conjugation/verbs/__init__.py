@@ -1,13 +1,13 @@
 """Methods pertaining to the conjugation of verbs"""
-from typing import Optional, List, Tuple
+from functools import partial
+from typing import Iterable, Iterator, Optional, List, Sequence, Tuple
 
-from ..enums import Dan, Form, Formality, Gyo, VerbClass, AdjectiveClass
+from ..enums import Dan, Form, Formality, Gyo, VerbClass
 from ..util import (
-    remove_furigana,
-    promote_furigana
+    parse_furigana,
+    batch_map,
+    digest
 )
-from ..adjectives import generate_adjective_forms
-
 from .stems import masu_stem
 
 from .plain import (
@@ -69,6 +69,12 @@ from .causative_passive import (
     plain_past_negative_causative_passive,
 )
 from .te import te
+from .tai import tai_forms
+from .engine import iter_conjugations, rules_version
+from .exceptions import ExceptionIndex
+
+# Endings (with furigana removed) which mark a verb as irregular
+IRREGULAR_VERB_ENDINGS = ("する", "くる", "来る", "しゃる", "なさる", "下さる")
 
 GODAN_STEM_ENDINGS = set(["う", "く", "す", "つ", "ぬ", "ふ", "む", "る", "ぐ", "ず", "ぶ", "ぷ"])
 
@@ -78,17 +84,14 @@ GODAN_STEM_ENDINGS = set(["う", "く", "す", "つ", "ぬ", "ふ", "む", "る"
 iru_exceptions = [
     '油ぎる', '脂ぎる', 'あぶらぎる',
     'びびる',
-    '打っ千切る', 'ぶっちぎる', # *
     '千切る', 'ちぎる',
     '契る', 'ちぎる', # *
     '散る', 'ちる',
     'どじる',
     '愚痴る', 'ぐちる',
-    '引きちぎる', '引き千切る', 'ひきちぎる', # *
     '入る', 'はいる',
     '走る', 'はしる',
     '穿る', # This has an ichidan homophone, therefore hiragana not included
-    '褒めちぎる', '誉めちぎる', 'ほめちぎる', # *
     '迸る', 'ほとばしる',
     'いびる',
     '弄る', 'いじる',
@@ -104,8 +107,6 @@ iru_exceptions = [
     ## end いる homophones
     '限る', 'かぎる',
     '噛る', 'かじる',
-    '嚙み千切る', 'かみちぎる', # *
-    '食いちぎる', '食千切る', 'くいちぎる', # *
     '切る', # Due to the common ichidan homophone 着る[きる], do not include the hiragana here
     '軋る', '轢る', '輾る', 'きしる',
     '抉じる', 'こじる',
@@ -145,17 +146,6 @@ eru_exceptions = [
     '滑る', 'ぬめる',
     '阿る', '阿ねる', 'おもねる',
     '競る', '糶る', 'せる',
-    '迫る','せまる', #*
-    '押し迫る', 'おしせまる', #*
-    '追い迫る', 'おいせまる', #*
-    '差し迫る', 'さしせまる', #*
-    '鬼気迫る', 'ききせまる', #*
-    '真に迫る', 'しんにせまる', #*
-    '旦夕に迫る', 'たんせきにせまる', #*
-    '真実に迫る', 'しんじつにせまる', #*
-    '辞職を迫る', 'じしょくをせまる', #*
-    '万感胸に迫る', 'ばんかんむねにせまる', #*
-    '命旦夕に迫る', 'めいたんせきにせまる', #*
     '挵る', 'せせる',
     '喋る', 'しゃべる',
     '茂る', '繁る', '滋る', 'しげる',
@@ -168,9 +158,72 @@ eru_exceptions = [
     '畝る', 'うねる',
     '蘇る', '甦る', 'よみがえる'
 ]
-ICHIDAN_EXCEPTIONS = iru_exceptions + eru_exceptions
+# Exceptions which also cover any compound built on top of them, such as 引き千切る,
+# 褒めちぎる, 押し迫る, or 辞職を迫る
+compound_exceptions = [
+    '千切る', 'ちぎる', # *
+    '迫る', 'せまる', # *
+]
+ICHIDAN_EXCEPTIONS = iru_exceptions + eru_exceptions + compound_exceptions
+ICHIDAN_EXCEPTION_INDEX = ExceptionIndex(ICHIDAN_EXCEPTIONS, compound_exceptions)
+
+COPULA_FORMS = [
+    ['です', Form.NON_PAST, Formality.POLITE],
+    ['じゃないです', Form.NON_PAST_NEG, Formality.POLITE],
+    ['でした', Form.PAST, Formality.POLITE],
+    ['ませんでした', Form.PAST_NEG, Formality.POLITE],
+    ['でしょう', Form.VOLITIONAL, Formality.POLITE],
+    ['だ', Form.NON_PAST, Formality.PLAIN],
+    ['じゃない', Form.NON_PAST_NEG, Formality.PLAIN],
+    ['だった', Form.PAST, Formality.PLAIN],
+    ['なかった', Form.PAST_NEG, Formality.PLAIN],
+    ['だろう', Form.VOLITIONAL, Formality.PLAIN],
+    ['で', Form.TE, None],
+]
+COPULA_RULES_VERSION = digest(COPULA_FORMS)
+
+def iter_verb_forms(dictionary_form: str, verb_class: VerbClass,
+                    forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None)\
+    -> Iterator[Tuple[str, Form, Optional[Formality]]]:
+    """Lazily generate the requested conjugations for the provided verb
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed
+    forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations (as in `models.VERB_COMBOS`) to be generated. Only
+        these conjugations are computed. All known conjugations are generated if not
+        provided.
+
+    Yields
+    ------
+    Tuple
+        The conjugation (string), Form, and Formality. Note that for the Te form,
+        the formality will be provided as None. Conjugations are always produced in the
+        order of `generate_verb_forms`, regardless of the order of `forms`.
+    """
+    if not any(dictionary_form.endswith(ending) for ending in GODAN_STEM_ENDINGS):
+        # If this doesn't look like a verb, don't try to conjugate it
+        return
+
+    combos = None if forms is None else frozenset(forms)
 
-def generate_verb_forms(dictionary_form: str, verb_class: VerbClass)\
+    if verb_class == VerbClass.GENERAL:
+        verb_class = classify_verb(dictionary_form)
+
+    if dictionary_form == "です":
+        for conjugation, form, formality in COPULA_FORMS:
+            if combos is None or (formality, form) in combos:
+                yield [conjugation, form, formality]
+        return
+
+    yield from iter_conjugations(dictionary_form, verb_class, combos)
+
+def generate_verb_forms(dictionary_form: str, verb_class: VerbClass,
+                        forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] = None)\
     -> List[Tuple[str, Form, Optional[Formality]]]:
     """Generate the known conjugations for the provided verb
 
@@ -180,132 +233,82 @@ def generate_verb_forms(dictionary_form: str, verb_class: VerbClass)\
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of verb to guide how conjugation should be performed
+    forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations to be generated. All known conjugations are
+        generated if not provided.
 
     Returns
     -------
     List of tuples
         Each tuple is the conjugation (string), Form, and Formality. Note that for the Te form,
-        the formality will be provided as None
+        the formality will be provided as None. Forms which do not apply to the verb's
+        class and ending are left out.
+
+    Raises
+    ------
+    ConjugationError
+        If a form which applies to the verb could not be produced
+    """
+    return list(iter_verb_forms(dictionary_form, verb_class, forms))
+
+def verb_rules_version(dictionary_form: str, verb_class: VerbClass) -> str:
+    """Identify the version of the rules used to conjugate a verb
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed
+
+    Returns
+    -------
+    str
+        Version which changes whenever the output of `generate_verb_forms` for the verb
+        would change, including when a general verb would be classified differently.
+        This is far cheaper than conjugating the verb.
     """
     if not any(dictionary_form.endswith(ending) for ending in GODAN_STEM_ENDINGS):
-        # If this doesn't look like a verb, don't try to conjugate it
-        return []
+        return ''
 
     if verb_class == VerbClass.GENERAL:
         verb_class = classify_verb(dictionary_form)
 
     if dictionary_form == "です":
-        results = [
-            ['です', Form.NON_PAST, Formality.POLITE],
-            ['じゃないです', Form.NON_PAST_NEG, Formality.POLITE],
-            ['でした', Form.PAST, Formality.POLITE],
-            ['ませんでした', Form.PAST_NEG, Formality.POLITE],
-            ['でしょう', Form.VOLITIONAL, Formality.POLITE],
-            ['だ', Form.NON_PAST, Formality.PLAIN],
-            ['じゃない', Form.NON_PAST_NEG, Formality.PLAIN],
-            ['だった', Form.PAST, Formality.PLAIN],
-            ['なかった', Form.PAST_NEG, Formality.PLAIN],
-            ['だろう', Form.VOLITIONAL, Formality.PLAIN],
-            ['で', Form.TE, None],
-        ]
-        return results
-
-    results = []
-    all_forms = [
-        [polite_nonpast_positive, Form.NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative, Form.NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive, Form.PAST, Formality.POLITE],
-        [polite_past_negative, Form.PAST_NEG, Formality.POLITE],
-        [polite_volitional, Form.VOLITIONAL, Formality.POLITE],
-
-        # Plain forms
-        [plain_nonpast_positive, Form.NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative, Form.NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive, Form.PAST, Formality.PLAIN],
-        [plain_past_negative, Form.PAST_NEG, Formality.PLAIN],
-        [plain_volitional, Form.VOLITIONAL, Formality.PLAIN],
-
-        # formality-constant
-        [te, Form.TE, None],
-
-        # Polite Potential
-        [polite_nonpast_positive_potential, Form.POTENTIAL_NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative_potential, Form.POTENTIAL_NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive_potential, Form.POTENTIAL_PAST, Formality.POLITE],
-        [polite_past_negative_potential, Form.POTENTIAL_PAST_NEG, Formality.POLITE],
-
-        # Plain Potential
-        [plain_nonpast_positive_potential, Form.POTENTIAL_NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative_potential, Form.POTENTIAL_NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive_potential, Form.POTENTIAL_PAST, Formality.PLAIN],
-        [plain_past_negative_potential, Form.POTENTIAL_PAST_NEG, Formality.PLAIN],
-
-        # formality-constant
-        [te_potential, Form.POTENTIAL_TE, None],
-
-        # Polite Passive
-        [polite_nonpast_positive_passive, Form.PASSIVE_NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative_passive, Form.PASSIVE_NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive_passive, Form.PASSIVE_PAST, Formality.POLITE],
-        [polite_past_negative_passive, Form.PASSIVE_PAST_NEG, Formality.POLITE],
-
-        # Plain Passive
-        [plain_nonpast_positive_passive, Form.PASSIVE_NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative_passive, Form.PASSIVE_NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive_passive, Form.PASSIVE_PAST, Formality.PLAIN],
-        [plain_past_negative_passive, Form.PASSIVE_PAST_NEG, Formality.PLAIN],
-
-        # formality-constant
-        [te_passive, Form.PASSIVE_TE, None],
-
-        # Polite Causative
-        [polite_nonpast_positive_causative, Form.CAUSATIVE_NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative_causative, Form.CAUSATIVE_NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive_causative, Form.CAUSATIVE_PAST, Formality.POLITE],
-        [polite_past_negative_causative, Form.CAUSATIVE_PAST_NEG, Formality.POLITE],
-
-        # Plain Causative
-        [plain_nonpast_positive_causative, Form.CAUSATIVE_NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative_causative, Form.CAUSATIVE_NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive_causative, Form.CAUSATIVE_PAST, Formality.PLAIN],
-        [plain_past_negative_causative, Form.CAUSATIVE_PAST_NEG, Formality.PLAIN],
-
-        # formality-constant
-        [te_causative, Form.CAUSATIVE_TE, None],
-
-        # Polite Causative-Passive
-        [polite_nonpast_positive_causative_passive,
-         Form.CAUSATIVE_PASSIVE_NON_PAST, Formality.POLITE],
-        [polite_nonpast_negative_causative_passive,
-         Form.CAUSATIVE_PASSIVE_NON_PAST_NEG, Formality.POLITE],
-        [polite_past_positive_causative_passive,
-         Form.CAUSATIVE_PASSIVE_PAST, Formality.POLITE],
-        [polite_past_negative_causative_passive,
-         Form.CAUSATIVE_PASSIVE_PAST_NEG, Formality.POLITE],
-
-        # Plain Causative-Passive
-        [plain_nonpast_positive_causative_passive,
-         Form.CAUSATIVE_PASSIVE_NON_PAST, Formality.PLAIN],
-        [plain_nonpast_negative_causative_passive,
-         Form.CAUSATIVE_PASSIVE_NON_PAST_NEG, Formality.PLAIN],
-        [plain_past_positive_causative_passive,
-         Form.CAUSATIVE_PASSIVE_PAST, Formality.PLAIN],
-        [plain_past_negative_causative_passive,
-         Form.CAUSATIVE_PASSIVE_PAST_NEG, Formality.PLAIN],
-
-        # formality-constant
-        [te_causative_passive, Form.CAUSATIVE_PASSIVE_TE, None]
-    ]
-
-    for conjugate, form, formality in all_forms:
-        try:
-            results.append([conjugate(dictionary_form, verb_class), form, formality])
-        except: # pylint: disable=W0702
-            pass
-
-    results.extend(tai_forms(dictionary_form, verb_class))
-
-    return results
+        return COPULA_RULES_VERSION
+
+    return f'{verb_class.value}-{rules_version(dictionary_form, verb_class)}'
+
+def generate_verb_forms_batch(readings_with_classes: Sequence[Tuple[str, VerbClass]],
+                              workers: Optional[int] = 1, chunk_size: Optional[int] = None,
+                              forms: Optional[Iterable[Tuple[Optional[Formality], Form]]] \
+                                = None)\
+    -> List[List[Tuple[str, Form, Optional[Formality]]]]:
+    """Generate the known conjugations for many verbs, optionally across worker processes
+
+    Parameters
+    ----------
+    readings_with_classes : Sequence[Tuple[str, VerbClass]]
+        Dictionary form and verb class of each verb to be conjugated
+    workers : Optional[int]
+        Number of worker processes to use. None uses every available CPU.
+    chunk_size : Optional[int]
+        Number of verbs to send to a worker process at a time. By default this is sized
+        to amortize the cost of pickling.
+    forms : Optional[Iterable[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations to be generated. All known conjugations are
+        generated if not provided.
+
+    Returns
+    -------
+    List[List[Tuple[str, Form, Optional[Formality]]]]
+        The output of `generate_verb_forms` for each verb, in input order
+    """
+    if forms is None:
+        conjugate_verb = generate_verb_forms
+    else:
+        conjugate_verb = partial(generate_verb_forms, forms=frozenset(forms))
+    return batch_map(conjugate_verb, readings_with_classes, workers, chunk_size)
 
 def _looks_like_ichidan(dictionary_form: str) -> bool:
     """Classify as looking like an ichidan verb or not
@@ -341,41 +344,12 @@ def classify_verb(dictionary_form: str) -> VerbClass:
     -------
     VerbClass
         Returns the verb classification"""
-    shaved_dictionary_form = remove_furigana(dictionary_form)
-    kana_only = promote_furigana(dictionary_form)
-
+    segments = parse_furigana(dictionary_form)
 
-    if any(shaved_dictionary_form.endswith(ending) for ending in \
-           ["する", "くる", "来る", "しゃる", "なさる", "下さる"]) \
-        or kana_only in ["なさる", "くださる"]:
+    if segments.endswith(IRREGULAR_VERB_ENDINGS) or segments.kana in ("なさる", "くださる"):
         return VerbClass.IRREGULAR
-    if _looks_like_ichidan(kana_only) and shaved_dictionary_form not in ICHIDAN_EXCEPTIONS:
+    if _looks_like_ichidan(segments.kana) and segments.base not in ICHIDAN_EXCEPTION_INDEX:
 
         return VerbClass.ICHIDAN
 
     return VerbClass.GODAN
-
-def tai_forms(dictionary_form: str, verb_class: VerbClass) \
-    -> List[Tuple[str, Form, Optional[Formality]]]:
-    """Generate the -tai form conjugations for a verb
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb to be conjugated
-    verb_class : VerbClass
-
-    Returns
-    -------
-    List[Tuple[str, Form, Optional[Formality]]]
-        The known i-adjective conjugations for the input verb
-    """
-
-    tai_dictionary_form = masu_stem(dictionary_form, verb_class) + 'たい'
-    tai_conjugations = []
-    for conjugation, form, formality in \
-        generate_adjective_forms(tai_dictionary_form, AdjectiveClass.I):
-
-        tai_conjugations.append([conjugation, form.to_tai(), formality])
-
-    return tai_conjugations
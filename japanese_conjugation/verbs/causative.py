@@ -1,4 +1,6 @@
 """Functions for determining causative form conjugations"""
+from typing import Optional
+
 from ..enums import VerbClass
 from .plain import (
     plain_nonpast_negative,
@@ -11,39 +13,11 @@ from .polite import (
     polite_past_positive,
     polite_past_negative
 )
-from .stems import godan_a_stem, kuru_reading_stem
+from .profile import VerbProfile
 from .te import te
 
-def _causative_stem(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=R0912
-    """Get the causative stem of the specified verb
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb for which the causative stem will be determined
-    verb_class : VerbClass
-        Verb class of the requested verb
-
-    Returns
-    -------
-    str
-        stem onto which causative conjugation endings can be appended
-    """
-    if dictionary_form.endswith('する'):
-        stem = dictionary_form[:-2] + 'させ'
-    elif dictionary_form.endswith('来[く]る'):
-        stem = dictionary_form[:-5] + '来[こ]させ'
-    elif dictionary_form.endswith('来る'):
-        stem = kuru_reading_stem(dictionary_form, '来[こ]させ')
-    elif dictionary_form.endswith('くる'):
-        stem = dictionary_form[:-2] + 'こさせ'
-    elif verb_class == VerbClass.ICHIDAN:
-        stem = dictionary_form[:-1] + 'させ'
-    else:
-        stem = godan_a_stem(dictionary_form) + 'せ'
-    return stem
-
-def polite_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass,
+                                      profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Causative conjugation
 
     Parameters
@@ -52,18 +26,22 @@ def polite_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClas
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = polite_nonpast_positive(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass,
+                                      profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Negative Causative conjugation
 
     Parameters
@@ -72,6 +50,9 @@ def polite_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClas
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -79,12 +60,13 @@ def polite_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClas
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = polite_nonpast_negative(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_positive_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_positive_causative(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Causative conjugation
 
     Parameters
@@ -93,6 +75,9 @@ def polite_past_positive_causative(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -100,12 +85,13 @@ def polite_past_positive_causative(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = polite_past_positive(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_negative_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_negative_causative(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Negative Causative conjugation
 
     Parameters
@@ -114,6 +100,9 @@ def polite_past_negative_causative(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -121,12 +110,13 @@ def polite_past_negative_causative(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = polite_past_negative(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def te_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def te_causative(dictionary_form: str, verb_class: VerbClass,
+                 profile: Optional[VerbProfile] = None) -> str:
     """Get the Te Causative form conjugation
 
     Parameters
@@ -135,6 +125,9 @@ def te_causative(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -142,12 +135,13 @@ def te_causative(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = te(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass,
+                                     profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Causative conjugation
 
     Parameters
@@ -156,6 +150,9 @@ def plain_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -163,11 +160,13 @@ def plain_nonpast_positive_causative(dictionary_form: str, verb_class: VerbClass
         Conjugated verb
     """
 
-    stem = _causative_stem(dictionary_form, verb_class)
-    completion = stem + "る"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.causative_stem + "る"
     return completion
 
-def plain_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass,
+                                     profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Negative Causative conjugation
 
     Parameters
@@ -176,6 +175,9 @@ def plain_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -183,12 +185,13 @@ def plain_nonpast_negative_causative(dictionary_form: str, verb_class: VerbClass
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = plain_nonpast_negative(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_positive_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_positive_causative(dictionary_form: str, verb_class: VerbClass,
+                                  profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Causative conjugation
 
     Parameters
@@ -197,6 +200,9 @@ def plain_past_positive_causative(dictionary_form: str, verb_class: VerbClass) -
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -204,12 +210,13 @@ def plain_past_positive_causative(dictionary_form: str, verb_class: VerbClass) -
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = plain_past_positive(plain_causative, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_negative_causative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_negative_causative(dictionary_form: str, verb_class: VerbClass,
+                                  profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Negative Causative conjugation
 
     Parameters
@@ -218,13 +225,16 @@ def plain_past_negative_causative(dictionary_form: str, verb_class: VerbClass) -
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class)
+    plain_causative = plain_nonpast_positive_causative(dictionary_form, verb_class, profile)
     completion = plain_past_negative(plain_causative, VerbClass.ICHIDAN)
 
     return completion
@@ -1,4 +1,6 @@
 """Functions for determining causative-passive form conjugations"""
+from typing import Optional
+
 from ..enums import VerbClass
 from .plain import (
     plain_nonpast_negative,
@@ -11,48 +13,11 @@ from .polite import (
     polite_past_positive,
     polite_past_negative
 )
-from .stems import godan_a_stem, kuru_reading_stem
+from .profile import VerbProfile
 from .te import te
 
-def _causative_passive_stem(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=R0912
-    """Get the causative-passive stem of the specified verb
-
-    Following the presentation in Genki II lesson 23, godan verbs whose stem does
-    not end in す use the contracted ~される form, while ichidan verbs, godan
-    verbs ending in す, and the irregular verbs use the full ~させられる form.
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb for which the causative-passive stem will be
-        determined
-    verb_class : VerbClass
-        Verb class of the requested verb
-
-    Returns
-    -------
-    str
-        stem onto which causative-passive conjugation endings can be appended
-    """
-    if dictionary_form.endswith('する'):
-        stem = dictionary_form[:-2] + 'させられ'
-    elif dictionary_form.endswith('来[く]る'):
-        stem = dictionary_form[:-5] + '来[こ]させられ'
-    elif dictionary_form.endswith('来る'):
-        stem = kuru_reading_stem(dictionary_form, '来[こ]させられ')
-    elif dictionary_form.endswith('くる'):
-        stem = dictionary_form[:-2] + 'こさせられ'
-    elif verb_class == VerbClass.ICHIDAN:
-        stem = dictionary_form[:-1] + 'させられ'
-    elif dictionary_form.endswith('す'):
-        # godan verbs ending in す keep the uncontracted ~させられ form
-        stem = dictionary_form[:-1] + 'させられ'
-    else:
-        # other godan verbs use the contracted ~され form
-        stem = godan_a_stem(dictionary_form) + 'され'
-    return stem
-
-def polite_nonpast_positive_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_positive_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                              profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Causative-Passive conjugation
 
     Parameters
@@ -61,18 +26,23 @@ def polite_nonpast_positive_causative_passive(dictionary_form: str, verb_class:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = polite_nonpast_positive(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_nonpast_negative_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_negative_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                              profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Negative Causative-Passive conjugation
 
     Parameters
@@ -81,6 +51,9 @@ def polite_nonpast_negative_causative_passive(dictionary_form: str, verb_class:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -88,12 +61,14 @@ def polite_nonpast_negative_causative_passive(dictionary_form: str, verb_class:
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = polite_nonpast_negative(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_positive_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_positive_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                           profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Causative-Passive conjugation
 
     Parameters
@@ -102,6 +77,9 @@ def polite_past_positive_causative_passive(dictionary_form: str, verb_class: Ver
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -109,12 +87,14 @@ def polite_past_positive_causative_passive(dictionary_form: str, verb_class: Ver
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = polite_past_positive(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_negative_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_negative_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                           profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Negative Causative-Passive conjugation
 
     Parameters
@@ -123,6 +103,9 @@ def polite_past_negative_causative_passive(dictionary_form: str, verb_class: Ver
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -130,12 +113,14 @@ def polite_past_negative_causative_passive(dictionary_form: str, verb_class: Ver
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = polite_past_negative(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def te_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def te_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                         profile: Optional[VerbProfile] = None) -> str:
     """Get the Te Causative-Passive form conjugation
 
     Parameters
@@ -144,6 +129,9 @@ def te_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -151,12 +139,14 @@ def te_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = te(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_nonpast_positive_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_positive_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                             profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Causative-Passive conjugation
 
     Parameters
@@ -165,6 +155,9 @@ def plain_nonpast_positive_causative_passive(dictionary_form: str, verb_class: V
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -172,11 +165,13 @@ def plain_nonpast_positive_causative_passive(dictionary_form: str, verb_class: V
         Conjugated verb
     """
 
-    stem = _causative_passive_stem(dictionary_form, verb_class)
-    completion = stem + "る"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.causative_passive_stem + "る"
     return completion
 
-def plain_nonpast_negative_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_negative_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                             profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Negative Causative-Passive conjugation
 
     Parameters
@@ -185,6 +180,9 @@ def plain_nonpast_negative_causative_passive(dictionary_form: str, verb_class: V
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -192,12 +190,14 @@ def plain_nonpast_negative_causative_passive(dictionary_form: str, verb_class: V
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = plain_nonpast_negative(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_positive_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_positive_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                          profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Causative-Passive conjugation
 
     Parameters
@@ -206,6 +206,9 @@ def plain_past_positive_causative_passive(dictionary_form: str, verb_class: Verb
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -213,12 +216,14 @@ def plain_past_positive_causative_passive(dictionary_form: str, verb_class: Verb
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = plain_past_positive(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_negative_causative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_negative_causative_passive(dictionary_form: str, verb_class: VerbClass,
+                                          profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Negative Causative-Passive conjugation
 
     Parameters
@@ -227,13 +232,17 @@ def plain_past_negative_causative_passive(dictionary_form: str, verb_class: Verb
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form, verb_class)
+    plain_causative_passive = plain_nonpast_positive_causative_passive(dictionary_form,
+                                                                       verb_class, profile)
     completion = plain_past_negative(plain_causative_passive, VerbClass.ICHIDAN)
 
     return completion
@@ -0,0 +1,497 @@
+"""Compiled suffix-rewrite engine for generating every verb conjugation in a single pass
+
+The form functions (plain.py, polite.py, passive.py, ...) remain the source of truth
+for the conjugation rules. Each of them only ever inspects the ending of the dictionary
+form, so for a given verb class and ending every conjugation is simply the dictionary
+form with that ending removed plus a fixed replacement. The rewrite table captures those
+replacements once at import so that conjugating a verb becomes a single pass of string
+concatenation rather than ~50 function calls each re-running the same suffix checks.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from ..enums import Form, Formality, VerbClass
+from ..util import ConjugationError, digest
+
+from .plain import (
+    plain_nonpast_positive,
+    plain_nonpast_negative,
+    plain_past_positive,
+    plain_past_negative,
+    plain_volitional
+)
+from .polite import (
+    polite_nonpast_positive,
+    polite_nonpast_negative,
+    polite_past_positive,
+    polite_past_negative,
+    polite_volitional
+)
+from .passive import (
+    polite_nonpast_positive_passive,
+    polite_nonpast_negative_passive,
+    polite_past_positive_passive,
+    polite_past_negative_passive,
+    te_passive,
+    plain_nonpast_positive_passive,
+    plain_nonpast_negative_passive,
+    plain_past_positive_passive,
+    plain_past_negative_passive,
+)
+from .potential import (
+    polite_nonpast_positive_potential,
+    polite_nonpast_negative_potential,
+    polite_past_positive_potential,
+    polite_past_negative_potential,
+    te_potential,
+    plain_nonpast_positive_potential,
+    plain_nonpast_negative_potential,
+    plain_past_positive_potential,
+    plain_past_negative_potential,
+)
+from .causative import (
+    polite_nonpast_positive_causative,
+    polite_nonpast_negative_causative,
+    polite_past_positive_causative,
+    polite_past_negative_causative,
+    te_causative,
+    plain_nonpast_positive_causative,
+    plain_nonpast_negative_causative,
+    plain_past_positive_causative,
+    plain_past_negative_causative,
+)
+from .causative_passive import (
+    polite_nonpast_positive_causative_passive,
+    polite_nonpast_negative_causative_passive,
+    polite_past_positive_causative_passive,
+    polite_past_negative_causative_passive,
+    te_causative_passive,
+    plain_nonpast_positive_causative_passive,
+    plain_nonpast_negative_causative_passive,
+    plain_past_positive_causative_passive,
+    plain_past_negative_causative_passive,
+)
+from .profile import VerbProfile
+from .te import te
+from .tai import tai_forms
+
+FORM_FUNCTIONS = [
+    [polite_nonpast_positive, Form.NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative, Form.NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive, Form.PAST, Formality.POLITE],
+    [polite_past_negative, Form.PAST_NEG, Formality.POLITE],
+    [polite_volitional, Form.VOLITIONAL, Formality.POLITE],
+
+    # Plain forms
+    [plain_nonpast_positive, Form.NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative, Form.NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive, Form.PAST, Formality.PLAIN],
+    [plain_past_negative, Form.PAST_NEG, Formality.PLAIN],
+    [plain_volitional, Form.VOLITIONAL, Formality.PLAIN],
+
+    # formality-constant
+    [te, Form.TE, None],
+
+    # Polite Potential
+    [polite_nonpast_positive_potential, Form.POTENTIAL_NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative_potential, Form.POTENTIAL_NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive_potential, Form.POTENTIAL_PAST, Formality.POLITE],
+    [polite_past_negative_potential, Form.POTENTIAL_PAST_NEG, Formality.POLITE],
+
+    # Plain Potential
+    [plain_nonpast_positive_potential, Form.POTENTIAL_NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative_potential, Form.POTENTIAL_NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive_potential, Form.POTENTIAL_PAST, Formality.PLAIN],
+    [plain_past_negative_potential, Form.POTENTIAL_PAST_NEG, Formality.PLAIN],
+
+    # formality-constant
+    [te_potential, Form.POTENTIAL_TE, None],
+
+    # Polite Passive
+    [polite_nonpast_positive_passive, Form.PASSIVE_NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative_passive, Form.PASSIVE_NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive_passive, Form.PASSIVE_PAST, Formality.POLITE],
+    [polite_past_negative_passive, Form.PASSIVE_PAST_NEG, Formality.POLITE],
+
+    # Plain Passive
+    [plain_nonpast_positive_passive, Form.PASSIVE_NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative_passive, Form.PASSIVE_NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive_passive, Form.PASSIVE_PAST, Formality.PLAIN],
+    [plain_past_negative_passive, Form.PASSIVE_PAST_NEG, Formality.PLAIN],
+
+    # formality-constant
+    [te_passive, Form.PASSIVE_TE, None],
+
+    # Polite Causative
+    [polite_nonpast_positive_causative, Form.CAUSATIVE_NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative_causative, Form.CAUSATIVE_NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive_causative, Form.CAUSATIVE_PAST, Formality.POLITE],
+    [polite_past_negative_causative, Form.CAUSATIVE_PAST_NEG, Formality.POLITE],
+
+    # Plain Causative
+    [plain_nonpast_positive_causative, Form.CAUSATIVE_NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative_causative, Form.CAUSATIVE_NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive_causative, Form.CAUSATIVE_PAST, Formality.PLAIN],
+    [plain_past_negative_causative, Form.CAUSATIVE_PAST_NEG, Formality.PLAIN],
+
+    # formality-constant
+    [te_causative, Form.CAUSATIVE_TE, None],
+
+    # Polite Causative-Passive
+    [polite_nonpast_positive_causative_passive,
+     Form.CAUSATIVE_PASSIVE_NON_PAST, Formality.POLITE],
+    [polite_nonpast_negative_causative_passive,
+     Form.CAUSATIVE_PASSIVE_NON_PAST_NEG, Formality.POLITE],
+    [polite_past_positive_causative_passive,
+     Form.CAUSATIVE_PASSIVE_PAST, Formality.POLITE],
+    [polite_past_negative_causative_passive,
+     Form.CAUSATIVE_PASSIVE_PAST_NEG, Formality.POLITE],
+
+    # Plain Causative-Passive
+    [plain_nonpast_positive_causative_passive,
+     Form.CAUSATIVE_PASSIVE_NON_PAST, Formality.PLAIN],
+    [plain_nonpast_negative_causative_passive,
+     Form.CAUSATIVE_PASSIVE_NON_PAST_NEG, Formality.PLAIN],
+    [plain_past_positive_causative_passive,
+     Form.CAUSATIVE_PASSIVE_PAST, Formality.PLAIN],
+    [plain_past_negative_causative_passive,
+     Form.CAUSATIVE_PASSIVE_PAST_NEG, Formality.PLAIN],
+
+    # formality-constant
+    [te_causative_passive, Form.CAUSATIVE_PASSIVE_TE, None]
+]
+
+# Final kana which can be conjugated at all
+FINAL_KANA = ("う", "く", "す", "つ", "ぬ", "ふ", "む", "る", "ぐ", "ず", "ぶ", "ぷ")
+
+# Every multi-character ending that one of the form functions checks for. These are
+# ordered longest first so that the first match is the most specific ending.
+SPECIAL_ENDINGS = tuple(sorted([
+    'する',
+    '来[く]る', '来る', 'くる',
+    'しゃる', 'なさる', 'くださる', '下[くだ]さる', '下さる',
+    'ある',
+    '行[い]く', 'いく', '行く',
+], key=len, reverse=True))
+
+# The special endings which an irregular verb can have, in the same order. A verb tagged
+# as irregular with any other ending, including ある and 行く, cannot be conjugated.
+IRREGULAR_SPECIAL_ENDINGS = tuple(ending for ending in SPECIAL_ENDINGS
+                                  if ending not in ('ある', '行[い]く', 'いく', '行く'))
+
+# The potential stem swaps を for が across the whole stem rather than just the ending
+_POTENTIAL_FORMS = frozenset([
+    Form.POTENTIAL_NON_PAST, Form.POTENTIAL_NON_PAST_NEG, Form.POTENTIAL_PAST,
+    Form.POTENTIAL_PAST_NEG, Form.POTENTIAL_TE
+])
+
+# Placeholder used in front of an ending when compiling the rules. It must not be kana
+# so that it can never complete one of the special endings.
+_PROBE_PREFIX = '〇'
+
+# The -tai forms are produced together by `tai_forms`, so they apply all or nothing
+_TAI_COMBOS = frozenset([
+    (Formality.POLITE, Form.TAI_NON_PAST), (Formality.POLITE, Form.TAI_NON_PAST_NEG),
+    (Formality.POLITE, Form.TAI_PAST), (Formality.POLITE, Form.TAI_PAST_NEG),
+    (Formality.PLAIN, Form.TAI_NON_PAST), (Formality.PLAIN, Form.TAI_NON_PAST_NEG),
+    (Formality.PLAIN, Form.TAI_PAST), (Formality.PLAIN, Form.TAI_PAST_NEG),
+    (None, Form.TAI_TE)
+])
+# Combination reported when `tai_forms` fails, as the first of the forms it produces
+_TAI_REPORT = (Formality.POLITE, Form.TAI_NON_PAST)
+
+RewriteKey = Tuple[VerbClass, str, bool]
+RewriteRule = Tuple[str, Form, Optional[Formality], bool]
+Combo = Tuple[Optional[Formality], Form]
+
+def _produce(conjugate_form: Callable[..., Any], dictionary_form: str, verb_class: VerbClass,
+             profile: VerbProfile, combo: Combo) -> Any:
+    """Call a form function which applies to the verb, reporting any failure
+
+    Parameters
+    ----------
+    conjugate_form : Callable
+        Form function (or `tai_forms`) to be called
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed
+    profile : VerbProfile
+        Analysis of the verb shared between form functions
+    combo : Tuple[Optional[Formality], Form]
+        Formality+Form combination produced by the function, for reporting
+
+    Returns
+    -------
+    Any
+        Output of the form function
+
+    Raises
+    ------
+    ConjugationError
+        If the form function fails even though the form applies to the verb
+    """
+    try:
+        return conjugate_form(dictionary_form, verb_class, profile)
+    except Exception as err:
+        raise ConjugationError(dictionary_form, combo[1], combo[0]) from err
+
+def conjugate_by_function(dictionary_form: str, verb_class: VerbClass,
+                          combos: Optional[FrozenSet[Combo]] = None) \
+    -> List[Tuple[str, Form, Optional[Formality]]]:
+    """Generate the known conjugations by calling each form function in turn
+
+    Forms which do not apply to the verb's class and ending (see `FORM_MASKS`) are
+    skipped. Every other form is expected to succeed.
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed
+    combos : Optional[FrozenSet[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations to be generated. All are generated if not provided.
+
+    Returns
+    -------
+    List of tuples
+        Each tuple is the conjugation (string), Form, and Formality
+
+    Raises
+    ------
+    ConjugationError
+        If a form which applies to the verb could not be produced, or if the verb is
+        tagged as irregular without one of the irregular endings
+    """
+    key = rewrite_key(dictionary_form, verb_class)
+    if verb_class == VerbClass.IRREGULAR and key[1] not in IRREGULAR_SPECIAL_ENDINGS:
+        # Most forms would fail, so the verb is most likely tagged with the wrong class
+        _, form, formality = FORM_FUNCTIONS[0]
+        raise ConjugationError(dictionary_form, form, formality)
+    mask = FORM_MASKS.get(key)
+    profile = VerbProfile(dictionary_form, verb_class)
+    results = []
+    for conjugate_form, form, formality in FORM_FUNCTIONS:
+        combo = (formality, form)
+        if (combos is not None and combo not in combos) or (mask is not None and combo not in mask):
+            continue
+        results.append([_produce(conjugate_form, dictionary_form, verb_class, profile, combo),
+                        form, formality])
+
+    if mask is not None and _TAI_COMBOS.isdisjoint(mask):
+        return results
+    if combos is None:
+        results.extend(_produce(tai_forms, dictionary_form, verb_class, profile, _TAI_REPORT))
+    elif not _TAI_COMBOS.isdisjoint(combos):
+        results.extend(conjugation for conjugation
+                       in _produce(tai_forms, dictionary_form, verb_class, profile, _TAI_REPORT)
+                       if (conjugation[2], conjugation[1]) in combos)
+
+    return results
+
+def rewrite_key(dictionary_form: str, verb_class: VerbClass) -> RewriteKey:
+    """Determine which entry of the rewrite table applies to a verb
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of the verb to be conjugated
+
+    Returns
+    -------
+    Tuple[VerbClass, str, bool]
+        The verb class, the ending that the rewrite rules replace, and whether that
+        ending makes up the entire dictionary form (e.g. 来る versus 連れて来る)
+    """
+    for ending in SPECIAL_ENDINGS:
+        if dictionary_form.endswith(ending):
+            break
+    else:
+        ending = dictionary_form[-1:]
+    return verb_class, ending, dictionary_form == ending
+
+def _compile_rules(verb_class: VerbClass, ending: str, whole: bool) -> Tuple[RewriteRule, ...]:
+    """Compile the rewrite rules for a single verb class and ending
+
+    Parameters
+    ----------
+    verb_class : VerbClass
+        Class of verb for which the rules are compiled
+    ending : str
+        Ending which will be replaced by the rewrite rules
+    whole : bool
+        Whether the ending makes up the entire dictionary form
+
+    Returns
+    -------
+    Tuple[RewriteRule, ...]
+        Replacement ending, Form, Formality, and whether the を→が substitution of the
+        potential stem applies, for each conjugation that the form functions produce
+    """
+    probe = ending if whole else _PROBE_PREFIX + ending
+    prefix_length = len(probe) - len(ending)
+    rules = []
+    for conjugation, form, formality in conjugate_by_function(probe, verb_class):
+        assert conjugation.startswith(probe[:prefix_length])
+        rules.append((conjugation[prefix_length:], form, formality, form in _POTENTIAL_FORMS))
+    return tuple(rules)
+
+def _compile_form_mask(verb_class: VerbClass, ending: str, whole: bool) -> FrozenSet[Combo]:
+    """Determine which forms apply to a single verb class and ending
+
+    Parameters
+    ----------
+    verb_class : VerbClass
+        Class of verb for which the mask is compiled
+    ending : str
+        Ending shared by the verbs the mask applies to
+    whole : bool
+        Whether the ending makes up the entire dictionary form
+
+    Returns
+    -------
+    FrozenSet[Tuple[Optional[Formality], Form]]
+        Formality+Form combinations which the form functions are able to produce. A
+        form function which refuses the probe verb (e.g. the potential forms of ある)
+        refuses every verb with that ending.
+    """
+    probe = ending if whole else _PROBE_PREFIX + ending
+    profile = VerbProfile(probe, verb_class)
+    mask = set()
+    for conjugate_form, form, formality in FORM_FUNCTIONS:
+        try:
+            _produce(conjugate_form, probe, verb_class, profile, (formality, form))
+        except ConjugationError:
+            continue
+        mask.add((formality, form))
+    try:
+        _produce(tai_forms, probe, verb_class, profile, _TAI_REPORT)
+    except ConjugationError:
+        pass
+    else:
+        mask.update(_TAI_COMBOS)
+    return frozenset(mask)
+
+def _compile_form_masks() -> Dict[RewriteKey, FrozenSet[Combo]]:
+    """Compile the applicable forms for every verb class and conjugatable ending
+
+    Irregular verbs are only covered for the irregular endings, since no other ending
+    can be conjugated as an irregular verb (see `conjugate_by_function`).
+
+    Returns
+    -------
+    Dict[RewriteKey, FrozenSet[Combo]]
+        Mapping from (verb class, ending, whole) to the applicable Formality+Form
+        combinations
+    """
+    endings_by_class = [(VerbClass.ICHIDAN, SPECIAL_ENDINGS + FINAL_KANA),
+                        (VerbClass.GODAN, SPECIAL_ENDINGS + FINAL_KANA),
+                        (VerbClass.IRREGULAR, IRREGULAR_SPECIAL_ENDINGS)]
+    return {(verb_class, ending, whole): _compile_form_mask(verb_class, ending, whole)
+            for verb_class, endings in endings_by_class
+            for ending in endings
+            for whole in (True, False)}
+
+# Applicability of each form to each entry of the rewrite table. These are worked out
+# once here so that conjugating a verb never relies on a form function failing.
+FORM_MASKS = _compile_form_masks()
+
+REWRITE_TABLE = {key: _compile_rules(*key) for key in FORM_MASKS}
+
+# Version of the rules behind each entry of the rewrite table. Since the rules are
+# compiled from the form functions, a change to a form function only changes the
+# versions of the entries whose conjugations it alters.
+RULES_VERSIONS = {key: digest(rules) for key, rules in REWRITE_TABLE.items()}
+
+def rules_version(dictionary_form: str, verb_class: VerbClass) -> str:
+    """Identify the version of the rules used to conjugate a verb
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed. This must already
+        be resolved to one of ichidan, godan, or irregular.
+
+    Returns
+    -------
+    str
+        Version which changes whenever the conjugations of the verb would change, or an
+        empty string if the verb is not covered by the rewrite table
+    """
+    return RULES_VERSIONS.get(rewrite_key(dictionary_form, verb_class), '')
+
+@lru_cache(maxsize=256)
+def _select_rules(key: RewriteKey, combos: FrozenSet[Combo]) -> Tuple[RewriteRule, ...]:
+    """Narrow the rewrite rules for a verb down to the requested combinations
+
+    Parameters
+    ----------
+    key : RewriteKey
+        Entry of the rewrite table
+    combos : FrozenSet[Tuple[Optional[Formality], Form]]
+        Formality+Form combinations to be generated
+
+    Returns
+    -------
+    Tuple[RewriteRule, ...]
+        Rewrite rules producing only the requested combinations
+    """
+    return tuple(rule for rule in REWRITE_TABLE[key] if (rule[2], rule[1]) in combos)
+
+def iter_conjugations(dictionary_form: str, verb_class: VerbClass,
+                      combos: Optional[FrozenSet[Combo]] = None) \
+    -> Iterator[List]:
+    """Lazily generate conjugations for a verb using the rewrite table
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed. This must already
+        be resolved to one of ichidan, godan, or irregular.
+    combos : Optional[FrozenSet[Tuple[Optional[Formality], Form]]]
+        Formality+Form combinations to be generated. All are generated if not provided.
+        Only the requested combinations are computed.
+
+    Yields
+    ------
+    List
+        The conjugation (string), Form, and Formality. Conjugations are produced in the
+        same order as `conjugate_by_function`.
+    """
+    key = rewrite_key(dictionary_form, verb_class)
+    if key not in REWRITE_TABLE:
+        yield from conjugate_by_function(dictionary_form, verb_class, combos)
+        return
+
+    rules = REWRITE_TABLE[key] if combos is None else _select_rules(key, combos)
+    stem = dictionary_form[:len(dictionary_form) - len(key[1])]
+    potential_stem = stem.replace('を', 'が')
+    for ending, form, formality, potential in rules:
+        yield [(potential_stem if potential else stem) + ending, form, formality]
+
+def conjugate(dictionary_form: str, verb_class: VerbClass) \
+    -> List[Tuple[str, Form, Optional[Formality]]]:
+    """Generate the known conjugations for a verb using the rewrite table
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of verb to guide how conjugation should be performed. This must already
+        be resolved to one of ichidan, godan, or irregular.
+
+    Returns
+    -------
+    List of tuples
+        Each tuple is the conjugation (string), Form, and Formality. This is identical
+        to the output of `conjugate_by_function`.
+    """
+    return list(iter_conjugations(dictionary_form, verb_class))
@@ -0,0 +1,42 @@
+"""Compiled index of the verbs which are exceptions to a classification rule"""
+from typing import Dict, Iterable
+
+# Marks the end of a suffix within the trie. It cannot collide with a character key.
+_END = ''
+
+class ExceptionIndex: # pylint: disable=R0903
+    """Exact and suffix matching of verbs against a list of exceptions
+
+    Exact entries are held in a frozenset. Entries which also apply to compounds built
+    on top of them (e.g. 迫る covering 押し迫る and 差し迫る) are held in a trie of the
+    reversed entries, so that a lookup walks the end of the verb at most once.
+
+    Parameters
+    ----------
+    exact : Iterable[str]
+        Verbs which are exceptions only when matched in their entirety
+    compounds : Iterable[str]
+        Verbs which are exceptions on their own as well as at the end of a compound
+    """
+
+    def __init__(self, exact: Iterable[str], compounds: Iterable[str] = ()):
+        self._exact = frozenset(exact)
+        self._suffixes = {}
+        for suffix in compounds:
+            node = self._suffixes
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[_END] = True
+
+    def __contains__(self, dictionary_form: str) -> bool:
+        if dictionary_form in self._exact:
+            return True
+
+        node: Dict = self._suffixes
+        for char in reversed(dictionary_form):
+            node = node.get(char)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
@@ -1,5 +1,7 @@
 """Functions for determining passive form conjugations"""
-from ..enums import AGyo, Dan, Gyo, VerbClass
+from typing import Optional
+
+from ..enums import VerbClass
 from .plain import (
     plain_nonpast_negative,
     plain_past_positive,
@@ -11,42 +13,11 @@ from .polite import (
     polite_past_positive,
     polite_past_negative
 )
-from .stems import kuru_reading_stem
+from .profile import VerbProfile
 from .te import te
 
-def _passive_stem(dictionary_form: str) -> str: # pylint: disable=R0912
-    """Get the passive stem of the specified verb
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb for which the ~masu stem will be determined
-    v_class : VerbClass
-        Verb class of the requested verb
-
-    Returns
-    -------
-    str
-        stem onto which passive conjugation endings can be appended
-    """
-    if dictionary_form.endswith('する'):
-        stem = dictionary_form[:-2] + 'され'
-    elif dictionary_form.endswith('来[く]る'):
-        stem = dictionary_form[:-5] + '来[こ]られ'
-    elif dictionary_form.endswith('来る'):
-        stem = kuru_reading_stem(dictionary_form, '来[こ]られ')
-    elif dictionary_form.endswith('くる'):
-        stem = dictionary_form[:-2] + 'こられ'
-    else:
-        ending_gyo = Gyo.identify(dictionary_form[-1])
-        if ending_gyo == AGyo:
-            passive_ending = 'わ'
-        else:
-            passive_ending = ending_gyo.dan(Dan.A)
-        stem = dictionary_form[:-1] + passive_ending + 'れ'
-    return stem
-
-def polite_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass,
+                                    profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Passive conjugation
 
     Parameters
@@ -55,18 +26,22 @@ def polite_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = polite_nonpast_positive(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass,
+                                    profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Negative Passive conjugation
 
     Parameters
@@ -75,6 +50,9 @@ def polite_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -82,12 +60,13 @@ def polite_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = polite_nonpast_negative(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_positive_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_positive_passive(dictionary_form: str, verb_class: VerbClass,
+                                 profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Passive conjugation
 
     Parameters
@@ -96,6 +75,9 @@ def polite_past_positive_passive(dictionary_form: str, verb_class: VerbClass) ->
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -103,12 +85,13 @@ def polite_past_positive_passive(dictionary_form: str, verb_class: VerbClass) ->
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = polite_past_positive(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_negative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_negative_passive(dictionary_form: str, verb_class: VerbClass,
+                                 profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Negative Passive conjugation
 
     Parameters
@@ -117,6 +100,9 @@ def polite_past_negative_passive(dictionary_form: str, verb_class: VerbClass) ->
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -124,12 +110,13 @@ def polite_past_negative_passive(dictionary_form: str, verb_class: VerbClass) ->
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = polite_past_negative(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def te_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def te_passive(dictionary_form: str, verb_class: VerbClass,
+               profile: Optional[VerbProfile] = None) -> str:
     """Get the Te Passive form conjugation
 
     Parameters
@@ -138,6 +125,9 @@ def te_passive(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -145,12 +135,13 @@ def te_passive(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = te(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=W0613
+def plain_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Passive conjugation
 
     Parameters
@@ -158,8 +149,10 @@ def plain_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass)
     dictionary_form : str
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
-        Class of the verb being conjugated. Note that it does not get used in this function,
-        but we include it for API consistency with the other conjugation functions
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -167,11 +160,13 @@ def plain_nonpast_positive_passive(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    stem = _passive_stem(dictionary_form)
-    completion = stem + "る"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.passive_stem + "る"
     return completion
 
-def plain_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Negative Passive conjugation
 
     Parameters
@@ -180,6 +175,9 @@ def plain_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -187,12 +185,13 @@ def plain_nonpast_negative_passive(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = plain_nonpast_negative(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_positive_passive(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=W0613
+def plain_past_positive_passive(dictionary_form: str, verb_class: VerbClass,
+                                profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Passive conjugation
 
     Parameters
@@ -200,8 +199,10 @@ def plain_past_positive_passive(dictionary_form: str, verb_class: VerbClass) ->
     dictionary_form : str
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
-        Class of the verb being conjugated. Note that it does not get used in this function,
-        but we include it for API consistency with the other conjugation functions
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -209,12 +210,13 @@ def plain_past_positive_passive(dictionary_form: str, verb_class: VerbClass) ->
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = plain_past_positive(plain_passive, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_negative_passive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_negative_passive(dictionary_form: str, verb_class: VerbClass,
+                                profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Negative Passive Passive conjugation
 
     Parameters
@@ -223,13 +225,16 @@ def plain_past_negative_passive(dictionary_form: str, verb_class: VerbClass) ->
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class)
+    plain_passive = plain_nonpast_positive_passive(dictionary_form, verb_class, profile)
     completion = plain_past_negative(plain_passive, VerbClass.ICHIDAN)
 
     return completion
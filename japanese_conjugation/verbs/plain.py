@@ -1,9 +1,12 @@
 """Functions for determining plain conjugations"""
-from ..enums import Dan, Formality, Gyo, VerbClass
-from .stems import looks_like_honorific, masu_stem
+from typing import Optional
+
+from ..enums import Dan, IrregularKind, VerbClass
+from .profile import VerbProfile
 from .te import te
 
-def plain_nonpast_positive(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=W0613
+def plain_nonpast_positive(dictionary_form: str, verb_class: VerbClass,
+                           profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past conjugation
 
     Parameters
@@ -11,25 +14,25 @@ def plain_nonpast_positive(dictionary_form: str, verb_class: VerbClass) -> str:
     dictionary_form : str
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
-        Class of the verb being conjugated. Note that it does not get used in this function,
-        but we include it for API consistency with the other conjugation functions
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
-    if dictionary_form.endswith("来る"):
-        ending = "来[く]る"
-        if len(dictionary_form) == 2:
-            completion = ending
-        else:
-            completion = dictionary_form[:-2] + ' ' + ending
-        return completion
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    if profile.ending == "来る":
+        return profile.kuru_stem("く") + "る"
 
     return dictionary_form
 
-def plain_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_negative(dictionary_form: str, verb_class: VerbClass,
+                           profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Negative conjugation
 
     Parameters
@@ -38,6 +41,9 @@ def plain_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -45,17 +51,13 @@ def plain_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    if dictionary_form.endswith('ある'):
-        return dictionary_form[:-2] + 'ない'
-
-    if looks_like_honorific(dictionary_form):
-        stem = dictionary_form[:-1] + 'ら'
-    else:
-        stem = masu_stem(dictionary_form, verb_class, formality=Formality.PLAIN)
-    completion = stem + 'ない'
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.negative_stem + 'ない'
     return completion
 
-def plain_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_positive(dictionary_form: str, verb_class: VerbClass,
+                        profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past conjugation
 
     Parameters
@@ -64,13 +66,16 @@ def plain_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    te_form = te(dictionary_form, verb_class)
+    te_form = te(dictionary_form, verb_class, profile)
     if te_form.endswith('て'):
         ending = 'た'
     else: # ends with で
@@ -79,7 +84,8 @@ def plain_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
 
     return completion
 
-def plain_past_negative(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_negative(dictionary_form: str, verb_class: VerbClass,
+                        profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Negative conjugation
 
     Parameters
@@ -88,17 +94,21 @@ def plain_past_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    nai_form = plain_nonpast_negative(dictionary_form, verb_class)
+    nai_form = plain_nonpast_negative(dictionary_form, verb_class, profile)
     completion = nai_form[:-1] + 'かった'
     return completion
 
-def plain_volitional(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_volitional(dictionary_form: str, verb_class: VerbClass,
+                     profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Volitional conjugation
 
     Parameters
@@ -107,34 +117,28 @@ def plain_volitional(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
     completion = None
     if verb_class == VerbClass.ICHIDAN:
-        completion = dictionary_form[:-1] + 'よう'
+        completion = profile.base + 'よう'
     elif verb_class == VerbClass.GODAN:
-        ending_gyo = Gyo.identify(dictionary_form[-1])
-        completion = dictionary_form[:-1] + ending_gyo.dan(Dan.O) + 'う'
+        completion = profile.base + profile.gyo.dan(Dan.O) + 'う'
     elif verb_class == VerbClass.IRREGULAR:
-        if dictionary_form.endswith('する'):
-            completion = dictionary_form[:-2] + 'しよう'
-
-        elif dictionary_form.endswith('来[く]る'):
-            completion = dictionary_form[:-5] + '来[こ]よう'
-        elif dictionary_form.endswith('来る'):
-            if len(dictionary_form) != 2:
-                buffer = ' '
-            else:
-                buffer = ''
-            ending = '来[こ]よう'
-            completion = dictionary_form[:-2] + buffer + ending
-        elif dictionary_form.endswith('くる'):
-            completion = dictionary_form[:-2] + 'こよう'
-        elif looks_like_honorific(dictionary_form):
-            completion = dictionary_form[:-1] + 'ろう'
+        if profile.kind == IrregularKind.SURU:
+            completion = profile.prefix + 'しよう'
+        elif profile.kind == IrregularKind.KURU:
+            completion = profile.kuru_stem('こ') + 'よう'
+        elif profile.kind == IrregularKind.HONORIFIC:
+            completion = profile.base + 'ろう'
     assert completion is not None
     return completion
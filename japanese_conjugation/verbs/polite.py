@@ -1,8 +1,11 @@
 """Functions for determining polite conjugations"""
+from typing import Optional
+
 from ..enums import VerbClass
-from .stems import masu_stem
+from .profile import VerbProfile
 
-def polite_nonpast_positive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_positive(dictionary_form: str, verb_class: VerbClass,
+                            profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past conjugation
 
     Parameters
@@ -11,6 +14,9 @@ def polite_nonpast_positive(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -18,12 +24,14 @@ def polite_nonpast_positive(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    stem = masu_stem(dictionary_form, verb_class)
-    completion = stem + "ます"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.masu_stem + "ます"
 
     return completion
 
-def polite_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_negative(dictionary_form: str, verb_class: VerbClass,
+                            profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Negative conjugation
 
     Parameters
@@ -32,6 +40,9 @@ def polite_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -39,12 +50,14 @@ def polite_nonpast_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    stem = masu_stem(dictionary_form, verb_class)
-    completion = stem + "ません"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.masu_stem + "ません"
 
     return completion
 
-def polite_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_positive(dictionary_form: str, verb_class: VerbClass,
+                         profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past conjugation
 
     Parameters
@@ -53,6 +66,9 @@ def polite_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -60,12 +76,14 @@ def polite_past_positive(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    stem = masu_stem(dictionary_form, verb_class)
-    completion = stem + "ました"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.masu_stem + "ました"
 
     return completion
 
-def polite_past_negative(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_negative(dictionary_form: str, verb_class: VerbClass,
+                         profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Negative conjugation
 
     Parameters
@@ -74,6 +92,9 @@ def polite_past_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -81,12 +102,14 @@ def polite_past_negative(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    stem = masu_stem(dictionary_form, verb_class)
-    completion = stem + "ませんでした"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.masu_stem + "ませんでした"
 
     return completion
 
-def polite_volitional(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_volitional(dictionary_form: str, verb_class: VerbClass,
+                      profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Volitional conjugation
 
     Parameters
@@ -95,6 +118,9 @@ def polite_volitional(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -102,7 +128,8 @@ def polite_volitional(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    stem = masu_stem(dictionary_form, verb_class)
-    completion = stem + "ましょう"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.masu_stem + "ましょう"
 
     return completion
@@ -1,6 +1,7 @@
 """Functions for determining potential form conjugations"""
-from ..enums import Dan, Gyo, VerbClass
-from .passive import _passive_stem
+from typing import Optional
+
+from ..enums import VerbClass
 from .plain import (
     plain_nonpast_negative,
     plain_past_positive,
@@ -12,45 +13,11 @@ from .polite import (
     polite_past_positive,
     polite_past_negative
 )
-from .stems import looks_like_honorific
+from .profile import VerbProfile
 from .te import te
 
-def _potential_stem(dictionary_form: str, v_class: VerbClass) -> str: # pylint: disable=R0912
-    """Get the potential stem of the specified verb
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb for which the ~masu stem will be determined
-    v_class : VerbClass
-        Verb class of the requested verb
-
-    Returns
-    -------
-    str
-        stem onto which potential conjugation endings can be appended
-    """
-    stem = None
-    if v_class == VerbClass.ICHIDAN:
-        stem = dictionary_form[:-1] + 'られ'
-    elif v_class == VerbClass.GODAN:
-        ending_gyo = Gyo.identify(dictionary_form[-1])
-        stem = dictionary_form[:-1] + ending_gyo.dan(Dan.E)
-    elif v_class == VerbClass.IRREGULAR:
-        if dictionary_form.endswith('する'):
-            stem = dictionary_form[:-2] + 'でき'
-
-        elif dictionary_form.endswith('来[く]る') or dictionary_form.endswith('来る') \
-            or dictionary_form.endswith('くる'):
-            stem = _passive_stem(dictionary_form)
-
-        elif looks_like_honorific(dictionary_form):
-            stem = dictionary_form[:-1] + 'れ'
-    assert stem is not None
-    stem = stem.replace('を', 'が')
-    return stem
-
-def polite_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass,
+                                      profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Potential conjugation
 
     Parameters
@@ -59,18 +26,22 @@ def polite_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClas
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = polite_nonpast_positive(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass,
+                                      profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Non-Past Negative Potential conjugation
 
     Parameters
@@ -79,6 +50,9 @@ def polite_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClas
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -86,12 +60,13 @@ def polite_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClas
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = polite_nonpast_negative(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_positive_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_positive_potential(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Potential conjugation
 
     Parameters
@@ -100,6 +75,9 @@ def polite_past_positive_potential(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -107,12 +85,13 @@ def polite_past_positive_potential(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = polite_past_positive(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def polite_past_negative_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def polite_past_negative_potential(dictionary_form: str, verb_class: VerbClass,
+                                   profile: Optional[VerbProfile] = None) -> str:
     """Get the Polite Past Negative Potential conjugation
 
     Parameters
@@ -121,6 +100,9 @@ def polite_past_negative_potential(dictionary_form: str, verb_class: VerbClass)
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -128,12 +110,13 @@ def polite_past_negative_potential(dictionary_form: str, verb_class: VerbClass)
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = polite_past_negative(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def te_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def te_potential(dictionary_form: str, verb_class: VerbClass,
+                 profile: Optional[VerbProfile] = None) -> str:
     """Get the Te Potential form conjugation
 
     Parameters
@@ -142,6 +125,9 @@ def te_potential(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -149,12 +135,13 @@ def te_potential(dictionary_form: str, verb_class: VerbClass) -> str:
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = te(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=W0613
+def plain_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass,
+                                     profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Potential conjugation
 
     Parameters
@@ -162,8 +149,10 @@ def plain_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass
     dictionary_form : str
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
-        Class of the verb being conjugated. Note that it does not get used in this function,
-        but we include it for API consistency with the other conjugation functions
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -171,11 +160,13 @@ def plain_nonpast_positive_potential(dictionary_form: str, verb_class: VerbClass
         Conjugated verb
     """
 
-    stem = _potential_stem(dictionary_form, verb_class)
-    completion = stem + "る"
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    completion = profile.potential_stem + "る"
     return completion
 
-def plain_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass,
+                                     profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Negative Potential conjugation
 
     Parameters
@@ -184,6 +175,9 @@ def plain_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -191,12 +185,13 @@ def plain_nonpast_negative_potential(dictionary_form: str, verb_class: VerbClass
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = plain_nonpast_negative(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_positive_potential(dictionary_form: str, verb_class: VerbClass) -> str: # pylint: disable=W0613
+def plain_past_positive_potential(dictionary_form: str, verb_class: VerbClass,
+                                  profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Non-Past Potential conjugation
 
     Parameters
@@ -204,8 +199,10 @@ def plain_past_positive_potential(dictionary_form: str, verb_class: VerbClass) -
     dictionary_form : str
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
-        Class of the verb being conjugated. Note that it does not get used in this function,
-        but we include it for API consistency with the other conjugation functions
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
@@ -213,12 +210,13 @@ def plain_past_positive_potential(dictionary_form: str, verb_class: VerbClass) -
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = plain_past_positive(plain_potential, VerbClass.ICHIDAN)
 
     return completion
 
-def plain_past_negative_potential(dictionary_form: str, verb_class: VerbClass) -> str:
+def plain_past_negative_potential(dictionary_form: str, verb_class: VerbClass,
+                                  profile: Optional[VerbProfile] = None) -> str:
     """Get the Plain Past Negative Potential Potential conjugation
 
     Parameters
@@ -227,13 +225,16 @@ def plain_past_negative_potential(dictionary_form: str, verb_class: VerbClass) -
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
     Returns
     -------
     str
         Conjugated verb
     """
 
-    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class)
+    plain_potential = plain_nonpast_positive_potential(dictionary_form, verb_class, profile)
     completion = plain_past_negative(plain_potential, VerbClass.ICHIDAN)
 
     return completion
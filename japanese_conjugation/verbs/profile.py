@@ -0,0 +1,244 @@
+"""Per-verb analysis shared by all of the form functions"""
+from typing import Optional
+
+from ..enums import AGyo, Dan, Gyo, IrregularKind, VerbClass
+from ..util import FuriganaString
+
+# Endings which need special handling, in the order they are checked
+IRREGULAR_ENDINGS = (
+    ('する', IrregularKind.SURU),
+    ('来[く]る', IrregularKind.KURU),
+    ('来る', IrregularKind.KURU),
+    ('くる', IrregularKind.KURU),
+    ('しゃる', IrregularKind.HONORIFIC),
+    ('なさる', IrregularKind.HONORIFIC),
+    ('くださる', IrregularKind.HONORIFIC),
+    ('下[くだ]さる', IrregularKind.HONORIFIC),
+    ('下さる', IrregularKind.HONORIFIC),
+    ('ある', IrregularKind.ARU),
+    ('行[い]く', IrregularKind.IKU),
+    ('いく', IrregularKind.IKU),
+    ('行く', IrregularKind.IKU),
+)
+
+class VerbProfile: # pylint: disable=R0902
+    """Analysis of a single verb, performed once and shared between the form functions
+
+    The irregular ending (if any) and the text preceding it are determined up front.
+    The gyo of the final kana and the stems are computed the first time they are
+    requested and remembered thereafter, so a stem which cannot be formed for this verb
+    only causes the forms relying on it to fail.
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be analyzed
+    verb_class : VerbClass
+        Class of the verb to be analyzed
+
+    Attributes
+    ----------
+    kind : Optional[IrregularKind]
+        Irregular ending of the verb, or None if it has no special ending
+    ending : str
+        The irregular ending, or the final kana if there is no irregular ending
+    prefix : str
+        Everything preceding the ending
+    base : str
+        Dictionary form without its final kana
+    """
+    __slots__ = ('dictionary_form', 'verb_class', 'kind', 'ending', 'prefix', 'base',
+                 '_gyo', '_masu_stem', '_plain_stem', '_negative_stem',
+                 '_godan_a_stem', '_potential_stem', '_passive_stem', '_causative_stem',
+                 '_causative_passive_stem')
+
+    def __init__(self, dictionary_form: str, verb_class: VerbClass):
+        self.dictionary_form = dictionary_form
+        self.verb_class = verb_class
+        self.base = dictionary_form[:-1]
+
+        self.kind = None
+        self.ending = dictionary_form[-1:]
+        for ending, kind in IRREGULAR_ENDINGS:
+            if dictionary_form.endswith(ending):
+                self.kind = kind
+                self.ending = ending
+                break
+        self.prefix = dictionary_form[:len(dictionary_form) - len(self.ending)]
+
+        self._gyo = None
+        self._masu_stem = None
+        self._plain_stem = None
+        self._negative_stem = None
+        self._godan_a_stem = None
+        self._potential_stem = None
+        self._passive_stem = None
+        self._causative_stem = None
+        self._causative_passive_stem = None
+
+    @property
+    def gyo(self) -> Optional[Gyo]:
+        """Gyo of the final kana, or None if it is not a known kana"""
+        if self._gyo is None:
+            self._gyo = Gyo.identify(self.dictionary_form[-1])
+        return self._gyo
+
+    def kuru_stem(self, reading: str) -> str:
+        """Replace the 来る ending with 来 read as `reading`
+
+        Parameters
+        ----------
+        reading : str
+            Reading of 来 in the stem being formed (e.g. き or こ)
+
+        Returns
+        -------
+        str
+            Stem with furigana for the reading unless the verb was written in kana
+        """
+        stem = FuriganaString.from_markup(self.dictionary_form).drop_last()
+        if self.ending == 'くる':
+            return str(stem.replace_last(reading))
+        return str(stem.annotate_last(reading))
+
+    def _irregular_stem(self, suru: str, kuru: str, honorific: str) -> Optional[str]:
+        """Form a stem for a verb of the irregular verb class
+
+        Parameters
+        ----------
+        suru : str
+            Replacement for a する ending
+        kuru : str
+            Reading of 来 replacing a 来る ending
+        honorific : str
+            Replacement for the final る of an honorific verb
+
+        Returns
+        -------
+        Optional[str]
+            The stem, or None if the verb has no known irregular ending
+        """
+        if self.kind == IrregularKind.SURU:
+            return self.prefix + suru
+        if self.kind == IrregularKind.KURU:
+            return self.kuru_stem(kuru)
+        if self.kind == IrregularKind.HONORIFIC:
+            return self.base + honorific
+        return None
+
+    @property
+    def masu_stem(self) -> str:
+        """Stem onto which the polite endings are appended"""
+        if self._masu_stem is None:
+            stem = None
+            if self.verb_class == VerbClass.ICHIDAN:
+                stem = self.base
+            elif self.verb_class == VerbClass.GODAN:
+                stem = self.base + self.gyo.dan(Dan.I)
+            elif self.verb_class == VerbClass.IRREGULAR:
+                stem = self._irregular_stem('し', 'き', 'い')
+            assert stem is not None
+            self._masu_stem = stem
+        return self._masu_stem
+
+    @property
+    def plain_stem(self) -> str:
+        """Plain counterpart of the ~masu stem"""
+        if self._plain_stem is None:
+            stem = None
+            if self.verb_class == VerbClass.ICHIDAN:
+                stem = self.base
+            elif self.verb_class == VerbClass.GODAN:
+                stem = self.godan_a_stem
+            elif self.verb_class == VerbClass.IRREGULAR:
+                stem = self._irregular_stem('し', 'こ', 'い')
+            assert stem is not None
+            self._plain_stem = stem
+        return self._plain_stem
+
+    @property
+    def negative_stem(self) -> str:
+        """Stem onto which ない is appended"""
+        if self._negative_stem is None:
+            if self.kind == IrregularKind.ARU:
+                self._negative_stem = self.prefix
+            elif self.kind == IrregularKind.HONORIFIC:
+                self._negative_stem = self.base + 'ら'
+            else:
+                self._negative_stem = self.plain_stem
+        return self._negative_stem
+
+    @property
+    def godan_a_stem(self) -> str:
+        """あ-column (imperfective) stem, with う-verbs taking わ rather than あ"""
+        if self._godan_a_stem is None:
+            if self.gyo == AGyo:
+                ending = 'わ'
+            else:
+                ending = self.gyo.dan(Dan.A)
+            self._godan_a_stem = self.base + ending
+        return self._godan_a_stem
+
+    @property
+    def potential_stem(self) -> str:
+        """Stem onto which the potential endings are appended"""
+        if self._potential_stem is None:
+            stem = None
+            if self.verb_class == VerbClass.ICHIDAN:
+                stem = self.base + 'られ'
+            elif self.verb_class == VerbClass.GODAN:
+                stem = self.base + self.gyo.dan(Dan.E)
+            elif self.verb_class == VerbClass.IRREGULAR:
+                if self.kind == IrregularKind.KURU:
+                    stem = self.passive_stem
+                else:
+                    stem = self._irregular_stem('でき', 'こ', 'れ')
+            assert stem is not None
+            self._potential_stem = stem.replace('を', 'が')
+        return self._potential_stem
+
+    @property
+    def passive_stem(self) -> str:
+        """Stem onto which the passive endings are appended"""
+        if self._passive_stem is None:
+            if self.kind == IrregularKind.SURU:
+                self._passive_stem = self.prefix + 'され'
+            elif self.kind == IrregularKind.KURU:
+                self._passive_stem = self.kuru_stem('こ') + 'られ'
+            else:
+                self._passive_stem = self.godan_a_stem + 'れ'
+        return self._passive_stem
+
+    @property
+    def causative_stem(self) -> str:
+        """Stem onto which the causative endings are appended"""
+        if self._causative_stem is None:
+            if self.kind == IrregularKind.SURU:
+                self._causative_stem = self.prefix + 'させ'
+            elif self.kind == IrregularKind.KURU:
+                self._causative_stem = self.kuru_stem('こ') + 'させ'
+            elif self.verb_class == VerbClass.ICHIDAN:
+                self._causative_stem = self.base + 'させ'
+            else:
+                self._causative_stem = self.godan_a_stem + 'せ'
+        return self._causative_stem
+
+    @property
+    def causative_passive_stem(self) -> str:
+        """Stem onto which the causative-passive endings are appended
+
+        Following the presentation in Genki II lesson 23, godan verbs whose stem does
+        not end in す use the contracted ~される form, while ichidan verbs, godan
+        verbs ending in す, and the irregular verbs use the full ~させられる form.
+        """
+        if self._causative_passive_stem is None:
+            if self.kind == IrregularKind.SURU:
+                self._causative_passive_stem = self.prefix + 'させられ'
+            elif self.kind == IrregularKind.KURU:
+                self._causative_passive_stem = self.kuru_stem('こ') + 'させられ'
+            elif self.verb_class == VerbClass.ICHIDAN or self.ending == 'す':
+                self._causative_passive_stem = self.base + 'させられ'
+            else:
+                # other godan verbs use the contracted ~され form
+                self._causative_passive_stem = self.godan_a_stem + 'され'
+        return self._causative_passive_stem
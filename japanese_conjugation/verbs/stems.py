@@ -1,5 +1,6 @@
 """Functions for getting stems used for subsequent conjugations"""
-from ..enums import AGyo, Dan, Formality, Gyo, VerbClass
+from ..enums import Formality, IrregularKind, VerbClass
+from .profile import VerbProfile
 
 def godan_a_stem(dictionary_form: str) -> str:
     """Get the あ-column (imperfective) stem of a godan verb
@@ -18,12 +19,7 @@ def godan_a_stem(dictionary_form: str) -> str:
     str
         Stem ending in the あ-column mora of the verb's final gyo
     """
-    ending_gyo = Gyo.identify(dictionary_form[-1])
-    if ending_gyo == AGyo:
-        ending = "わ"
-    else:
-        ending = ending_gyo.dan(Dan.A)
-    return dictionary_form[:-1] + ending
+    return VerbProfile(dictionary_form, VerbClass.GODAN).godan_a_stem
 
 def get_godan_stem(dictionary_form: str, formality: Formality) -> str:
     """Get the stem of the provided godan verb
@@ -38,34 +34,10 @@ def get_godan_stem(dictionary_form: str, formality: Formality) -> str:
     str
         Stem from onto which (most) conjugations can be appended
     """
+    profile = VerbProfile(dictionary_form, VerbClass.GODAN)
     if formality == Formality.POLITE:
-        ending_gyo = Gyo.identify(dictionary_form[-1])
-        stem = dictionary_form[:-1] + ending_gyo.dan(Dan.I)
-    else:
-        stem = godan_a_stem(dictionary_form)
-    return stem
-
-def kuru_reading_stem(dictionary_form: str, reading: str) -> str:
-    """Compose the stem for a 来る-ending verb (with no furigana), inserting a
-    separating space when the verb is a compound built on top of 来る
-
-    Parameters
-    ----------
-    dictionary_form : str
-        Dictionary form of the verb for which the stem will be determined
-    reading : str
-        Replacement reading (with furigana) for the trailing 来る
-
-    Returns
-    -------
-    str
-        Stem with the 来る ending replaced by the provided reading
-    """
-    if dictionary_form == '来る':
-        buffer = ''
-    else:
-        buffer = ' '
-    return dictionary_form[:-2] + buffer + reading
+        return profile.masu_stem
+    return profile.godan_a_stem
 
 def looks_like_honorific(dictionary_form: str) -> bool:
     """Determine if the provided dictionary form appears to be an honorific verb
@@ -79,16 +51,9 @@ def looks_like_honorific(dictionary_form: str) -> bool:
     -------
     bool
         True if dictionary form appears to be honorific, False otherwise"""
-    if dictionary_form.endswith('しゃる') \
-        or dictionary_form.endswith('なさる') \
-        or dictionary_form.endswith('くださる') \
-        or dictionary_form.endswith('下[くだ]さる') \
-        or dictionary_form.endswith('下さる'):
+    return VerbProfile(dictionary_form, VerbClass.GENERAL).kind == IrregularKind.HONORIFIC
 
-        return True
-    return False
-
-def masu_stem(dictionary_form: str, v_class: VerbClass, # pylint: disable=R0912
+def masu_stem(dictionary_form: str, v_class: VerbClass,
                formality: Formality = Formality.POLITE) -> str:
     """Get the ~masu stem of the specified verb
 
@@ -106,36 +71,7 @@ def masu_stem(dictionary_form: str, v_class: VerbClass, # pylint: disable=R0912
     str
         ~masu stem onto which many/most conjugation endings can be appended
     """
-    stem = None
-    if v_class == VerbClass.ICHIDAN:
-        stem = dictionary_form[:-1] # drop the る
-    elif v_class == VerbClass.GODAN:
-        stem = get_godan_stem(dictionary_form, formality)
-    elif v_class == VerbClass.IRREGULAR:
-        if dictionary_form.endswith('する'):
-            stem = dictionary_form[:-2] + 'し'
-        elif dictionary_form.endswith('来[く]る'):
-            if formality == Formality.POLITE:
-                stem = dictionary_form[:-5] + '来[き]'
-            else:
-                stem = dictionary_form[:-5] + '来[こ]'
-        elif dictionary_form.endswith('来る'):
-            if len(dictionary_form) == 2:
-                buffer = ''
-            else:
-                buffer = ' '
-            if formality == Formality.POLITE:
-                ending = '来[き]'
-            else:
-                ending = '来[こ]'
-            stem = dictionary_form[:-2] + buffer + ending
-        elif dictionary_form.endswith('くる'):
-            if formality == Formality.POLITE:
-                stem = dictionary_form[:-2] + 'き'
-            else:
-                stem = dictionary_form[:-2] + 'こ'
-        elif looks_like_honorific(dictionary_form):
-            stem = dictionary_form[:-1] + 'い'
-
-    assert stem is not None
-    return stem
+    profile = VerbProfile(dictionary_form, v_class)
+    if formality == Formality.POLITE:
+        return profile.masu_stem
+    return profile.plain_stem
@@ -0,0 +1,38 @@
+"""Functions for determining -tai form conjugations"""
+from typing import List, Optional, Tuple
+
+from ..enums import AdjectiveClass, Form, Formality, VerbClass
+from ..adjectives import generate_adjective_forms
+from .profile import VerbProfile
+
+def tai_forms(dictionary_form: str, verb_class: VerbClass,
+              profile: Optional[VerbProfile] = None) \
+    -> List[Tuple[str, Form, Optional[Formality]]]:
+    """Generate the -tai form conjugations for a verb
+
+    Parameters
+    ----------
+    dictionary_form : str
+        Dictionary form of the verb to be conjugated
+    verb_class : VerbClass
+        Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
+
+    Returns
+    -------
+    List[Tuple[str, Form, Optional[Formality]]]
+        The known i-adjective conjugations for the input verb
+    """
+
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
+    tai_dictionary_form = profile.masu_stem + 'たい'
+    tai_conjugations = []
+    for conjugation, form, formality in \
+        generate_adjective_forms(tai_dictionary_form, AdjectiveClass.I):
+
+        tai_conjugations.append([conjugation, form.to_tai(), formality])
+
+    return tai_conjugations
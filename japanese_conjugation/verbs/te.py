@@ -1,6 +1,8 @@
 """Functions to perform Te-form conjugations"""
-from ..enums import VerbClass
-from .stems import looks_like_honorific
+from typing import Optional
+
+from ..enums import IrregularKind, VerbClass
+from .profile import VerbProfile
 
 godan_te_mapping = {
     "う": "って",
@@ -14,7 +16,8 @@ godan_te_mapping = {
     "す": "して",
 }
 
-def te(dictionary_form: str, verb_class: VerbClass) -> str:
+def te(dictionary_form: str, verb_class: VerbClass,
+       profile: Optional[VerbProfile] = None) -> str:
     """Get the Te form conjugation
 
     Parameters
@@ -23,36 +26,32 @@ def te(dictionary_form: str, verb_class: VerbClass) -> str:
         Dictionary form of the verb to be conjugated
     verb_class : VerbClass
         Class of the verb being conjugated
+    profile : Optional[VerbProfile]
+        Analysis of the verb shared between form functions. It is built from the
+        dictionary form and verb class if not provided.
 
     Returns
     -------
     str
         Conjugated verb
     """
+    if profile is None:
+        profile = VerbProfile(dictionary_form, verb_class)
     completion = None
     if verb_class == VerbClass.ICHIDAN:
-        completion = dictionary_form[:-1] + "て"
+        completion = profile.base + "て"
     elif verb_class == VerbClass.GODAN:
-        if dictionary_form.endswith('行[い]く') or dictionary_form.endswith('いく') \
-            or dictionary_form.endswith('行く'):
-
-            completion = dictionary_form[:-1] + "って"
+        if profile.kind == IrregularKind.IKU:
+            completion = profile.base + "って"
         else:
-            completion = dictionary_form[:-1] + godan_te_mapping[dictionary_form[-1]]
+            completion = profile.base + godan_te_mapping[dictionary_form[-1]]
     elif verb_class == VerbClass.IRREGULAR:
-        if dictionary_form.endswith("する"):
-            completion = dictionary_form[:-2] + "して"
-        elif dictionary_form.endswith("来[く]る"):
-            completion = dictionary_form[:-5] + "来[き]て"
-        elif dictionary_form.endswith("くる"):
-            completion = dictionary_form[:-2] + "きて"
-        elif dictionary_form.endswith("来る"):
-            if len(dictionary_form) == 2:
-                completion = "来[き]て"
-            else:
-                completion = dictionary_form[:-2] + " 来[き]て"
-        elif looks_like_honorific(dictionary_form):
-            completion = dictionary_form[:-1] + "って"
+        if profile.kind == IrregularKind.SURU:
+            completion = profile.prefix + "して"
+        elif profile.kind == IrregularKind.KURU:
+            completion = profile.kuru_stem("き") + "て"
+        elif profile.kind == IrregularKind.HONORIFIC:
+            completion = profile.base + "って"
 
     assert completion is not None
     return completion
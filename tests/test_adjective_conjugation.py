@@ -6,8 +6,10 @@ from japanese_conjugation.enums import (
     Form,
     Formality
 )
+from japanese_conjugation.util import ConjugationError
 from japanese_conjugation.adjectives import (
     generate_adjective_forms,
+    generate_adjective_forms_batch,
     polite_nonpast_positive,
     polite_nonpast_negative,
     polite_past_positive,
@@ -269,3 +271,19 @@ def test_generate_adjective_forms(dict_form, adj_class, reference):
     assert forms == reference
     general_forms = generate_adjective_forms(dict_form, AdjectiveClass.GENERAL)
     assert general_forms == reference
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 2)])
+def test_generate_adjective_forms_batch(workers, chunk_size):
+    """test that the batch API matches generate_adjective_forms() and preserves input order"""
+    readings_with_classes = [(dict_form, adj_class)
+                             for dict_form, adj_class, _ in generate_adjective_forms_data]
+    forms = generate_adjective_forms_batch(readings_with_classes, workers=workers,
+                                           chunk_size=chunk_size)
+    assert forms == [reference for _, _, reference in generate_adjective_forms_data]
+
+def test_generate_adjective_forms_reports_failure():
+    """A form which cannot be produced is reported rather than silently dropped"""
+    with pytest.raises(ConjugationError) as err:
+        generate_adjective_forms(None, AdjectiveClass.I)
+    assert err.value.form == Form.NON_PAST
+    assert err.value.formality == Formality.POLITE
@@ -0,0 +1,89 @@
+"""Unit tests for the memoizing Conjugator facade"""
+import pytest
+
+from japanese_conjugation.enums import AdjectiveClass, VerbClass
+from japanese_conjugation.conjugator import Conjugator
+from japanese_conjugation.verbs import generate_verb_forms, classify_verb
+from japanese_conjugation.adjectives import generate_adjective_forms, classify_adjective
+
+def test_conjugator_matches_functions():
+    """Test that memoized results are identical to the wrapped functions"""
+    conjugator = Conjugator()
+    assert conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN) \
+        == generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    assert conjugator.generate_forms('行[い]く', VerbClass.GENERAL) \
+        == generate_verb_forms('行[い]く', VerbClass.GENERAL)
+    assert conjugator.generate_adjective_forms('早[はや]い', AdjectiveClass.I) \
+        == generate_adjective_forms('早[はや]い', AdjectiveClass.I)
+    assert conjugator.generate_forms('暇[ひま]な', AdjectiveClass.GENERAL) \
+        == generate_adjective_forms('暇[ひま]な', AdjectiveClass.GENERAL)
+    assert conjugator.classify_verb('返[かえ]る') == classify_verb('返[かえ]る')
+    assert conjugator.classify_adjective('きれい') == classify_adjective('きれい')
+
+def test_conjugator_many_with_failure():
+    """Test that a word which cannot be conjugated does not stop the others"""
+    results = Conjugator().generate_forms_many([('食[た]べる', VerbClass.IRREGULAR),
+                                                ('食[た]べる', VerbClass.ICHIDAN)])
+    assert results == [[], generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)]
+
+def test_conjugator_hits_and_misses():
+    """Test that repeated lookups of the same reading and class are cache hits"""
+    conjugator = Conjugator()
+    first = conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    second = conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    assert first is second
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.GENERAL)
+    conjugator.classify_verb('食[た]べる')
+    conjugator.classify_verb('食[た]べる')
+
+    assert conjugator.hits == 2
+    assert conjugator.misses == 3
+    assert conjugator.evictions == 0
+    assert len(conjugator) == 3
+
+    conjugator.clear()
+    assert (conjugator.hits, conjugator.misses, conjugator.evictions, len(conjugator)) \
+        == (0, 0, 0, 0)
+
+def test_conjugator_lru_eviction():
+    """Test that the least recently used result is evicted once the cache is full"""
+    conjugator = Conjugator(max_size=2)
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    conjugator.generate_verb_forms('行[い]く', VerbClass.GODAN)
+    # touch 食べる so that 行く becomes the least recently used entry
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    conjugator.generate_verb_forms('来[く]る', VerbClass.IRREGULAR)
+
+    assert conjugator.evictions == 1
+    assert len(conjugator) == 2
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    assert conjugator.hits == 2
+    conjugator.generate_verb_forms('行[い]く', VerbClass.GODAN)
+    assert conjugator.misses == 4
+
+def test_conjugator_disabled_cache():
+    """Test that a max size of zero computes every request"""
+    conjugator = Conjugator(max_size=0)
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    conjugator.generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    assert (conjugator.hits, conjugator.misses, len(conjugator)) == (0, 2, 0)
+
+    with pytest.raises(ValueError):
+        Conjugator(max_size=-1)
+
+rules_version_data = [
+    ('食[た]べる', VerbClass.ICHIDAN, '見[み]る', VerbClass.GENERAL, True),
+    ('食[た]べる', VerbClass.ICHIDAN, '帰[かえ]る', VerbClass.GENERAL, False),
+    ('書[か]く', VerbClass.GODAN, '行[い]く', VerbClass.GODAN, False),
+    ('勉強[べんきょう]する', VerbClass.GENERAL, '運動[うんどう]する', VerbClass.IRREGULAR, True),
+    ('早[はや]い', AdjectiveClass.I, '高[たか]い', AdjectiveClass.GENERAL, True),
+    ('早[はや]い', AdjectiveClass.I, 'きれい', AdjectiveClass.GENERAL, False),
+]
+@pytest.mark.parametrize("reading_a, class_a, reading_b, class_b, same", rules_version_data)
+def test_conjugator_rules_version(reading_a, class_a, reading_b, class_b, same):
+    """Test that words conjugated by the same rules share a rules version"""
+    conjugator = Conjugator()
+    version_a = conjugator.rules_version(reading_a, class_a)
+    version_b = conjugator.rules_version(reading_b, class_b)
+    assert (version_a == version_b) == same
+    assert conjugator.misses == 0
@@ -7,7 +7,7 @@ import pytest
 import anki.collection
 import anki.notes
 from japanese_conjugation.enums import VerbClass, AdjectiveClass
-from japanese_conjugation.decks import DeckSearcher
+from japanese_conjugation.decks import DeckSearcher, VERB_CLASSES
 from japanese_conjugation.config import ConfigManager
 from japanese_conjugation.models import add_or_update_verb_model, add_or_update_adjective_model
 
@@ -205,3 +205,119 @@ def test_disallow_unseen(anki_col, config_manager, deck_searcher):
     irregular_verbs = get_note_expression(anki_col, verbs[VerbClass.IRREGULAR], config_manager)
     assert irregular_verbs == ['来る']
     assert VerbClass.GENERAL not in verbs
+
+def test_disallow_unseen_any_card(anki_col, config_manager, deck_searcher):
+    """Test that a note counts as seen when any one of its cards has been reviewed"""
+    model = anki_col.models.by_name('Basic (and reversed card)')
+    note = anki.notes.Note(anki_col, model)
+    note.fields = ['高い', 'expensive']
+    note.add_tag('i-adjective')
+    anki_col.add_note(note, anki_col.decks.id(SOURCE_DECK))
+    card_ids = anki_col.find_cards(f"nid:{note.id}")
+    assert len(card_ids) > 1
+    card = anki_col.get_card(card_ids[-1])
+    card.reps += 1
+    anki_col.update_card(card)
+
+    config_manager._cfg['decks'][SOURCE_DECK]['allow_unseen'] = False # pylint: disable=W0212
+
+    adjs, models = deck_searcher.find_adjectives('some other model')
+
+    assert models == [model['name']]
+    assert adjs == {AdjectiveClass.I: [note.id]}
+
+    verbs, models = deck_searcher.find_verbs(VERB_MODEL_NAME)
+    assert not verbs
+    assert not models
+
+tag_partition_data = [
+    ['ichidan', 'ichidan-verb'],
+    ['Ichidan'],
+    ['ichi*'],
+    ['ichida_'],
+    ['verb'],
+]
+@pytest.mark.parametrize("ichidan_tags", tag_partition_data)
+def test_tag_partition_matches_search(anki_col, config_manager, deck_searcher, ichidan_tags):
+    """Test that partitioning the single search by tag agrees with searching for each
+    kind of verb separately"""
+    for expression, tags in [('見る', ['ICHIDAN']), ('寝る', ['ichidan::n5', 'verb']),
+                             ('着る', ['ichidan-verb', 'verb::n5']), ('出る', ['ichidanverb'])]:
+        note = anki.notes.Note(anki_col, anki_col.models.by_name(SIMPLE_MODEL_NAME))
+        note.fields = ["Extra Note", expression, expression, "", '']
+        for tag in tags:
+            note.add_tag(tag)
+        anki_col.add_note(note, anki_col.decks.id(SOURCE_DECK))
+    config_manager._cfg['decks'][SOURCE_DECK][VerbClass.ICHIDAN.value] = ichidan_tags # pylint: disable=W0212
+
+    verbs, models = deck_searcher.find_verbs(VERB_MODEL_NAME)
+
+    reference = {}
+    reference_models = set()
+    for verb_class in VerbClass:
+        notes, model_names = deck_searcher.find_notes(
+            config_manager.get_tags(SOURCE_DECK, verb_class), VERB_MODEL_NAME)
+        if notes:
+            reference[verb_class] = sorted(notes)
+            reference_models.update(model_names)
+    assert {verb_class: sorted(notes) for verb_class, notes in verbs.items()} == reference
+    assert list(verbs) == list(reference)
+    assert sorted(models) == sorted(reference_models)
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_iter_words(deck_searcher, chunk_size):
+    """Test that searching a chunk at a time finds the same notes as a single search"""
+    verbs, models = deck_searcher.find_verbs(VERB_MODEL_NAME)
+
+    streamed = {}
+    streamed_models = set()
+    for chunk, chunk_models in deck_searcher.iter_words(VERB_CLASSES, VERB_MODEL_NAME,
+                                                         chunk_size):
+        assert len({nid for nids in chunk.values() for nid in nids}) <= chunk_size
+        for verb_class, nids in chunk.items():
+            streamed.setdefault(verb_class, []).extend(nids)
+        streamed_models.update(chunk_models)
+    assert streamed == {verb_class: sorted(nids) for verb_class, nids in verbs.items()}
+    assert streamed_models == set(models)
+
+    with pytest.raises(ValueError):
+        next(deck_searcher.iter_words(VERB_CLASSES, VERB_MODEL_NAME, 0))
+
+def test_incremental_search(anki_col, config_manager):
+    """Test that an incremental search only finds the notes edited since the watermark,
+    unless a full rescan is requested or the notes go to another target deck"""
+    config_manager._cfg['decks'][SOURCE_DECK]['incremental'] = True # pylint: disable=W0212
+    deck_id = anki_col.decks.id(SOURCE_DECK)
+    deck_searcher = DeckSearcher(anki_col, deck_id, config_manager)
+
+    # Without a watermark every note is found
+    verbs, _ = deck_searcher.find_verbs(VERB_MODEL_NAME)
+    assert sum(len(nids) for nids in verbs.values()) == 4
+    deck_searcher.record_watermark(VERB_MODEL_NAME)
+    # Age the notes, so that they were clearly processed before the watermark
+    anki_col.db.execute("update notes set mod = mod - 100")
+    assert deck_searcher.find_verbs(VERB_MODEL_NAME) == ({}, [])
+
+    note = anki_col.get_note(anki_col.find_notes("exp:来る")[0])
+    note['translation'] = 'to arrive'
+    anki_col.update_note(note)
+    verbs, models = deck_searcher.find_verbs(VERB_MODEL_NAME)
+    assert verbs == {VerbClass.IRREGULAR: [note.id]}
+    assert models == [SIMPLE_MODEL_NAME]
+    # Adjectives have not been processed yet
+    adjs, _ = deck_searcher.find_adjectives(ADJ_MODEL_NAME)
+    assert sum(len(nids) for nids in adjs.values()) == 3
+
+    verbs, _ = DeckSearcher(anki_col, deck_id, config_manager,
+                            full_rescan=True).find_verbs(VERB_MODEL_NAME)
+    assert sum(len(nids) for nids in verbs.values()) == 4
+    # Nothing was processed into another target deck yet
+    verbs, _ = DeckSearcher(anki_col, deck_id, config_manager,
+                            target_deck_id=anki_col.decks.id('other target')) \
+        .find_verbs(VERB_MODEL_NAME)
+    assert sum(len(nids) for nids in verbs.values()) == 4
+
+    # A newly configured tag calls for a full search
+    config_manager.add_tag(SOURCE_DECK, 'dummy', VerbClass.GODAN)
+    verbs, _ = deck_searcher.find_verbs(VERB_MODEL_NAME)
+    assert sum(len(nids) for nids in verbs.values()) == 4
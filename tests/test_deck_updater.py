@@ -7,9 +7,14 @@ import pytest
 import anki.collection
 import anki.notes
 from japanese_conjugation.verbs import generate_verb_forms, VerbClass
-from japanese_conjugation.decks import DeckUpdater
+from japanese_conjugation.decks import DeckUpdater, read_source_notes, save_collection
 from japanese_conjugation.config import ConfigManager
-from japanese_conjugation.models import combo_to_field_name, add_or_update_verb_model
+from japanese_conjugation.conjugator import Conjugator
+from japanese_conjugation.models import (
+    combo_to_field_name,
+    add_or_update_verb_model,
+    HIDDEN_FIELDS
+)
 from japanese_conjugation.util import escape_query
 
 TARGET_DECK = 'target'
@@ -79,9 +84,21 @@ class MockNote: # pylint: disable=R0903
         self.fields = ['', meaning, reading, '', expression]
         self.tags = []
 
+def _add_source_note(col, fields, tags=()):
+    """Add a note of the simple model with the given fields and tags to the source deck"""
+    note = anki.notes.Note(col, col.models.by_name(SOURCE_MODEL_NAME))
+    note.fields = fields
+    for tag in tags:
+        note.add_tag(tag)
+    col.add_note(note, col.decks.id(SOURCE_DECK))
+    return note
+
 def _compose_ref_field_values(field_map, expression, meaning, reading, conjugations):
-    """Translate the base fields and conjugations into a list of expected values"""
+    """Translate the base fields and conjugations into a list of expected values. The
+    hidden fields are not compared, and so are given as None."""
     ref_values = ['']*len(field_map)
+    for field_name in HIDDEN_FIELDS:
+        ref_values[field_map[field_name][0]] = None
 
     ref_values[field_map["Expression"][0]] = expression
     ref_values[field_map["Meaning"][0]] = meaning
@@ -135,7 +152,7 @@ def test_add_new_note_to_deck(anki_col, verb_model, deck_updater):
     ref_fields = _compose_ref_field_values(anki_col.models.field_map(verb_model),
                                            '食べる', 'to eat', '食[た]べる', conjugations)
     for index, ref_value in enumerate(ref_fields):
-        assert note.fields[index] == ref_value
+        assert ref_value is None or note.fields[index] == ref_value
 
 add_note_to_deck_data = [
     ("First Note", '食べる', '食[た]べる', "LHL", '"to eat"'),
@@ -168,7 +185,7 @@ def test_add_new_note_to_deck_sanitation(anki_col, verb_model, deck_updater, # p
     ref_fields = _compose_ref_field_values(anki_col.models.field_map(verb_model),
                                            expression, translation, rdng, conjugations)
     for index, ref_value in enumerate(ref_fields):
-        assert note.fields[index] == ref_value
+        assert ref_value is None or note.fields[index] == ref_value
 
 def test_update_note_in_deck(anki_col, verb_model, deck_updater):
     """Test that when an existing word is in the deck, we update the note rather than
@@ -203,4 +220,420 @@ def test_update_note_in_deck(anki_col, verb_model, deck_updater):
     ref_fields = _compose_ref_field_values(anki_col.models.field_map(verb_model),
                                            '食べる', 'to eat', '食[た]べる', conjugations)
     for index, ref_value in enumerate(ref_fields):
-        assert note.fields[index] == ref_value
+        assert ref_value is None or note.fields[index] == ref_value
+
+def test_repeated_note_updates_new_note(anki_col, deck_updater):
+    """Test that a note added by the updater is found again when the same word recurs"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 1
+    assert deck_updater.summary() == [1, 0, 0, 1]
+
+existing_note_match_data = [
+    ('to eat', f'{TARGET_DECK}', True),
+    ('To Eat', f'{TARGET_DECK}', True),
+    ('to eat', f'{TARGET_DECK}::child', True),
+    ('to_eat', f'{TARGET_DECK}', False),
+    ('to eat', SOURCE_DECK, False),
+]
+@pytest.mark.parametrize("meaning, deck_name, matched", existing_note_match_data)
+def test_existing_note_match(anki_col, verb_model, deck_updater, meaning, deck_name, matched): # pylint: disable=R0913,R0917
+    """Test which existing conjugation notes are considered to be the same word"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+
+    starting_note = anki.notes.Note(anki_col, verb_model)
+    starting_note.fields[:3] = ['食べる', meaning, '食[た]べる']
+    anki_col.add_note(starting_note, anki_col.decks.id(deck_name, create=True))
+
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+
+    if matched:
+        assert deck_updater.summary() == [0, 1, 0, 0]
+        assert anki_col.get_note(starting_note.id).fields[3] != ''
+    else:
+        assert deck_updater.summary() == [1, 0, 0, 0]
+        assert anki_col.get_note(starting_note.id).fields[3] == ''
+
+def test_source_models_with_different_fields(anki_col, config_manager, deck_updater):
+    """Test that the configured fields are resolved separately for each source model"""
+    other_model = anki_col.models.new('other model')
+    for field_name in ["meaning", "kana", "kanji"]:
+        anki_col.models.add_field(other_model, anki_col.models.new_field(field_name))
+    anki_col.models.add_template(other_model, {
+        "name": "Other Card Template",
+        "qfmt": "{{kanji}}",
+        "afmt": "{{kana}}<br>{{meaning}}"
+    })
+    anki_col.models.add(other_model)
+    config_manager.add_model_fields('other model', 'kanji', 'meaning', 'kana')
+
+    for model_name, fields in [(SOURCE_MODEL_NAME, ["", '食べる', '食[た]べる', "", 'to eat']),
+                               ('other model', ['to see', '見[み]る', '見る']),
+                               (SOURCE_MODEL_NAME, ["", '寝る', '寝[ね]る', "", 'to sleep'])]:
+        base_note = anki.notes.Note(anki_col, anki_col.models.by_name(model_name))
+        base_note.fields = fields
+        anki_col.add_note(base_note, anki_col.decks.id(SOURCE_DECK))
+        deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+
+    for query in ['"Expression:食べる" "Meaning:to eat" "Reading:食[た]べる"',
+                  '"Expression:見る" "Meaning:to see" "Reading:見[み]る"',
+                  '"Expression:寝る" "Meaning:to sleep" "Reading:寝[ね]る"']:
+        assert len(anki_col.find_notes(f'{query} "deck:{TARGET_DECK}"')) == 1
+
+@pytest.mark.parametrize("bulk_add", [True, False])
+def test_batched_writes(anki_col, config_manager, target_deck_id, verb_model, bulk_add, # pylint: disable=R0913,R0917
+                        monkeypatch):
+    """Test that notes are written in batches and that the whole update undoes at once,
+    including on Anki versions which can only add notes one at a time"""
+    if not bulk_add:
+        monkeypatch.delattr(anki.collection.Collection, 'add_notes', raising=False)
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               batch_size=3)
+    words = [('食べる', '食[た]べる', 'to eat'), ('見る', '見[み]る', 'to see'),
+             ('食べる', '食[た]べる', 'to eat'), ('寝る', '寝[ね]る', 'to sleep'),
+             ('着る', '着[き]る', 'to wear')]
+    source_notes = []
+    for expression, reading, meaning in words:
+        base_note = _add_source_note(anki_col, ["", expression, reading, "", meaning])
+        source_notes.append(base_note)
+    for base_note in source_notes:
+        deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+
+    # the repeated word is held once, so only the first three words are written so far
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 3
+    deck_updater.flush()
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 4
+    assert deck_updater.summary() == [4, 0, 0, 1]
+
+    assert anki_col.undo_status().undo == f"Update {TARGET_DECK}"
+    anki_col.undo()
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 0
+    assert len(anki_col.find_notes(f'"deck:{SOURCE_DECK}"')) == len(words)
+
+def test_writes_not_undoable(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that the writes can be left out of the undo history"""
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               undoable=False)
+    base_note = _add_source_note(anki_col, ["", '見る', '見[み]る', "", 'to see'])
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 1
+    assert anki_col.undo_status().undo != f"Update {TARGET_DECK}"
+
+def test_invalid_batch_size(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that the batch size must be positive"""
+    with pytest.raises(ValueError):
+        DeckUpdater(anki_col, target_deck_id, verb_model, config_manager, batch_size=0)
+
+def test_unchanged_note_not_written(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that rerunning the update leaves up-to-date notes alone, while a change to the
+    tags alone is still written"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'],
+                                 ['verb'])
+    DeckUpdater(anki_col, target_deck_id, verb_model, config_manager).add_note_to_deck(
+        base_note, VerbClass.ICHIDAN)
+    note_id = anki_col.find_notes(f'"deck:{TARGET_DECK}"')[0]
+    initial_mod = anki_col.get_note(note_id).mod
+
+    rerun_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    rerun_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    rerun_updater.flush()
+    assert rerun_updater.summary() == [0, 0, 0, 1]
+    assert anki_col.get_note(note_id).mod == initial_mod
+
+    base_note.add_tag('ichidan')
+    tag_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    tag_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    assert tag_updater.summary() == [0, 1, 0, 0]
+    assert anki_col.get_note(note_id).has_tag('ichidan')
+
+def test_fingerprint_skips_conjugation(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a source note which is unchanged since its conjugation note was written is
+    not conjugated again, while an edited one is"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+    DeckUpdater(anki_col, target_deck_id, verb_model, config_manager).add_note_to_deck(
+        base_note, VerbClass.ICHIDAN)
+    note_id = anki_col.find_notes(f'"deck:{TARGET_DECK}"')[0]
+    fingerprint = anki_col.get_note(note_id)['Fingerprint']
+    assert fingerprint.startswith(f'{base_note.id}:')
+
+    conjugator = Conjugator()
+    rerun_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                                conjugator)
+    rerun_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    assert rerun_updater.summary() == [0, 0, 0, 1]
+    assert conjugator.misses == 0
+
+    # A note listed under two kinds of word is added once, as the last of them, so an
+    # unchanged note is left alone on every later run
+    note_ids = {VerbClass.ICHIDAN: [base_note.id], VerbClass.GENERAL: [base_note.id]}
+    for changes in ([0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 0, 1]):
+        rerun_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                                    conjugator)
+        rerun_updater.add_words(note_ids)
+        rerun_updater.flush()
+        assert rerun_updater.summary() == changes
+    assert conjugator.misses == 1
+
+    # An edit to the source note changes the fingerprint
+    base_note.add_tag('verb')
+    anki_col.update_note(base_note)
+    rerun_updater.add_note_to_deck(base_note, VerbClass.GENERAL)
+    assert rerun_updater.summary() == [0, 1, 0, 1]
+    assert anki_col.get_note(note_id)['Fingerprint'] not in ('', fingerprint)
+
+def test_fingerprint_kept_by_first_source(anki_col, config_manager, target_deck_id,
+                                          verb_model):
+    """Test that a second source note for the same word leaves the fingerprint alone"""
+    source_notes = []
+    for tag in ['first', 'second']:
+        base_note = _add_source_note(anki_col, ["", '食べる', '食[た]べる', "", 'to eat'], [tag])
+        source_notes.append(base_note)
+
+    for _ in range(2):
+        deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+        for base_note in source_notes:
+            deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    # The first source note is skipped on the rerun, while the second is conjugated
+    # again but finds nothing to change
+    assert deck_updater.summary() == [0, 0, 0, 2]
+    note = anki_col.get_note(anki_col.find_notes(f'"deck:{TARGET_DECK}"')[0])
+    assert note['Fingerprint'].startswith(f'{source_notes[0].id}:')
+
+def test_linked_note_follows_source(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a note found by its text is linked to the source note, and that edits to
+    the source note are then carried over rather than creating another note"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+    starting_note = anki.notes.Note(anki_col, verb_model)
+    starting_note.fields[:3] = ['食べる', 'to eat', '食[た]べる']
+    anki_col.add_note(starting_note, target_deck_id)
+
+    DeckUpdater(anki_col, target_deck_id, verb_model, config_manager).add_note_to_deck(
+        base_note, VerbClass.ICHIDAN)
+    assert anki_col.get_note(starting_note.id)['SourceNoteId'] == str(base_note.id)
+
+    base_note['translation'] = 'to consume'
+    anki_col.update_note(base_note)
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    assert deck_updater.summary() == [0, 1, 0, 0]
+    assert anki_col.find_notes(f'"deck:{TARGET_DECK}"') == [starting_note.id]
+    assert anki_col.get_note(starting_note.id)['Meaning'] == 'to consume'
+
+    # Another source note with the previous meaning is a different word
+    other_note = _add_source_note(anki_col, ["Other Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+    deck_updater.add_note_to_deck(other_note, VerbClass.ICHIDAN)
+    assert deck_updater.summary() == [1, 1, 0, 0]
+
+def test_edited_link_ignored(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a note whose link was edited by hand is still updated by its text"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+    starting_note = anki.notes.Note(anki_col, verb_model)
+    starting_note.fields[:3] = ['食べる', 'to eat', '食[た]べる']
+    starting_note['SourceNoteId'] = 'edited'
+    anki_col.add_note(starting_note, target_deck_id)
+
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    assert deck_updater.summary() == [0, 1, 0, 0]
+    assert anki_col.get_note(starting_note.id)['SourceNoteId'] == 'edited'
+
+def test_held_note_found_by_link(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a note being held under its previous text is updated in place when its
+    source note is found by its link, rather than being loaded a second time"""
+    base_note = _add_source_note(anki_col, ["First Note", '食べる', '食[た]べる', "LHL", 'to eat'])
+    DeckUpdater(anki_col, target_deck_id, verb_model, config_manager).add_note_to_deck(
+        base_note, VerbClass.ICHIDAN)
+    note_id = anki_col.find_notes(f'"deck:{TARGET_DECK}"')[0]
+
+    base_note['translation'] = 'to consume'
+    anki_col.update_note(base_note)
+    # Another source note with the previous text is matched to the same note first
+    other_note = _add_source_note(anki_col, ["Other Note", '食べる', '食[た]べる', "LHL", 'to eat'],
+                                  ['other'])
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               batch_size=10)
+    deck_updater.add_note_to_deck(other_note, VerbClass.ICHIDAN)
+    deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    deck_updater.flush()
+
+    note = anki_col.get_note(note_id)
+    assert note['Meaning'] == 'to consume'
+    assert note.has_tag('other')
+
+reconcile_data = [
+    (False, False),
+    (False, True),
+    (True, False),
+]
+@pytest.mark.parametrize("delete, dry_run", reconcile_data)
+def test_reconcile(anki_col, config_manager, target_deck_id, verb_model, delete, dry_run): # pylint: disable=R0913,R0914,R0917
+    """Test which conjugation notes are considered orphans, and what is done with them"""
+    source_deck_id = anki_col.decks.id(SOURCE_DECK)
+    source_notes = {}
+    for name, expression, reading, meaning in [
+            ('deleted', '食べる', '食[た]べる', 'to eat'), ('untagged', '見る', '見[み]る', 'to see'),
+            ('moved', '寝る', '寝[ね]る', 'to sleep'), ('kept', '着る', '着[き]る', 'to wear'),
+            ('duplicate', '着る', '着[き]る', 'to wear')]:
+        base_note = _add_source_note(anki_col, [name, expression, reading, "", meaning])
+        source_notes[name] = base_note
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    for base_note in source_notes.values():
+        deck_updater.add_note_to_deck(base_note, VerbClass.ICHIDAN)
+    # The duplicate source note shares the note linked to the first one
+    target_ids = {name: anki_col.find_notes(f"SourceNoteId:{base_note.id}")[0]
+                  for name, base_note in source_notes.items() if name != 'duplicate'}
+
+    anki_col.remove_notes([source_notes['deleted'].id])
+    anki_col.set_deck(anki_col.find_cards(f"nid:{source_notes['moved'].id}"),
+                      anki_col.decks.id('elsewhere', create=True))
+    # The shared note stays, since it is still reached from the duplicate source note
+    found = [source_notes['moved'].id, source_notes['duplicate'].id]
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    deck_updater.add_note_to_deck(source_notes['duplicate'], VerbClass.ICHIDAN)
+    orphans = deck_updater.reconcile(source_deck_id, found, delete=delete, dry_run=dry_run)
+
+    assert orphans == sorted([target_ids['deleted'], target_ids['untagged']])
+    remaining = anki_col.find_notes(f'"deck:{TARGET_DECK}"')
+    tagged = anki_col.find_notes(f'"deck:{TARGET_DECK}" tag:orphaned-conjugation')
+    if dry_run:
+        assert len(remaining) == 4 and not tagged
+    elif delete:
+        assert sorted(remaining) == sorted([target_ids['moved'], target_ids['kept']])
+    else:
+        assert sorted(tagged) == orphans
+        # Updating an orphan again removes the tag
+        deck_updater.add_note_to_deck(source_notes['untagged'], VerbClass.GENERAL)
+        assert anki_col.find_notes(f'"deck:{TARGET_DECK}" tag:orphaned-conjugation') \
+            == [target_ids['deleted']]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_add_words(anki_col, config_manager, target_deck_id, verb_model, workers): # pylint: disable=R0914
+    """Test that adding many words, whether or not conjugating in worker processes, matches
+    adding the notes one at a time"""
+    note_ids = {VerbClass.ICHIDAN: [], VerbClass.GENERAL: []}
+    for expression, reading, meaning, verb_class in [
+            ('食べる', '食[た]べる', 'to eat', VerbClass.ICHIDAN),
+            ('見る', '見[み]る', 'to see', VerbClass.ICHIDAN),
+            ('行く', '行[い]く', 'to go', VerbClass.GENERAL),
+            ('帰る', '帰[かえ]る', 'to return', VerbClass.GENERAL),
+            ('寝る', '寝[ね]る', 'to sleep', VerbClass.ICHIDAN)]:
+        base_note = _add_source_note(anki_col, ["", expression, reading, "", meaning])
+        note_ids[verb_class].append(base_note.id)
+
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               batch_size=2)
+    progress = []
+    deck_updater.add_words(note_ids, workers, chunk_size=2,
+                           on_progress=lambda: progress.append(sum(deck_updater.summary())))
+    deck_updater.flush()
+    assert deck_updater.summary() == [5, 0, 0, 0]
+    # Two chunks of ichidan verbs, then one of general verbs
+    assert progress == [2, 3, 5]
+    field_map = anki_col.models.field_map(verb_model)
+    for verb_class, source_ids in note_ids.items():
+        for source_id in source_ids:
+            base_note = anki_col.get_note(source_id)
+            note = anki_col.get_note(anki_col.find_notes(f"SourceNoteId:{source_id}")[0])
+            ref_fields = _compose_ref_field_values(
+                field_map, base_note['exp'], base_note['translation'], base_note['rdng'],
+                generate_verb_forms(base_note['rdng'], verb_class))
+            assert all(ref is None or value == ref for value, ref in zip(note.fields, ref_fields))
+
+    # Nothing needs conjugating on a rerun
+    conjugator = Conjugator()
+    rerun_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                                conjugator)
+    rerun_updater.add_words(note_ids, workers)
+    assert rerun_updater.summary() == [0, 0, 0, 5]
+    assert conjugator.misses == 0
+
+def test_checkpoint_resume(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a resumed update passes over the source notes added before the
+    checkpoint, carrying on with its counts"""
+    note_ids = {VerbClass.ICHIDAN: []}
+    for expression, reading, meaning in [('食べる', '食[た]べる', 'to eat'),
+                                         ('見る', '見[み]る', 'to see'),
+                                         ('寝る', '寝[ね]る', 'to sleep'),
+                                         ('着る', '着[き]る', 'to wear')]:
+        base_note = _add_source_note(anki_col, ["", expression, reading, "", meaning])
+        note_ids[VerbClass.ICHIDAN].append(base_note.id)
+
+    checkpoints = []
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               batch_size=2, on_checkpoint=checkpoints.append)
+    deck_updater.add_words(note_ids, chunk_size=2)
+    deck_updater.flush()
+    assert deck_updater.summary() == [4, 0, 0, 0]
+    # The first chunk was written when the second chunk filled the batch
+    assert checkpoints[0]['last_note_ids'] == {'ichidan': note_ids[VerbClass.ICHIDAN][1]}
+    assert checkpoints[0]['changes'] == [2, 0, 0, 0]
+    assert checkpoints[-1]['last_note_ids'] == {'ichidan': note_ids[VerbClass.ICHIDAN][3]}
+
+    # Pretend that the update was interrupted after the first chunk
+    anki_col.remove_notes(anki_col.find_notes(
+        f'"deck:{TARGET_DECK}" (Expression:寝る OR Expression:着る)'))
+    conjugator = Conjugator()
+    resumed_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                                  conjugator)
+    assert resumed_updater.resume(checkpoints[0])
+    resumed_updater.add_words(note_ids)
+    resumed_updater.flush()
+    assert resumed_updater.summary() == [4, 0, 0, 0]
+    assert conjugator.misses == 2
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 4
+
+    other_deck_id = anki_col.decks.id('other', create=True)
+    other_updater = DeckUpdater(anki_col, other_deck_id, verb_model, config_manager)
+    assert not other_updater.resume(checkpoints[0])
+    assert other_updater.summary() == [0, 0, 0, 0]
+
+def test_resume_after_crash(anki_col, config_manager, target_deck_id, verb_model):
+    """Test that a resumed update writes every note which an interrupted update did not
+    get to commit"""
+    note_ids = {VerbClass.ICHIDAN: []}
+    for expression, reading, meaning in [('食べる', '食[た]べる', 'to eat'),
+                                         ('見る', '見[み]る', 'to see'),
+                                         ('寝る', '寝[ね]る', 'to sleep')]:
+        base_note = _add_source_note(anki_col, ["", expression, reading, "", meaning])
+        note_ids[VerbClass.ICHIDAN].append(base_note.id)
+    save_collection(anki_col)
+
+    def interrupt():
+        raise KeyboardInterrupt()
+
+    checkpoints = []
+    deck_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager,
+                               batch_size=2, on_checkpoint=checkpoints.append)
+    with pytest.raises(KeyboardInterrupt):
+        deck_updater.add_words(note_ids, chunk_size=2, on_progress=interrupt)
+    assert len(checkpoints) == 1
+    # Lose whatever was not committed, as if the process had been killed. Since Anki
+    # 23.10 every change is committed as it is made.
+    if hasattr(anki_col.db, 'rollback'):
+        anki_col.db.rollback()
+        anki_col.db.begin()
+
+    resumed_updater = DeckUpdater(anki_col, target_deck_id, verb_model, config_manager)
+    assert resumed_updater.resume(checkpoints[0])
+    resumed_updater.add_words(note_ids)
+    resumed_updater.flush()
+    assert len(anki_col.find_notes(f'"deck:{TARGET_DECK}"')) == 3
+
+def test_read_source_notes(anki_col):
+    """Test that source notes read in bulk match the notes loaded one at a time"""
+    note_ids = []
+    for fields, tags in [(["", '食べる', '食[た]べる', "", 'to eat'], ['verb', 'n5']),
+                         (["", '見る', '見[み]る', "", 'to see'], [])]:
+        base_note = _add_source_note(anki_col, fields, tags)
+        note_ids.append(base_note.id)
+
+    records = read_source_notes(anki_col, [note_ids[1], 12345, note_ids[0]])
+    assert [record.id for record in records] == [note_ids[1], note_ids[0]]
+    for record in records:
+        note = anki_col.get_note(record.id)
+        assert (record.mid, record.fields, record.tags) == (note.mid, note.fields, note.tags)
+    assert not read_source_notes(anki_col, [])
@@ -62,3 +62,20 @@ def test_gyo_dan(input_gyo: Gyo, refs: List[str]):
     assert input_gyo.dan(Dan.U) == refs[2]
     assert input_gyo.dan(Dan.E) == refs[3]
     assert input_gyo.dan(Dan.O) == refs[4]
+
+@pytest.mark.parametrize("input_str, ref", [
+    ("ア", AGyo), ("キ", KaGyo), ("グ", GaGyo), ("セ", SaGyo), ("ゾ", ZaGyo),
+    ("タ", TaGyo), ("ヂ", DaGyo), ("ヌ", NaGyo), ("ヘ", HaGyo), ("ボ", BaGyo),
+    ("パ", PaGyo), ("ミ", MaGyo), ("ル", RaGyo),
+    ("ぁ", AGyo), ("ぉ", AGyo), ("っ", TaGyo), ("ゕ", KaGyo),
+    ("ァ", AGyo), ("ッ", TaGyo), ("ヶ", KaGyo),
+    ("ゃ", None), ("ん", None), ("来", None), ("a", None),
+])
+def test_gyo_identification_other_kana(input_str: str, ref: Gyo):
+    """Test Gyo identification of katakana, small kana, and unsupported characters"""
+    assert Gyo.identify(input_str) == ref
+
+def test_gyo_identification_length():
+    """Test that Gyo identification only accepts a single character"""
+    with pytest.raises(ValueError):
+        Gyo.identify("かき")
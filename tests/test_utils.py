@@ -6,7 +6,15 @@ import japanese_conjugation.resources
 from japanese_conjugation.util import (
     remove_furigana,
     promote_furigana,
-    escape_query
+    parse_furigana,
+    FuriganaSegments,
+    FuriganaString,
+    escape_query,
+    batch_map,
+    batch_chunk_size,
+    pipeline_map,
+    peak_memory,
+    MIN_BATCH_CHUNK_SIZE
 )
 
 insert_ending_spans_text = importlib.resources.read_text(japanese_conjugation.resources, # pylint: disable=W4902
@@ -76,6 +84,75 @@ def test_promote_furigana(reading, ref):
     hyp = promote_furigana(reading)
     assert hyp == ref
 
+furigana_segments_data = [
+    ("", ()),
+    ("いる", (("いる", None),)),
+    ("来[く]る", (("来", "く"), ("る", None))),
+    ("持[も]って 来[く]る", (("持", "も"), ("って", None), ("来", "く"), ("る", None))),
+    ("お 久[ひさ]し", (("お", None), ("久", "ひさ"), ("し", None))),
+    # only the last annotation of a word applies, matching the Anki markup
+    ("食[た]べ物[もの]", (("食[た]べ物", "もの"),)),
+    ("来[]る", (("来[]る", None),)),
+]
+@pytest.mark.parametrize("reading, ref", furigana_segments_data)
+def test_furigana_segments(reading, ref):
+    """Test that readings are split into plain and annotated segments"""
+    segments = FuriganaSegments(reading)
+    assert segments.segments == ref
+    assert segments.base == remove_furigana(reading)
+    assert segments.kana == promote_furigana(reading)
+
+def test_furigana_segments_endswith():
+    """Test checking the ending of a reading without its markup"""
+    segments = parse_furigana("持[も]って 来[く]る")
+    assert segments.endswith("来る")
+    assert segments.endswith(("する", "来る"))
+    assert not segments.endswith("来[く]る")
+    assert segments.endswith("くる", kana=True)
+    assert parse_furigana("持[も]って 来[く]る") is segments
+
+@pytest.mark.parametrize("reading", [
+    "", "いる", "来[く]る", "持[も]って 来[く]る", "お 久[ひさ]し 振[ぶ]りです", " 来[く]る",
+    "食[た]べ物[もの]",
+])
+def test_furigana_string_round_trip(reading):
+    """Test that parsing and serializing markup reproduces it"""
+    furigana_string = FuriganaString.from_markup(reading)
+    assert str(furigana_string) == reading
+    assert furigana_string.base == remove_furigana(reading)
+    assert furigana_string.kana == promote_furigana(reading)
+
+furigana_string_edit_data = [
+    ("来[く]る", "来[こ]", "こ"),
+    ("来る", "来[こ]", "こ"),
+    ("連れて来る", "連れて 来[こ]", "連れてこ"),
+    ("持[も]って 来[く]る", "持[も]って 来[こ]", "持[も]ってこ"),
+    ("くる", "く[こ]", "こ"),
+]
+@pytest.mark.parametrize("reading, annotated, replaced", furigana_string_edit_data)
+def test_furigana_string_edits(reading, annotated, replaced):
+    """Test that edits are applied to the last unit of the text"""
+    stem = FuriganaString.from_markup(reading).drop_last()
+    assert str(stem.annotate_last('こ')) == annotated
+    assert str(stem.replace_last('こ')) == replaced
+    assert str(stem.append('られ')) == str(stem) + 'られ'
+
+def test_furigana_string_drop_last():
+    """Test that annotated text is dropped as a single unit"""
+    furigana_string = FuriganaString.from_markup("持[も]って 来[く]る")
+    assert str(furigana_string.drop_last(2)) == "持[も]って"
+    assert str(furigana_string.drop_last(4)) == "持[も]"
+    assert str(furigana_string.drop_last(10)) == ""
+    assert furigana_string.drop_last(0) == furigana_string
+
+def test_furigana_string_immutable():
+    """Test that a FuriganaString cannot be modified in place"""
+    furigana_string = FuriganaString.from_markup("来[く]る")
+    with pytest.raises(AttributeError):
+        furigana_string.segments = ()
+    assert str(furigana_string.append('よ')) == "来[く]るよ"
+    assert str(furigana_string) == "来[く]る"
+
 escape_query_data = [
     ("", ""),
     ("cat", "cat"),
@@ -91,3 +168,49 @@ def test_escape_query(raw_input, ref_output):
     """Test the escaping of query text"""
     output = escape_query(raw_input)
     assert output == ref_output
+
+def _add(left, right):
+    """Module-level (picklable) function for exercising batch_map"""
+    return left + right
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 3), (None, 1)])
+def test_batch_map(workers, chunk_size):
+    """Test that batched results come back in input order, with or without worker processes"""
+    args_list = [(index, index % 3) for index in range(20)] + [(0, 0), (5, 2)]
+    results = batch_map(_add, args_list, workers=workers, chunk_size=chunk_size)
+    assert results == [left + right for left, right in args_list]
+
+@pytest.mark.parametrize("workers, max_pending", [(1, None), (2, 1), (2, None)])
+def test_pipeline_map(workers, max_pending):
+    """Test that pipelined results come back in order, drawing chunks only as needed"""
+    drawn = []
+    def chunks():
+        for index in range(10):
+            drawn.append(index)
+            yield index, (index, 1)
+
+    consumed = []
+    for context, result in pipeline_map(_add, chunks(), workers, max_pending):
+        assert result == context + 1
+        consumed.append(context)
+        # Chunks are drawn no further ahead than the number that may be pending
+        assert len(drawn) - len(consumed) < (max_pending or 2 * workers)
+    assert consumed == list(range(10))
+
+def test_peak_memory():
+    """Test that the peak memory is reported in bytes where the platform supports it, for
+    both the current process and its finished workers"""
+    peak = peak_memory()
+    assert peak is None or peak > 2**20
+    assert list(pipeline_map(len, [(None, ('abc',))] * 4, 2)) == [(None, 3)] * 4
+    peak = peak_memory(children=True)
+    assert peak is None or peak > 2**20
+
+@pytest.mark.parametrize("item_count, workers, ref", [
+    (10, 4, MIN_BATCH_CHUNK_SIZE),
+    (MIN_BATCH_CHUNK_SIZE * 64, 4, MIN_BATCH_CHUNK_SIZE * 4),
+    (MIN_BATCH_CHUNK_SIZE * 64 + 1, 4, MIN_BATCH_CHUNK_SIZE * 4 + 1),
+])
+def test_batch_chunk_size(item_count, workers, ref):
+    """Test that chunks are sized to keep every worker busy without being too small"""
+    assert batch_chunk_size(item_count, workers) == ref
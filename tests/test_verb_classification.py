@@ -3,6 +3,7 @@ import pytest
 
 from japanese_conjugation.enums import VerbClass
 from japanese_conjugation.verbs import classify_verb
+from japanese_conjugation.verbs.exceptions import ExceptionIndex
 
 verb_classification_data = [
     ("たべる", VerbClass.ICHIDAN),
@@ -38,10 +39,28 @@ verb_classification_data = [
     ("おっしゃる", VerbClass.IRREGULAR),
     ("下[くだ]さる", VerbClass.IRREGULAR),
     ("くださる", VerbClass.IRREGULAR),
-    ("なさる", VerbClass.IRREGULAR)
+    ("なさる", VerbClass.IRREGULAR),
+    ("蹴[け]る", VerbClass.GODAN),
+    ("助[たす]ける", VerbClass.ICHIDAN),
+    ("ちぎる", VerbClass.GODAN),
+    ("引[ひ]き千切[ちぎ]る", VerbClass.GODAN),
+    ("噛[か]み千切[ちぎ]る", VerbClass.GODAN),
+    ("ほめちぎる", VerbClass.GODAN),
+    ("押[お]し迫[せま]る", VerbClass.GODAN),
 ]
 @pytest.mark.parametrize("reading, ref_class", verb_classification_data)
 def test_verb_classification(reading, ref_class):
     """Test that we correctly classify verbs"""
     hyp_class = classify_verb(reading)
     assert hyp_class == ref_class
+
+def test_exception_index():
+    """Test that only compound entries match at the end of a longer verb"""
+    index = ExceptionIndex(['蹴る', '迫る'], ['迫る'])
+    assert '蹴る' in index
+    assert '足蹴る' not in index
+    assert '迫る' in index
+    assert '差し迫る' in index
+    assert '辞職を迫る' in index
+    assert '迫' not in index
+    assert '' not in index
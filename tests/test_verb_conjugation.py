@@ -9,6 +9,8 @@ from japanese_conjugation.enums import (
 )
 from japanese_conjugation.verbs import (
     generate_verb_forms,
+    generate_verb_forms_batch,
+    iter_verb_forms,
     polite_nonpast_positive,
     polite_nonpast_negative,
     polite_past_positive,
@@ -929,3 +931,35 @@ def test_generate_verb_forms(dict_form, verb_class, reference):
     assert forms == reference
     general_forms = generate_verb_forms(dict_form, VerbClass.GENERAL)
     assert general_forms == reference
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 2)])
+def test_generate_verb_forms_batch(workers, chunk_size):
+    """test that the batch API matches generate_verb_forms() and preserves input order"""
+    readings_with_classes = [(dict_form, verb_class)
+                             for dict_form, verb_class, _ in generate_verb_forms_data]
+    forms = generate_verb_forms_batch(readings_with_classes, workers=workers,
+                                      chunk_size=chunk_size)
+    assert forms == [reference for _, _, reference in generate_verb_forms_data]
+
+iter_forms_data = [
+    ('食[た]べる', VerbClass.ICHIDAN),
+    ('行[い]く', VerbClass.GENERAL),
+    ('勉強[べんきょう]する', VerbClass.IRREGULAR),
+    ('です', VerbClass.GENERAL),
+]
+@pytest.mark.parametrize("dict_form, verb_class", iter_forms_data)
+def test_iter_verb_forms_subset(dict_form, verb_class):
+    """Test that only the requested forms are produced, in the usual order"""
+    forms = [(Formality.POLITE, Form.PAST), (None, Form.TE), (Formality.PLAIN, Form.TAI_PAST)]
+    expected = [c for c in generate_verb_forms(dict_form, verb_class)
+                if (c[2], c[1]) in forms]
+    assert list(iter_verb_forms(dict_form, verb_class, forms)) == expected
+    assert generate_verb_forms(dict_form, verb_class, forms) == expected
+    assert list(iter_verb_forms(dict_form, verb_class)) \
+        == generate_verb_forms(dict_form, verb_class)
+    assert not generate_verb_forms(dict_form, verb_class, [])
+
+def test_iter_verb_forms_lazy():
+    """Test that conjugations are produced on demand"""
+    conjugations = iter_verb_forms('食[た]べる', VerbClass.ICHIDAN)
+    assert next(conjugations) == generate_verb_forms('食[た]べる', VerbClass.ICHIDAN)[0]
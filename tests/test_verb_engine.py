@@ -0,0 +1,82 @@
+"""Unit tests for the compiled suffix-rewrite conjugation engine"""
+import pytest
+
+from japanese_conjugation.enums import Form, Formality, VerbClass
+from japanese_conjugation.util import ConjugationError
+from japanese_conjugation.verbs.engine import (
+    conjugate,
+    conjugate_by_function,
+    rewrite_key,
+    FORM_MASKS,
+    REWRITE_TABLE
+)
+
+engine_equivalence_data = [
+    '食[た]べる', '食べる', 'たべる', '借[か]りる', 'いる',
+    '行[い]く', '行く', 'いく', '持[も]って 行[い]く',
+    '読[よ]む', '買[か]う', '話[はな]す', '待[ま]つ', '死[し]ぬ', '遊[あそ]ぶ', '泳[およ]ぐ',
+    '帰[かえ]る', 'ある', '有[あ]る',
+    'する', '勉強[べんきょう]する', 'スポーツをする', '日本語[にほんご]を 話[はな]す',
+    '来[く]る', '来る', 'くる', '連[つ]れて 来[く]る', '連れて来る', 'つれてくる',
+    'いらっしゃる', 'おっしゃる', 'なさる', 'くださる', '下[くだ]さる', '下さる',
+    '揃[そろ]う', '扱[あつか]ふ', '〇ず', '学[まな]ぷ',
+]
+@pytest.mark.parametrize("verb_class", [VerbClass.ICHIDAN, VerbClass.GODAN, VerbClass.IRREGULAR])
+@pytest.mark.parametrize("dict_form", engine_equivalence_data)
+def test_engine_matches_form_functions(dict_form, verb_class):
+    """The rewrite table must produce exactly what the individual form functions produce,
+    including for verbs tagged with an unexpected class"""
+    if rewrite_key(dict_form, verb_class) not in REWRITE_TABLE:
+        # Only verbs with an irregular ending are conjugated as irregular verbs
+        with pytest.raises(ConjugationError):
+            conjugate(dict_form, verb_class)
+        with pytest.raises(ConjugationError):
+            conjugate_by_function(dict_form, verb_class)
+        return
+    assert conjugate(dict_form, verb_class) == conjugate_by_function(dict_form, verb_class)
+
+rewrite_key_data = [
+    ('食[た]べる', VerbClass.ICHIDAN, (VerbClass.ICHIDAN, 'る', False)),
+    ('勉強[べんきょう]する', VerbClass.IRREGULAR, (VerbClass.IRREGULAR, 'する', False)),
+    ('来る', VerbClass.IRREGULAR, (VerbClass.IRREGULAR, '来る', True)),
+    ('連れて来る', VerbClass.IRREGULAR, (VerbClass.IRREGULAR, '来る', False)),
+    ('下[くだ]さる', VerbClass.IRREGULAR, (VerbClass.IRREGULAR, '下[くだ]さる', True)),
+    ('持[も]って 行[い]く', VerbClass.GODAN, (VerbClass.GODAN, '行[い]く', False)),
+]
+@pytest.mark.parametrize("dict_form, verb_class, reference", rewrite_key_data)
+def test_rewrite_key(dict_form, verb_class, reference):
+    """Test that verbs are keyed on their most specific ending"""
+    assert rewrite_key(dict_form, verb_class) == reference
+    assert reference in REWRITE_TABLE
+
+form_mask_data = [
+    ('食[た]べる', VerbClass.ICHIDAN, []),
+    ('来[く]る', VerbClass.IRREGULAR, []),
+    ('扱[あつか]ふ', VerbClass.GODAN, [(None, Form.TE), (Formality.PLAIN, Form.PAST)]),
+]
+@pytest.mark.parametrize("dict_form, verb_class, inapplicable", form_mask_data)
+def test_form_masks(dict_form, verb_class, inapplicable):
+    """Forms which the verb's class and ending rule out are skipped rather than raised"""
+    mask = FORM_MASKS[rewrite_key(dict_form, verb_class)]
+    for combo in inapplicable:
+        assert combo not in mask
+    produced = {(formality, form) for _, form, formality in conjugate(dict_form, verb_class)}
+    assert produced == mask
+
+@pytest.mark.parametrize("dict_form", ['食[た]べる', '買[か]う', '連[つ]れて 来[く]た',
+                                       'ある', '行く', '食ある'])
+def test_irregular_without_irregular_ending(dict_form):
+    """A verb tagged as irregular without an irregular ending is reported rather than
+    conjugated in part"""
+    assert rewrite_key(dict_form, VerbClass.IRREGULAR) not in FORM_MASKS
+    with pytest.raises(ConjugationError):
+        list(conjugate(dict_form, VerbClass.IRREGULAR))
+
+def test_unexpected_failure_reported():
+    """A form which ought to apply but fails is reported along with the reading"""
+    with pytest.raises(ConjugationError) as err:
+        conjugate_by_function('買[か]わ', VerbClass.IRREGULAR)
+    assert err.value.reading == '買[か]わ'
+    assert err.value.form == Form.NON_PAST
+    assert err.value.formality == Formality.POLITE
+    assert '買[か]わ' in str(err.value)
@@ -0,0 +1,61 @@
+"""Unit tests for the per-verb analysis shared by the form functions"""
+import pytest
+
+from japanese_conjugation.enums import IrregularKind, VerbClass
+from japanese_conjugation.verbs.profile import VerbProfile
+from japanese_conjugation.verbs.engine import FORM_FUNCTIONS
+from japanese_conjugation.verbs.tai import tai_forms
+
+profile_data = [
+    ('食[た]べる', VerbClass.ICHIDAN, None, 'る', '食[た]べ'),
+    ('勉強[べんきょう]する', VerbClass.IRREGULAR, IrregularKind.SURU, 'する', '勉強[べんきょう]'),
+    ('来[く]る', VerbClass.IRREGULAR, IrregularKind.KURU, '来[く]る', ''),
+    ('来る', VerbClass.IRREGULAR, IrregularKind.KURU, '来る', ''),
+    ('連れて来る', VerbClass.IRREGULAR, IrregularKind.KURU, '来る', '連れて'),
+    ('くださる', VerbClass.IRREGULAR, IrregularKind.HONORIFIC, 'くださる', ''),
+    ('有[あ]る', VerbClass.GODAN, None, 'る', '有[あ]'),
+    ('ある', VerbClass.GODAN, IrregularKind.ARU, 'ある', ''),
+    ('持[も]って 行[い]く', VerbClass.GODAN, IrregularKind.IKU, '行[い]く', '持[も]って '),
+]
+@pytest.mark.parametrize("dict_form, verb_class, kind, ending, prefix", profile_data)
+def test_verb_profile(dict_form, verb_class, kind, ending, prefix):
+    """Test that the irregular ending and the text preceding it are identified"""
+    profile = VerbProfile(dict_form, verb_class)
+    assert profile.kind == kind
+    assert profile.ending == ending
+    assert profile.prefix == prefix
+
+stem_data = [
+    ('食[た]べる', VerbClass.ICHIDAN, '食[た]べ', '食[た]べ', '食[た]べられ', '食[た]べられ'),
+    ('買[か]う', VerbClass.GODAN, '買[か]い', '買[か]わ', '買[か]え', '買[か]われ'),
+    ('する', VerbClass.IRREGULAR, 'し', 'し', 'でき', 'され'),
+    ('連れて来る', VerbClass.IRREGULAR, '連れて 来[き]', '連れて 来[こ]',
+     '連れて 来[こ]られ', '連れて 来[こ]られ'),
+    ('いらっしゃる', VerbClass.IRREGULAR, 'いらっしゃい', 'いらっしゃら',
+     'いらっしゃれ', 'いらっしゃられ'),
+    ('ある', VerbClass.GODAN, 'あり', '', 'あれ', 'あられ'),
+]
+@pytest.mark.parametrize("dict_form, verb_class, masu, negative, potential, passive", stem_data)
+def test_verb_profile_stems(dict_form, verb_class, masu, negative, potential, passive): # pylint: disable=R0913,R0917
+    """Test the stems derived from the analysis"""
+    profile = VerbProfile(dict_form, verb_class)
+    assert profile.masu_stem == masu
+    assert profile.negative_stem == negative
+    assert profile.potential_stem == potential
+    assert profile.passive_stem == passive
+
+@pytest.mark.parametrize("dict_form, verb_class", [(d[0], d[1]) for d in profile_data])
+def test_shared_profile(dict_form, verb_class):
+    """Test that sharing one profile between the form functions changes nothing"""
+    profile = VerbProfile(dict_form, verb_class)
+    for conjugate_form, _, _ in FORM_FUNCTIONS:
+        assert conjugate_form(dict_form, verb_class, profile) \
+            == conjugate_form(dict_form, verb_class)
+    assert tai_forms(dict_form, verb_class, profile) == tai_forms(dict_form, verb_class)
+
+def test_unknown_stem():
+    """Test that a stem which cannot be formed only fails when requested"""
+    profile = VerbProfile('買[か]う', VerbClass.IRREGULAR)
+    assert profile.passive_stem == '買[か]われ'
+    with pytest.raises(AssertionError):
+        _ = profile.masu_stem